@@ -0,0 +1,69 @@
+"""Benchmark of the post-processing of a Field snapshot after it is read from file.
+
+Compares the fused, single-pass `Field._rescale_and_set_minmax` (NaN to zero, scaling, vmin/vmax masking)
+with the multi-pass implementation it replaced. The default snapshot is 75 x 3000 x 4000 float32 values
+(3.6 GB), so this needs about 8 GB of memory; use --shape for a smaller snapshot.
+
+Usage: python benchmarks/benchmark_field_load.py [--shape ZDIM YDIM XDIM] [--repeat N]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from parcels import Field
+
+
+def multipass(field, data):
+    """The implementation of Field._rescale_and_set_minmax before it was fused into a single pass."""
+    data[np.isnan(data)] = 0
+    if field._scaling_factor:
+        data *= field._scaling_factor
+    if field.vmin is not None:
+        data[data < field.vmin] = 0
+    if field.vmax is not None:
+        data[data > field.vmax] = 0
+    return data
+
+
+def timeit(func, data, repeat):
+    """Return the best time of func(snapshot) over repeat runs, each on a fresh copy of data."""
+    best = np.inf
+    for _ in range(repeat):
+        snapshot = data.copy()
+        tic = time.perf_counter()
+        func(snapshot)
+        best = min(best, time.perf_counter() - tic)
+        del snapshot
+    return best
+
+
+def main(args=None):
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--shape", type=int, nargs=3, default=[75, 3000, 4000], help="ZDIM YDIM XDIM of the snapshot")
+    p.add_argument("--repeat", type=int, default=3, help="number of timed runs per implementation")
+    args = p.parse_args(args)
+
+    zdim, ydim, xdim = args.shape
+    field = Field("P", np.zeros((1, 2, 2), dtype=np.float32), lon=np.arange(2), lat=np.arange(2), vmin=-2, vmax=2)
+    field.set_scaling_factor(0.01)
+
+    data = np.empty((zdim, ydim, xdim), dtype=np.float32)
+    rng = np.random.default_rng(0)
+    for k in range(zdim):
+        data[k] = rng.normal(scale=100, size=(ydim, xdim))
+    data[:, : ydim // 10, :] = np.nan  # "land"
+    print(f"snapshot of {zdim} x {ydim} x {xdim} float32 values ({data.nbytes / 1e9:.2f} GB)")
+
+    results = {
+        "multi-pass": timeit(lambda snapshot: multipass(field, snapshot), data, args.repeat),
+        "fused": timeit(field._rescale_and_set_minmax, data, args.repeat),
+    }
+    for name, seconds in results.items():
+        print(f"{name:>12}: {seconds:8.3f} s  ({data.nbytes / seconds / 1e9:6.2f} GB/s)")
+    print(f"     speedup: {results['multi-pass'] / results['fused']:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
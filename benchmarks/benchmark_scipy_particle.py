@@ -0,0 +1,86 @@
+"""Benchmark of the particle objects over which Scipy kernels are executed.
+
+Compares the `ParticleDataProxy` (with slots for the Variables of the particle) with the `ParticleDataAccessor`
+it replaced in `Kernel.execute_python`, both for reading and writing the Variables that AdvectionRK4 uses and
+for a full AdvectionRK4 execution on a steady, rectilinear flow.
+
+Usage: python benchmarks/benchmark_scipy_particle.py [--npart N] [--nsteps N] [--repeat N]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from parcels import AdvectionRK4, FieldSet, ParticleSet, ScipyParticle, StatusCode
+from parcels.particledata import ParticleDataAccessor
+
+
+def create_pset(npart):
+    """Return a ParticleSet of npart ScipyParticles in a uniform eastward flow."""
+    lon = np.linspace(0, 1e4, 50, dtype=np.float32)
+    lat = np.linspace(0, 1e4, 50, dtype=np.float32)
+    data = {"U": np.ones((lat.size, lon.size), dtype=np.float32), "V": np.zeros((lat.size, lon.size), dtype=np.float32)}
+    fieldset = FieldSet.from_data(data, {"lon": lon, "lat": lat}, mesh="flat")
+    return ParticleSet(
+        fieldset, pclass=ScipyParticle, lon=np.linspace(100, 200, npart), lat=np.linspace(100, 9e3, npart)
+    )
+
+
+def accessor_class(pset):
+    """Return a factory of ParticleDataAccessors with the signature of a ParticleDataProxy class."""
+    return lambda index: ParticleDataAccessor(pset.particledata, index)
+
+
+def time_access(particle_class, pset, repeat):
+    """Return the best time in ns per particle of reading and writing its position four times (as in AdvectionRK4)."""
+    best = np.inf
+    for _ in range(repeat):
+        tic = time.perf_counter()
+        for i in range(len(pset)):
+            p = particle_class(i)
+            for _ in range(4):
+                p.lon_nextloop = p.lon + p.dt
+                p.lat_nextloop = p.lat + p.dt
+        best = min(best, time.perf_counter() - tic)
+    return best / len(pset) * 1e9
+
+
+def time_advection(particle_class, pset, kernel, nsteps, repeat):
+    """Return the best time in ns per particle-step of AdvectionRK4 over nsteps steps of dt=1."""
+    best = np.inf
+    for _ in range(repeat):
+        start = pset.particledata.data["time_nextloop"][0]
+        tic = time.perf_counter()
+        pset.particledata.data["state"][:] = StatusCode.Evaluate
+        particle = particle_class(pset)
+        for i in range(len(pset)):
+            kernel.evaluate_particle(particle(i), start + nsteps)
+        best = min(best, time.perf_counter() - tic)
+    return best / (len(pset) * nsteps) * 1e9
+
+
+def main(args=None):
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--npart", type=int, default=1000, help="number of particles")
+    p.add_argument("--nsteps", type=int, default=10, help="number of timesteps per execution")
+    p.add_argument("--repeat", type=int, default=3, help="number of timed runs per implementation")
+    args = p.parse_args(args)
+
+    pset = create_pset(args.npart)
+    pset.execute(AdvectionRK4, runtime=1, dt=1, verbose_progress=False)  # compiles the kernel and loads the Fields
+    kernel = pset._kernel
+    classes = {"accessor": accessor_class, "proxy": lambda pset: pset.particledata._proxy_class()}
+
+    print(f"{args.npart} particles, {args.nsteps} steps of AdvectionRK4")
+    access, advection = {}, {}
+    for name, particle_class in classes.items():
+        access[name] = time_access(particle_class(pset), pset, args.repeat)
+        advection[name] = time_advection(particle_class, pset, kernel, args.nsteps, args.repeat)
+        print(f"{name:>9}: {access[name]:8.0f} ns access per particle, {advection[name]:8.0f} ns per particle-step")
+    print(f"  speedup: {access['accessor'] / access['proxy']:8.2f}x access, ", end="")
+    print(f"{advection['accessor'] / advection['proxy']:.2f}x per particle-step")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+"""Benchmark of the vertical index search on s-grids (RectilinearSGrid and CurvilinearSGrid).
+
+Compares the bisection of `search_indices_vertical_s` (JIT) and `Field._search_indices_vertical_s` (Scipy) with the
+linear scans over the full interpolated depth column that they replaced, on a stretched s-grid of --zdim levels.
+The JIT searches are timed in a small C library that includes `index_search.h`, both from the first level (as for a
+new particle) and from the level found before (as for a particle that stays in its level).
+
+Usage: python benchmarks/benchmark_sgrid_search.py [--zdim N] [--npoints N] [--repeat N]
+"""
+
+import argparse
+import ctypes
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from parcels import CurvilinearSGrid, Field, RectilinearSGrid
+from parcels.compilation.codecompiler import GNUCompiler
+from parcels.tools.global_statics import get_package_dir
+
+C_SOURCE = """
+#include <stdbool.h>
+#include <float.h>
+#include "index_search.h"
+
+/* the linear search of search_indices_vertical_s before the bisection (for depth arrays without time) */
+static inline StatusCode linear_search_indices_vertical_s(type_coord z, int xdim, int ydim, int zdim, float *zvals,
+                                                          int xi, int yi, int *zi, double xsi, double eta,
+                                                          double *zeta)
+{
+  float zcol[zdim];
+  int zii;
+  float (*zvalstab)[ydim][xdim] = (float (*)[ydim][xdim]) zvals;
+  for (zii=0; zii < zdim; zii++){
+    zcol[zii] = (1-xsi)*(1-eta) * zvalstab[zii][yi  ][xi  ]
+              + (  xsi)*(1-eta) * zvalstab[zii][yi  ][xi+1]
+              + (  xsi)*(  eta) * zvalstab[zii][yi+1][xi+1]
+              + (1-xsi)*(  eta) * zvalstab[zii][yi+1][xi  ];
+  }
+  if (zcol[zdim-1] > zcol[0]){
+    if (z < zcol[0]) {return ERRORTHROUGHSURFACE;}
+    if (z > zcol[zdim-1]) {return ERROROUTOFBOUNDS;}
+    while (*zi < zdim-1 && z > zcol[*zi+1]) ++(*zi);
+    while (*zi > 0 && z < zcol[*zi]) --(*zi);
+  }
+  else{
+    if (z > zcol[0]) {return ERRORTHROUGHSURFACE;}
+    if (z < zcol[zdim-1]) {return ERROROUTOFBOUNDS;}
+    while (*zi < zdim-1 && z < zcol[*zi+1]) ++(*zi);
+    while (*zi > 0 && z > zcol[*zi]) --(*zi);
+  }
+  if (*zi == zdim-1) {--*zi;}
+  *zeta = (z - zcol[*zi]) / (zcol[*zi+1] - zcol[*zi]);
+  return SUCCESS;
+}
+
+int search_points(int bisection, int n, float *z, int *xi, int *yi, double *xsi, double *eta, int *zi, double *zeta,
+                  int xdim, int ydim, int zdim, float *zvals)
+{
+  int i, nerrors = 0;
+  for (i=0; i < n; i++){
+    StatusCode status;
+    if (bisection)
+      status = search_indices_vertical_s(z[i], xdim, ydim, zdim, zvals, xi[i], yi[i], &zi[i], xsi[i], eta[i],
+                                         &zeta[i], 0, 0, 1, 0, 0, 1, LINEAR);
+    else
+      status = linear_search_indices_vertical_s(z[i], xdim, ydim, zdim, zvals, xi[i], yi[i], &zi[i], xsi[i], eta[i],
+                                                &zeta[i]);
+    nerrors += (status != SUCCESS);
+  }
+  return nerrors;
+}
+"""
+
+
+def linear_search_indices_vertical_s(field, x, y, z, xi, yi, xsi, eta, ti, time):
+    """The Scipy vertical search on s-grids before the bisection (for depth arrays without time)."""
+    grid = field.grid
+    depth_vector = (
+        (1 - xsi) * (1 - eta) * grid.depth[:, yi, xi]
+        + xsi * (1 - eta) * grid.depth[:, yi, xi + 1]
+        + xsi * eta * grid.depth[:, yi + 1, xi + 1]
+        + (1 - xsi) * eta * grid.depth[:, yi + 1, xi]
+    )
+    z = np.float32(z)
+    if depth_vector[-1] > depth_vector[0]:
+        depth_indices = depth_vector <= z
+        if z >= depth_vector[-1]:
+            zi = len(depth_vector) - 2
+        else:
+            zi = depth_indices.argmin() - 1 if z >= depth_vector[0] else 0
+    else:
+        depth_indices = depth_vector >= z
+        if z <= depth_vector[-1]:
+            zi = len(depth_vector) - 2
+        else:
+            zi = depth_indices.argmin() - 1 if z <= depth_vector[0] else 0
+    zeta = (z - depth_vector[zi]) / (depth_vector[zi + 1] - depth_vector[zi])
+    return (zi, zeta)
+
+
+def create_field(gridtype, zdim):
+    """Return a Field on a stretched s-grid of zdim levels, over a bathymetry deepening from 100 m to 200 m."""
+    lon = np.linspace(0, 1e4, 11, dtype=np.float32)
+    lat = np.linspace(0, 1000, 11, dtype=np.float32)
+    s_levels = np.linspace(0, 1, zdim) ** 2
+    depth = (s_levels[:, None, None] * (lon[None, None, :] / 100.0 + 100)).repeat(lat.size, axis=1)
+    depth = depth.astype(np.float32)
+    if gridtype == "rectilinear":
+        grid = RectilinearSGrid(lon, lat, depth=depth, mesh="flat")
+    else:
+        lon2d, lat2d = np.meshgrid(lon, lat)
+        grid = CurvilinearSGrid(lon2d, lat2d, depth=depth, mesh="flat")
+    return Field("T", np.zeros(depth.shape, dtype=np.float32), grid=grid)
+
+
+def create_points(field, npoints, seed=1234):
+    """Return random points in the field, with the indices and relative coordinates of their horizontal cells."""
+    rng = np.random.default_rng(seed)
+    x = rng.uniform(0, 1e4, npoints)
+    y = rng.uniform(0, 1000, npoints)
+    z = (x / 100.0 + 100) * rng.uniform(0.001, 0.999, npoints)
+    cells = [field._search_indices(x[i], y[i], z[i], search2D=True) for i in range(npoints)]
+    xsi, eta, _, xi, yi, _ = (np.array(values) for values in zip(*cells, strict=True))
+    return {"x": x, "y": y, "z": z, "xi": xi, "yi": yi, "xsi": xsi, "eta": eta}
+
+
+def compile_library(tmp_dir):
+    """Compile C_SOURCE against the parcels headers and return the loaded library."""
+    src = os.path.join(tmp_dir, "sgrid_search.c")
+    lib = os.path.join(tmp_dir, "sgrid_search.so")
+    with open(src, "w") as f:
+        f.write(C_SOURCE)
+    compiler = GNUCompiler(incdirs=[os.path.join(get_package_dir(), "include")])
+    compiler.compile(src, lib, os.path.join(tmp_dir, "sgrid_search.log"))
+    return ctypes.CDLL(lib)
+
+
+def time_jit(library, bisection, field, points, warm, repeat):
+    """Return the best time in ns per point of the C search, and the levels found (from zi=0 or the levels found)."""
+    grid = field.grid
+    zvals = np.ascontiguousarray(grid.depth, dtype=np.float32)
+    args = [
+        np.ascontiguousarray(points[name], dtype=dtype)
+        for name, dtype in (
+            ("z", np.float32),
+            ("xi", np.int32),
+            ("yi", np.int32),
+            ("xsi", np.float64),
+            ("eta", np.float64),
+        )
+    ]
+    npoints = len(points["z"])
+    zeta = np.zeros(npoints, dtype=np.float64)
+    zi = np.zeros(npoints, dtype=np.int32)
+    if warm:
+        library.search_points(
+            int(bisection),
+            npoints,
+            *(a.ctypes for a in args),
+            zi.ctypes,
+            zeta.ctypes,
+            grid.xdim,
+            grid.ydim,
+            grid.zdim,
+            zvals.ctypes,
+        )
+    start_zi = zi.copy()
+    best = np.inf
+    for _ in range(repeat):
+        zi[:] = start_zi
+        tic = time.perf_counter()
+        nerrors = library.search_points(
+            int(bisection),
+            npoints,
+            *(a.ctypes for a in args),
+            zi.ctypes,
+            zeta.ctypes,
+            grid.xdim,
+            grid.ydim,
+            grid.zdim,
+            zvals.ctypes,
+        )
+        best = min(best, time.perf_counter() - tic)
+    assert nerrors == 0
+    return best / npoints * 1e9, zi + zeta
+
+
+def time_scipy(search, field, points, repeat):
+    """Return the best time in ns per point of the Scipy search, and the levels found."""
+    npoints = len(points["z"])
+    best = np.inf
+    for _ in range(repeat):
+        levels = np.empty(npoints)
+        tic = time.perf_counter()
+        for i in range(npoints):
+            zi, zeta = search(
+                field,
+                points["x"][i],
+                points["y"][i],
+                points["z"][i],
+                points["xi"][i],
+                points["yi"][i],
+                points["xsi"][i],
+                points["eta"][i],
+                0,
+                0,
+            )
+            levels[i] = zi + zeta
+        best = min(best, time.perf_counter() - tic)
+    return best / npoints * 1e9, levels
+
+
+def main(args=None):
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--zdim", type=int, default=75, help="number of s-levels")
+    p.add_argument("--npoints", type=int, default=10000, help="number of random points searched")
+    p.add_argument("--repeat", type=int, default=3, help="number of timed runs per implementation")
+    args = p.parse_args(args)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        library = compile_library(tmp_dir)
+        print(f"{args.npoints} points on {args.zdim} s-levels")
+        for gridtype in ["rectilinear", "curvilinear"]:
+            field = create_field(gridtype, args.zdim)
+            points = create_points(field, args.npoints)
+            print(f"{gridtype} s-grid")
+            for warm in [False, True]:
+                linear, linear_levels = time_jit(library, False, field, points, warm, args.repeat)
+                bisection, bisection_levels = time_jit(library, True, field, points, warm, args.repeat)
+                assert np.allclose(linear_levels, bisection_levels, atol=1e-4)
+                start = "previous level" if warm else "first level"
+                print(
+                    f"  JIT from {start:>14}: {linear:8.1f} ns linear, {bisection:8.1f} ns bisection per point, ",
+                    end="",
+                )
+                print(f"speedup {linear / bisection:.2f}x")
+            linear, linear_levels = time_scipy(linear_search_indices_vertical_s, field, points, args.repeat)
+            bisection, bisection_levels = time_scipy(Field._search_indices_vertical_s, field, points, args.repeat)
+            assert np.allclose(linear_levels, bisection_levels, atol=1e-4)
+            print(f"  Scipy{'':>20}: {linear:8.0f} ns linear, {bisection:8.0f} ns bisection per point, ", end="")
+            print(f"speedup {linear / bisection:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
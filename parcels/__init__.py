@@ -4,6 +4,7 @@ __version__ = version
 
 import parcels.rng as ParcelsRandom  # noqa
 from parcels.application_kernels import *
+from parcels.ensemble import *
 from parcels.field import *
 from parcels.fieldset import *
 from parcels.grid import *
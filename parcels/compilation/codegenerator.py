@@ -222,6 +222,8 @@ class IntrinsicTransformer(ast.NodeTransformer):
         self.tmp_vars = []
         # A stack of additional statements to be inserted
         self.stmt_stack = []
+        # Whether the kernel uses the random number generator (shared by all particles)
+        self.draws_random = False
 
     def get_tmp(self):
         """Create a new temporary variable name."""
@@ -242,6 +244,7 @@ class IntrinsicTransformer(ast.NodeTransformer):
             node = MathNode(math, ccode="")
         elif node.id in ["ParcelsRandom", "rng"]:
             node = RandomNode(math, ccode="")
+            self.draws_random = True
         elif node.id == "print":
             node = PrintNode()
         elif (node.id == "pnum") or ("parcels_tmpvar" in node.id):
@@ -423,11 +426,13 @@ class KernelGenerator(ABC, ast.NodeVisitor):
         self.field_args = collections.OrderedDict()
         self.vector_field_args = collections.OrderedDict()
         self.const_args = collections.OrderedDict()
+        self.draws_random = False
 
     def generate(self, py_ast, funcvars: list[str]):
         # Replace occurrences of intrinsic objects in Python AST
         transformer = IntrinsicTransformer(self.fieldset, self.ptype)
         py_ast = transformer.visit(py_ast)
+        self.draws_random = transformer.draws_random
 
         # Untangle Pythonic tuple-assignment statements
         py_ast = TupleSplitter().visit(py_ast)
@@ -968,6 +973,7 @@ class LoopGenerator:
         # Generate outer loop for repeated kernel invocation
         args = [
             c.Value("int", "num_particles"),
+            c.Pointer(c.Value("int", "pindices")),  # indices of the particles to loop over, or NULL for all
             c.Pointer(c.Value(pname, "particles")),
             c.Value("double", "endtime"),
             c.Value("double", "dt"),
@@ -1019,9 +1025,11 @@ class LoopGenerator:
         ]
 
         time_loop = c.While("(particles->state[pnum] == EVALUATE || particles->state[pnum] == REPEAT)", c.Block(body))
-        part_loop = c.For("pnum = 0", "pnum < num_particles", "++pnum", c.Block([time_loop]))
+        pnum = c.Assign("pnum", "pindices == NULL ? pindex : pindices[pindex]")
+        part_loop = c.For("pindex = 0", "pindex < num_particles", "++pindex", c.Block([pnum, time_loop]))
         fbody = c.Block(
             [
+                c.Value("int", "pindex"),
                 c.Value("int", "pnum"),
                 c.Value("double", "sign_dt"),
                 sign_dt,
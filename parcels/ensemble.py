@@ -0,0 +1,131 @@
+from datetime import timedelta
+
+import numpy as np
+
+from parcels.application_kernels.advection import AdvectionRK4
+
+__all__ = ["ParticleSetEnsemble"]
+
+
+class ParticleSetEnsemble:
+    """Ensemble of ParticleSets on one FieldSet, which are executed in lockstep.
+
+    The members of an ensemble (e.g. with different random seeds or diffusivities) are advanced together
+    through their time loops, such that each snapshot of the Fields is loaded once for all members, instead
+    of once per member. The kernel is compiled once for all members with the same particle variables.
+
+    Parameters
+    ----------
+    psets : list of :class:`parcels.particleset.ParticleSet`
+        Members of the ensemble, which must all be defined on the same FieldSet.
+    """
+
+    def __init__(self, psets):
+        self._psets = list(psets)
+        if len(self._psets) == 0:
+            raise ValueError("An ensemble needs at least one ParticleSet")
+        if any(pset.fieldset is not self._psets[0].fieldset for pset in self._psets):
+            raise ValueError("All ParticleSets of an ensemble must be defined on the same FieldSet")
+
+    def __len__(self):
+        return len(self._psets)
+
+    def __getitem__(self, index):
+        return self._psets[index]
+
+    def __iter__(self):
+        return iter(self._psets)
+
+    @property
+    def psets(self):
+        return self._psets
+
+    @staticmethod
+    def _kernel_key(pset):
+        """Key of the particle variables of pset, for which a compiled kernel can be shared."""
+        ptype = pset.particledata.ptype
+        return ptype.uses_jit, tuple((v.name, np.dtype(v.dtype).str) for v in ptype.variables)
+
+    def execute(
+        self,
+        pyfunc=AdvectionRK4,
+        endtime=None,
+        runtime=None,
+        dt=1.0,
+        output_files=None,
+        delete_cfiles=True,
+        nthreads=None,
+    ):
+        """Execute a kernel over all members of the ensemble (see :meth:`parcels.particleset.ParticleSet.execute`).
+
+        The members are advanced in order of their time, and no member loads a new snapshot of the Fields
+        before all other members have reached the time of that snapshot.
+
+        Parameters
+        ----------
+        pyfunc :
+            Kernel function to execute, as in :meth:`parcels.particleset.ParticleSet.execute`.
+            (Default value = AdvectionRK4)
+        endtime :
+            End time for the timestepping loop. (Default value = None)
+        runtime :
+            Length of the timestepping loop, from the start time of each member. Use instead of endtime.
+            (Default value = None)
+        dt :
+            Timestep interval (in seconds) to be passed to the kernel. (Default value = 1 second)
+        output_files : list of :class:`parcels.particlefile.ParticleFile`
+            Optional, output file of each member (or None for members without output). The index of the member
+            is added to the metadata of its output as ``ensemble_member``. (Default value = None)
+        delete_cfiles : bool
+            Whether to delete the C-files after compilation in JIT mode (default is True)
+        nthreads : int
+            Optional, number of threads for the execution of a JIT kernel over each member (Default value = None)
+
+        Notes
+        -----
+        A particle that stops all execution only stops the execution of its own member.
+        """
+        if output_files is None:
+            output_files = [None] * len(self)
+        if len(output_files) != len(self):
+            raise ValueError(f"output_files has {len(output_files)} entries for an ensemble of {len(self)} members")
+        sign_dt = np.sign(dt.total_seconds() if isinstance(dt, timedelta) else dt)
+
+        kernels = {}
+        steps, times = {}, {}
+        for member, (pset, output_file) in enumerate(zip(self._psets, output_files, strict=True)):
+            key = self._kernel_key(pset)
+            if key in kernels:  # the kernel is not compiled again if it is the kernel of the ParticleSet
+                pset._kernel = kernels[key]
+            if output_file:
+                output_file.add_metadata("ensemble_member", member)
+            steps[member] = pset._execute_steps(
+                pyfunc=kernels.get(key, pyfunc),
+                pyfunc_inter=None,
+                endtime=endtime,
+                runtime=runtime,
+                dt=dt,
+                output_file=output_file,
+                verbose_progress=False,
+                postIterationCallbacks=None,
+                callbackdt=None,
+                delete_cfiles=delete_cfiles,
+                rebalance_every=None,
+                rebalance_by_time=False,
+                nprocesses=None,
+                nthreads=nthreads,
+                events=None,
+            )
+            try:
+                times[member] = next(steps[member])
+            except StopIteration:  # an empty ParticleSet, which is not executed
+                del steps[member]
+                continue
+            kernels.setdefault(key, pset._kernel)
+
+        while steps:
+            member = min(steps, key=lambda m: sign_dt * times[m])
+            try:
+                times[member] = next(steps[member])
+            except StopIteration:
+                del steps[member]
@@ -1,17 +1,20 @@
 import collections
 import datetime
 import math
+import os
 import warnings
 from collections.abc import Iterable
-from ctypes import POINTER, Structure, c_float, c_int, pointer
+from ctypes import POINTER, Structure, c_double, c_float, c_int, pointer
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import dask
 import dask.array as da
 import numpy as np
 import xarray as xr
 
 import parcels.tools.interpolation_utils as i_u
+from parcels._compat import MPI
 from parcels._typing import (
     GridIndexingType,
     InterpMethod,
@@ -42,7 +45,12 @@ from .fieldfilebuffer import (
     DaskFileBuffer,
     DeferredDaskFileBuffer,
     DeferredNetcdfFileBuffer,
+    DeferredZarrFileBuffer,
     NetcdfFileBuffer,
+    ZarrFileBuffer,
+    _close_pooled_datasets,
+    _DatasetLease,
+    _read_time_axes,
 )
 from .grid import CGrid, Grid, GridType
 
@@ -53,6 +61,39 @@ if TYPE_CHECKING:
 
 __all__ = ["Field", "VectorField", "NestedField"]
 
+_RESCALE_BUFFERSIZE = 1 << 16  # number of values that Field._rescale_and_set_minmax processes at once
+
+# Storage types of Field data in JIT mode, with their DataType codes in parcels.h
+_CFIELD_DATA_TYPES = {np.float32: 0, np.float16: 1, np.int16: 2, np.uint16: 3}
+_COMPACT_DATA_TYPES = (np.float16, np.int16, np.uint16)
+_PACKED_DATA_TYPES = (np.int16, np.uint16)
+
+
+def _iterate_blocks(data, out):
+    """Yield matching 1D blocks (src, dst) of the numpy arrays data and out, with src None if data is out.
+
+    Written dst blocks are stored in out.
+    """
+    if data.flags.c_contiguous and out.flags.c_contiguous:
+        src, dst = data.reshape(-1), out.reshape(-1)
+        for i in range(0, dst.size, _RESCALE_BUFFERSIZE):
+            yield (None if out is data else src[i : i + _RESCALE_BUFFERSIZE]), dst[i : i + _RESCALE_BUFFERSIZE]
+        return
+    if out is data:
+        operands, op_flags = [out], [["readwrite"]]
+    else:
+        operands, op_flags = [data, out], [["readonly"], ["writeonly"]]
+    with np.nditer(
+        operands,
+        flags=["external_loop", "buffered", "zerosize_ok"],
+        op_flags=op_flags,
+        op_dtypes=[operand.dtype for operand in operands],
+        casting="unsafe",
+        buffersize=_RESCALE_BUFFERSIZE,
+    ) as it:
+        for block in it:
+            yield (None, block) if out is data else block
+
 
 def _isParticle(key):
     if hasattr(key, "obs_written"):
@@ -122,8 +163,16 @@ class Field:
     vmax : float
         Maximum allowed value on the field. Data above this value are set to zero
     cast_data_dtype : str
-        Cast Field data to dtype. Supported dtypes are "float32" (np.float32 (default)) and "float64 (np.float64).
-        Note that dtype can only be "float32" in JIT mode
+        Cast Field data to dtype. Supported dtypes are "float32" (np.float32 (default)) and "float64 (np.float64),
+        and the compact storage types "float16", "int16" and "uint16", which halve the memory of the Field and are
+        decoded on the fly during interpolation. Note that dtype can not be "float64" in JIT mode, and that the
+        compact storage types are only available in JIT mode
+    packing : tuple, optional
+        (scale_factor, add_offset) with which the data is packed for the "int16" and "uint16" cast_data_dtype,
+        so that a value is decoded as code * scale_factor + add_offset. The offset is rounded to a multiple of
+        scale_factor, so that zero is represented exactly (a ValueError is raised if zero is outside the range
+        of the codes). Default is the packing of the variable in the netCDF file for :meth:`from_netcdf`, and
+        otherwise the packing that fits the range of the data (which must then be held in memory)
     time_origin : parcels.tools.converters.TimeConverter
         Time origin of the time axis (only if grid is None)
     interp_method : str
@@ -258,28 +307,25 @@ class Field:
         self.vmin = vmin
         self.vmax = vmax
         self._cast_data_dtype = cast_data_dtype
-        if self.cast_data_dtype == "float32":
-            self._cast_data_dtype = np.float32
-        elif self.cast_data_dtype == "float64":
-            self._cast_data_dtype = np.float64
+        if isinstance(self.cast_data_dtype, str):
+            self._cast_data_dtype = np.dtype(self.cast_data_dtype).type
+        packing = kwargs.pop("packing", None)
+        self._packing = None  # (scale_factor, code of zero) of packed data
 
+        self._scaling_factor = None
         if not self.grid.defer_load:
             self.data = self._reshape(self.data, transpose)
-
+        if self.cast_data_dtype in _PACKED_DATA_TYPES:
+            self._packing = self._zero_coded_packing(packing if packing is not None else self._packing_of_range())
+        if not self.grid.defer_load:
             # Hack around the fact that NaN and ridiculously large values
             # propagate in SciPy's interpolators
-            lib = np if isinstance(self.data, np.ndarray) else da
-            self.data[lib.isnan(self.data)] = 0.0
-            if self.vmin is not None:
-                self.data[self.data < self.vmin] = 0.0
-            if self.vmax is not None:
-                self.data[self.data > self.vmax] = 0.0
+            self.data = self._rescale_and_set_minmax(self.data)
 
             if self.grid._add_last_periodic_data_timestep:
+                lib = np if isinstance(self.data, np.ndarray) else da
                 self.data = lib.concatenate((self.data, self.data[:1, :]), axis=0)
 
-        self._scaling_factor = None
-
         # Variable names in JIT code
         self._dimensions = kwargs.pop("dimensions", None)
         self.indices = kwargs.pop("indices", None)
@@ -287,6 +333,7 @@ class Field:
         if self.grid._add_last_periodic_data_timestep and self._dataFiles is not None:
             self._dataFiles = np.append(self._dataFiles, self._dataFiles[0])
         self._field_fb_class = kwargs.pop("FieldFileBuffer", None)
+        self._dataset_lease = kwargs.pop("dataset_lease", None)
         self._netcdf_engine = kwargs.pop("netcdf_engine", "netcdf4")
         self._loaded_time_indices: Iterable[int] = []  # type: ignore
         self._creation_log = kwargs.pop("creation_log", "")
@@ -307,7 +354,14 @@ class Field:
         self._c_data_chunks: list[PointerType | None] = []  # C-pointers to the data_chunks array
         self.nchunks: tuple[int, ...] = ()
         self._chunk_set: bool = False
+        self._data_block = 0  # block of _data_chunks that holds the data of a numpy Field
         self.filebuffers = [None] * 2
+        self._time_ring = None  # buffer holding the two snapshots of a (numpy) deferred-load Field, in place
+        self._time_ring_start = 0  # slot of _time_ring holding the first snapshot of the time window
+        self._snapshot_store = None  # SnapshotStore of the FieldSet, if it holds the snapshots of this Field
+        self._node_comm = None  # MPI communicator of the ranks on this node that share the time ring buffer
+        self._node_window = None  # MPI shared memory window holding the time ring buffer, if shared
+        self._parent_ring = None  # (ring, start) loaded by the parent process of a ProcessPool, mapped instead of read
         if len(kwargs) > 0:
             raise SyntaxError(f'Field received an unexpected keyword argument "{list(kwargs.keys())[0]}"')
 
@@ -415,7 +469,15 @@ class Field:
 
     @staticmethod
     def _collect_timeslices(
-        timestamps, data_filenames, _grid_fb_class, dimensions, indices, netcdf_engine, netcdf_decodewarning=None
+        timestamps,
+        data_filenames,
+        _grid_fb_class,
+        dimensions,
+        indices,
+        netcdf_engine,
+        netcdf_decodewarning=None,
+        lease=None,
+        time_index=True,
     ):
         if netcdf_decodewarning is not None:
             _deprecated_param_netcdf_decodewarning()
@@ -428,13 +490,10 @@ class Field:
             timeslices = np.array([stamp for file in timestamps for stamp in file])
             time = timeslices
         else:
-            timeslices = []
-            dataFiles = []
-            for fname in data_filenames:
-                with _grid_fb_class(fname, dimensions, indices, netcdf_engine=netcdf_engine) as filebuffer:
-                    ftime = filebuffer.time
-                    timeslices.append(ftime)
-                    dataFiles.append([fname] * len(ftime))
+            timeslices = _read_time_axes(
+                data_filenames, _grid_fb_class, dimensions, indices, netcdf_engine, lease, time_index
+            )
+            dataFiles = [[fname] * len(ftime) for fname, ftime in zip(data_filenames, timeslices, strict=True)]
             time = np.concatenate(timeslices).ravel()
             dataFiles = np.concatenate(dataFiles).ravel()
         if time.size == 1 and time[0] is None:
@@ -449,6 +508,12 @@ class Field:
             )
         return time, time_origin, timeslices, dataFiles
 
+    @staticmethod
+    def _resident_nbytes(grid, cast_data_dtype="float32"):
+        """Memory (in bytes) needed to hold the data of all time steps of a Field on grid."""
+        shape = (grid.tdim, grid.zdim, grid.ydim - 2 * grid.meridional_halo, grid.xdim - 2 * grid.zonal_halo)
+        return int(np.prod(shape)) * np.dtype(cast_data_dtype).itemsize
+
     @classmethod
     def from_netcdf(
         cls,
@@ -462,6 +527,7 @@ class Field:
         allow_time_extrapolation: bool | None = None,
         time_periodic: TimePeriodic = False,
         deferred_load: bool = True,
+        memory_budget: int | None = None,
         **kwargs,
     ) -> "Field":
         """Create field from netCDF file.
@@ -502,6 +568,15 @@ class Field:
             fully load them (default: True). It is advised to deferred load the data, since in
             that case Parcels deals with a better memory management during particle set execution.
             deferred_load=False is however sometimes necessary for plotting the fields.
+        memory_budget : int
+            Maximum memory (in bytes) to hold the full time series of a deferred_load Field in memory.
+            If the data for all time steps fits within memory_budget, the Field is fully loaded
+            (as with deferred_load=False), so that no data is read from file during the particle
+            set execution. Otherwise, the Field is deferred loaded. Not used for Fields with dask
+            chunking, which are read lazily. Default is None (no budget)
+        time_index : bool
+            Whether to store the time values of the files in an index in the cache directory, from which
+            they are read (instead of the files) as long as the files are unchanged. Default is True
         gridindexingtype : str
             The type of gridindexing. Either 'nemo' (default) or 'mitgcm' are supported.
             See also the Grid indexing documentation on oceanparcels.org
@@ -579,6 +654,7 @@ class Field:
             depth_filename = depth_filename[0]
 
         netcdf_engine = kwargs.pop("netcdf_engine", "netcdf4")
+        time_index = kwargs.pop("time_index", True)
 
         indices = {} if indices is None else indices.copy()
         for ind in indices:
@@ -600,8 +676,11 @@ class Field:
                 raise RuntimeError(f"interp_method is a dictionary but {variable[0]} is not in it")
 
         _grid_fb_class = NetcdfFileBuffer
+        lease = _DatasetLease()  # holds the opened files for as long as the Field is alive
 
-        with _grid_fb_class(lonlat_filename, dimensions, indices, netcdf_engine) as filebuffer:
+        with _grid_fb_class(
+            lonlat_filename, dimensions, indices, netcdf_engine=netcdf_engine, lease=lease
+        ) as filebuffer:
             lon, lat = filebuffer.lonlat
             indices = filebuffer.indices
             # Check if parcels_mesh has been explicitly set in file
@@ -613,8 +692,9 @@ class Field:
                 depth_filename,
                 dimensions,
                 indices,
-                netcdf_engine,
+                netcdf_engine=netcdf_engine,
                 interp_method=interp_method,
+                lease=lease,
             ) as filebuffer:
                 filebuffer.name = filebuffer.parse_name(variable[1])
                 if dimensions["depth"] == "not_yet_set":
@@ -637,7 +717,14 @@ class Field:
             # Concatenate time variable to determine overall dimension
             # across multiple files
             time, time_origin, timeslices, dataFiles = cls._collect_timeslices(
-                timestamps, data_filenames, _grid_fb_class, dimensions, indices, netcdf_engine
+                timestamps,
+                data_filenames,
+                _grid_fb_class,
+                dimensions,
+                indices,
+                netcdf_engine,
+                lease=lease,
+                time_index=time_index,
             )
             grid = Grid.create_grid(lon, lat, depth, time, time_origin=time_origin, mesh=mesh)
             grid.timeslices = timeslices
@@ -646,7 +733,14 @@ class Field:
             # ==== means: the field has a shared grid, but may have different data files, so we need to collect the
             # ==== correct file time series again.
             _, _, _, dataFiles = cls._collect_timeslices(
-                timestamps, data_filenames, _grid_fb_class, dimensions, indices, netcdf_engine
+                timestamps,
+                data_filenames,
+                _grid_fb_class,
+                dimensions,
+                indices,
+                netcdf_engine,
+                lease=lease,
+                time_index=time_index,
             )
             kwargs["dataFiles"] = dataFiles
 
@@ -660,9 +754,15 @@ class Field:
 
         if grid.time.size <= 2:
             deferred_load = False
+        elif deferred_load and memory_budget is not None and chunksize in [False, None] and not grid.defer_load:
+            cast_data_dtype = kwargs.get("cast_data_dtype", "float32")
+            deferred_load = cls._resident_nbytes(grid, cast_data_dtype) > memory_budget
+            grid._resident_by_budget = not deferred_load
 
         _field_fb_class: type[DeferredDaskFileBuffer | DaskFileBuffer | DeferredNetcdfFileBuffer | NetcdfFileBuffer]
-        if chunksize not in [False, None]:
+        if chunksize not in [False, None] and netcdf_engine == "zarr":
+            _field_fb_class = DeferredZarrFileBuffer if deferred_load else ZarrFileBuffer
+        elif chunksize not in [False, None]:
             if deferred_load:
                 _field_fb_class = DeferredDaskFileBuffer
             else:
@@ -673,6 +773,18 @@ class Field:
             _field_fb_class = NetcdfFileBuffer
         kwargs["FieldFileBuffer"] = _field_fb_class
 
+        if np.dtype(kwargs.get("cast_data_dtype", "float32")).type in _PACKED_DATA_TYPES and "packing" not in kwargs:
+            with NetcdfFileBuffer(
+                data_filenames[0], dimensions, indices, netcdf_engine=netcdf_engine, lease=lease
+            ) as filebuffer:
+                filebuffer.name = filebuffer.parse_name(variable[1])
+                kwargs["packing"] = filebuffer.packing
+            if kwargs["packing"] is None:
+                raise ValueError(
+                    f"Variable {variable[1]} is not packed with a scale_factor and add_offset in {data_filenames[0]}. "
+                    f"Provide the packing for cast_data_dtype={kwargs['cast_data_dtype']}."
+                )
+
         if not deferred_load:
             # Pre-allocate data before reading files into buffer
             data_list = []
@@ -682,10 +794,11 @@ class Field:
                     fname,
                     dimensions,
                     indices,
-                    netcdf_engine,
+                    netcdf_engine=netcdf_engine,
                     interp_method=interp_method,
                     data_full_zdim=data_full_zdim,
                     chunksize=chunksize,
+                    lease=lease,
                 ) as filebuffer:
                     # If Field.from_netcdf is called directly, it may not have a 'data' dimension
                     # In that case, assume that 'name' is the data dimension
@@ -730,6 +843,7 @@ class Field:
         kwargs["indices"] = indices
         kwargs["time_periodic"] = time_periodic
         kwargs["netcdf_engine"] = netcdf_engine
+        kwargs["dataset_lease"] = lease
 
         return cls(
             variable,
@@ -839,24 +953,21 @@ class Field:
         if self.grid.zdim == 1:
             if len(data.shape) == 4:
                 data = data.reshape(sum(((data.shape[0],), data.shape[2:]), ()))
+        ydim, xdim = self.grid._read_shape()
         if len(data.shape) == 4:
             errormessage = (
                 f"Field {self.name} expecting a data shape of [tdim, zdim, ydim, xdim]. "
                 "Flag transpose=True could help to reorder the data."
             )
             assert data.shape[0] == self.grid.tdim, errormessage
-            assert data.shape[2] == self.grid.ydim - 2 * self.grid.meridional_halo, errormessage
-            assert data.shape[3] == self.grid.xdim - 2 * self.grid.zonal_halo, errormessage
+            assert data.shape[2] == ydim, errormessage
+            assert data.shape[3] == xdim, errormessage
             if self.gridindexingtype == "pop":
                 assert data.shape[1] == self.grid.zdim or data.shape[1] == self.grid.zdim - 1, errormessage
             else:
                 assert data.shape[1] == self.grid.zdim, errormessage
         else:
-            assert data.shape == (
-                self.grid.tdim,
-                self.grid.ydim - 2 * self.grid.meridional_halo,
-                self.grid.xdim - 2 * self.grid.zonal_halo,
-            ), (
+            assert data.shape == (self.grid.tdim, ydim, xdim), (
                 f"Field {self.name} expecting a data shape of [tdim, ydim, xdim]. "
                 "Flag transpose=True could help to reorder the data."
             )
@@ -887,7 +998,9 @@ class Field:
         if self._scaling_factor:
             raise NotImplementedError(f"Scaling factor for field {self.name} already defined.")
         self._scaling_factor = factor
-        if not self.grid.defer_load:
+        if self._packing is not None:
+            self._packing = (self._packing[0] * factor, self._packing[1])
+        elif not self.grid.defer_load:
             self.data *= factor
 
     def set_depth_from_field(self, field):
@@ -1013,22 +1126,16 @@ class Field:
             )
         z = np.float32(z)  # type: ignore # TODO: remove type ignore once we migrate to float64
 
+        # bisection on the (monotonic) depth column; searchsorted needs an increasing array, hence the reversed view
+        nz = len(depth_vector)
         if depth_vector[-1] > depth_vector[0]:
-            depth_indices = depth_vector <= z
-            if z >= depth_vector[-1]:
-                zi = len(depth_vector) - 2
-            else:
-                zi = depth_indices.argmin() - 1 if z >= depth_vector[0] else 0
+            zi = min(max(int(depth_vector.searchsorted(z, side="right")) - 1, 0), nz - 2)
             if z < depth_vector[zi]:
                 raise FieldOutOfBoundSurfaceError(0, 0, z, field=self)
             elif z > depth_vector[zi + 1]:
                 raise FieldOutOfBoundError(x, y, z, field=self)
         else:
-            depth_indices = depth_vector >= z
-            if z <= depth_vector[-1]:
-                zi = len(depth_vector) - 2
-            else:
-                zi = depth_indices.argmin() - 1 if z <= depth_vector[0] else 0
+            zi = min(max(nz - int(depth_vector[::-1].searchsorted(z, side="left")) - 1, 0), nz - 2)
             if z > depth_vector[zi]:
                 raise FieldOutOfBoundSurfaceError(0, 0, z, field=self)
             elif z < depth_vector[zi + 1]:
@@ -1073,7 +1180,16 @@ class Field:
             raise FieldOutOfBoundError(x, y, z, field=self)
 
         if grid.xdim > 1:
-            if grid.mesh != "spherical":
+            if grid._zonal_halo_virtual:
+                x = grid._wrap_lon(x)
+                if x >= grid.lon[-1]:
+                    # cell connecting the last and first columns; xi + 1 then indexes the first column
+                    xi = -1
+                    xsi = (x - grid.lon[-1]) / (grid.lon[0] + grid._zonal_period - grid.lon[-1])
+                else:
+                    xi = int(np.searchsorted(grid.lon, x, side="right")) - 1
+                    xsi = (x - grid.lon[xi]) / (grid.lon[xi + 1] - grid.lon[xi])
+            elif grid.mesh != "spherical":
                 lon_index = grid.lon < x
                 if lon_index.all():
                     xi = len(grid.lon) - 2
@@ -1255,12 +1371,26 @@ class Field:
         else:
             return self._search_indices_curvilinear(x, y, z, ti, time, particle=particle, search2D=search2D)
 
+    def _window_indices(self, x, y, z, xi, yi):
+        """Return the indices xi, yi of the grid cell in the data, which only holds the subset window of the grid.
+
+        Raises a FieldSamplingError for cells outside the window (see :meth:`FieldSet.add_auto_subsetting`).
+        """
+        g = self.grid
+        if g._subset_window is None:
+            return xi, yi
+        y0, y1, x0, x1 = g._subset_bounds()
+        if ((y0, y1) != (0, g.ydim) and not y0 <= yi < y1 - 1) or ((x0, x1) != (0, g.xdim) and not x0 <= xi < x1 - 1):
+            raise FieldSamplingError(x, y, z, field=self)
+        return xi - x0, yi - y0
+
     @deprecated_made_private  # TODO: Remove 6 months after v3.1.0
     def interpolator2D(self, *args, **kwargs):
         return self._interpolator2D(*args, **kwargs)
 
     def _interpolator2D(self, ti, z, y, x, particle=None):
         (xsi, eta, _, xi, yi, _) = self._search_indices(x, y, z, particle=particle)
+        xi, yi = self._window_indices(x, y, z, xi, yi)
         if self.interp_method == "nearest":
             xii = xi if xsi <= 0.5 else xi + 1
             yii = yi if eta <= 0.5 else yi + 1
@@ -1274,7 +1404,9 @@ class Field:
             )
             return val
         elif self.interp_method == "linear_invdist_land_tracer":
-            land = np.isclose(self.data[ti, yi : yi + 2, xi : xi + 2], 0.0)
+            # the columns are taken with wrapping, for the cell (xi = -1) across a virtual zonal halo
+            cell = np.take(self.data[ti, yi : yi + 2], [xi, xi + 1], axis=-1, mode="wrap")
+            land = np.isclose(cell, 0.0)
             nb_land = np.sum(land)
             if nb_land == 4:
                 return 0
@@ -1288,9 +1420,9 @@ class Field:
                             if land[j][i] == 1:  # index search led us directly onto land
                                 return 0
                             else:
-                                return self.data[ti, yi + j, xi + i]
+                                return cell[j, i]
                         elif land[j][i] == 0:
-                            val += self.data[ti, yi + j, xi + i] / distance
+                            val += cell[j, i] / distance
                             w_sum += 1 / distance
                 return val / w_sum
             else:
@@ -1316,6 +1448,7 @@ class Field:
 
     def _interpolator3D(self, ti, z, y, x, time, particle=None):
         (xsi, eta, zeta, xi, yi, zi) = self._search_indices(x, y, z, ti, time, particle=particle)
+        xi, yi = self._window_indices(x, y, z, xi, yi)
         if self.interp_method == "nearest":
             xii = xi if xsi <= 0.5 else xi + 1
             yii = yi if eta <= 0.5 else yi + 1
@@ -1331,7 +1464,9 @@ class Field:
                 f1 = self.data[ti, zi + 1, yi, xi]
             return (1 - zeta) * f0 + zeta * f1
         elif self.interp_method == "linear_invdist_land_tracer":
-            land = np.isclose(self.data[ti, zi : zi + 2, yi : yi + 2, xi : xi + 2], 0.0)
+            # the columns are taken with wrapping, for the cell (xi = -1) across a virtual zonal halo
+            cell = np.take(self.data[ti, zi : zi + 2, yi : yi + 2], [xi, xi + 1], axis=-1, mode="wrap")
+            land = np.isclose(cell, 0.0)
             nb_land = np.sum(land)
             if nb_land == 8:
                 return 0
@@ -1346,9 +1481,9 @@ class Field:
                                 if land[k][j][i] == 1:  # index search led us directly onto land
                                     return 0
                                 else:
-                                    return self.data[ti, zi + k, yi + j, xi + i]
+                                    return cell[k, j, i]
                             elif land[k][j][i] == 0:
-                                val += self.data[ti, zi + k, yi + j, xi + i] / distance
+                                val += cell[k, j, i] / distance
                                 w_sum += 1 / distance
                 return val / w_sum
             else:
@@ -1563,12 +1698,21 @@ class Field:
         return self._chunk_setup(*args, **kwargs)
 
     def _chunk_setup(self):
+        self._data_block = 0
         if isinstance(self.data, da.core.Array):
             chunks = self.data.chunks
             self.nchunks = self.data.numblocks
             npartitions = 1
             for n in self.nchunks[1:]:
                 npartitions *= n
+        elif isinstance(self.data, np.ndarray) and self.grid._subset_window is not None:
+            # the data only holds the subset window, the middle block of 3 x 3 blocks of the grid
+            y0, y1, x0, x1 = self.grid._subset_bounds()
+            chunks = tuple((t,) for t in self.data.shape[:-2])
+            chunks += ((y0, y1 - y0, self.grid.ydim - y1), (x0, x1 - x0, self.grid.xdim - x1))
+            self.nchunks = (1,) * (len(self.data.shape) - 2) + (3, 3)
+            npartitions = 9
+            self._data_block = 4
         elif isinstance(self.data, np.ndarray):
             chunks = tuple((t,) for t in self.data.shape)
             self.nchunks = (1,) * len(self.data.shape)
@@ -1582,6 +1726,9 @@ class Field:
         self._data_chunks = [None] * npartitions
         self._c_data_chunks = [None] * npartitions
         self.grid._load_chunk = np.zeros(npartitions, dtype=c_int, order="C")
+        if self._data_block > 0:
+            self.grid._load_chunk[:] = self.grid._chunk_outside_window
+            self.grid._load_chunk[self._data_block] = self.grid._chunk_not_loaded
         # self.grid.chunk_info format: number of dimensions (without tdim); number of chunks per dimensions;
         #      chunksizes (the 0th dim sizes for all chunk of dim[0], then so on for next dims
         self.grid.chunk_info = [
@@ -1592,6 +1739,55 @@ class Field:
         self.grid.chunk_info = sum(self.grid.chunk_info, [])  # noqa: RUF017
         self._chunk_set = True
 
+    def _request_chunks_ahead(self, lon, lat, depth, distance):
+        """Request loading of the dask blocks within distance (in m) of the particle positions.
+
+        This marks the not-loaded blocks that particles can reach within distance as requested, so that they
+        are loaded by :meth:`_chunk_data` before the particles enter them. Only available for rectilinear grids.
+        """
+        g = self.grid
+        if (
+            not isinstance(self.data, da.core.Array)
+            or not self._chunk_set
+            or g._gtype not in [GridType.RectilinearZGrid, GridType.RectilinearSGrid]
+            or len(lon) == 0
+        ):
+            return
+        if g.mesh == "spherical":
+            dlat = distance / 1852.0 / 60.0
+            dlon = dlat / np.cos(np.deg2rad(np.clip(lat, -89.0, 89.0)))
+        else:
+            dlat = dlon = distance
+
+        def node_range(coords, pos_min, pos_max):
+            lo = np.searchsorted(coords, pos_min, side="right") - 1
+            hi = np.searchsorted(coords, pos_max)
+            return np.clip(lo, 0, len(coords) - 1), np.clip(hi, 0, len(coords) - 1)
+
+        node_ranges = [node_range(g.lat, lat - dlat, lat + dlat), node_range(g.lon, lon - dlon, lon + dlon)]
+        chunks = self.data.chunks[1:]  # ([depth,] lat, lon) chunk sizes
+        if len(chunks) == 3:
+            if g._gtype == GridType.RectilinearZGrid:
+                node_ranges.insert(0, node_range(g.depth, depth, depth))
+            else:
+                node_ranges.insert(0, (np.zeros_like(lon, dtype=int), np.full_like(lon, g.zdim - 1, dtype=int)))
+
+        block_ranges = []
+        for (lo, hi), chunksizes in zip(node_ranges, chunks, strict=True):
+            chunkstarts = np.cumsum(chunksizes)[:-1]
+            block_ranges.append(
+                (np.searchsorted(chunkstarts, lo, side="right"), np.searchsorted(chunkstarts, hi, side="right"))
+            )
+        block_ids = []
+        for offset in np.ndindex(*[int(np.max(hi - lo)) + 1 for lo, hi in block_ranges]):
+            block = [np.minimum(lo + o, hi) for (lo, hi), o in zip(block_ranges, offset, strict=True)]
+            block_ids.append(np.ravel_multi_index(block, self.nchunks[1:]))
+        block_ids = np.unique(np.concatenate(block_ids))
+
+        states = g._load_chunk[block_ids]
+        g._load_chunk[block_ids[states == g._chunk_not_loaded]] = g._chunk_loading_requested
+        g._load_chunk[block_ids[states == g._chunk_deprecated]] = g._chunk_loaded_touched
+
     @deprecated_made_private  # TODO: Remove 6 months after v3.1.0
     def chunk_data(self, *args, **kwargs):
         return self._chunk_data(*args, **kwargs)
@@ -1601,30 +1797,36 @@ class Field:
             self._chunk_setup()
         g = self.grid
         if isinstance(self.data, da.core.Array):
+            to_load = []
             for block_id in range(len(self.grid._load_chunk)):
                 if (
                     g._load_chunk[block_id] == g._chunk_loading_requested
                     or g._load_chunk[block_id] in g._chunk_loaded
                     and self._data_chunks[block_id] is None
                 ):
-                    block = self._get_block(block_id)
-                    self._data_chunks[block_id] = np.array(
-                        self.data.blocks[(slice(self.grid.tdim),) + block], order="C"
-                    )
+                    to_load.append(block_id)
                 elif g._load_chunk[block_id] == g._chunk_not_loaded:
                     if isinstance(self._data_chunks, list):
                         self._data_chunks[block_id] = None
                     else:
                         self._data_chunks[block_id, :] = None
                     self._c_data_chunks[block_id] = None
+            if to_load:
+                blocks = self._read_blocks(to_load, list(range(self.grid.tdim)))
+                for block_id, block in zip(to_load, blocks, strict=True):
+                    self._data_chunks[block_id] = block
         else:
+            block_id = self._data_block
             if isinstance(self._data_chunks, list):
-                self._data_chunks[0] = None
+                self._data_chunks[block_id] = None
             else:
-                self._data_chunks[0, :] = None
-            self._c_data_chunks[0] = None
-            self.grid._load_chunk[0] = g._chunk_loaded_touched
-            self._data_chunks[0] = np.array(self.data, order="C")
+                self._data_chunks[block_id, :] = None
+            self._c_data_chunks[block_id] = None
+            self.grid._load_chunk[block_id] = g._chunk_loaded_touched
+            if self._time_ring_active:
+                self._data_chunks[block_id] = self._time_ring
+            else:
+                self._data_chunks[block_id] = np.array(self.data, order="C")
 
     @property
     def ctypes_struct(self):
@@ -1640,6 +1842,10 @@ class Field:
                 ("igrid", c_int),
                 ("allow_time_extrapolation", c_int),
                 ("time_periodic", c_int),
+                ("time_ring_start", c_int),
+                ("data_type", c_int),
+                ("data_zero_code", c_int),
+                ("data_scale", c_double),
                 ("data_chunks", POINTER(POINTER(POINTER(c_float)))),
                 ("grid", POINTER(CGrid)),
             ]
@@ -1647,6 +1853,8 @@ class Field:
         # Create and populate the c-struct object
         allow_time_extrapolation = 1 if self.allow_time_extrapolation else 0
         time_periodic = 1 if self.time_periodic else 0
+        time_ring_start = self._time_ring_start if self._time_ring_active else 0
+        data_scale, data_zero_code = self._packing if self._packing is not None else (1.0, 0)
         for i in range(len(self.grid._load_chunk)):
             if self.grid._load_chunk[i] == self.grid._chunk_loading_requested:
                 raise ValueError(
@@ -1667,6 +1875,10 @@ class Field:
             self.igrid,
             allow_time_extrapolation,
             time_periodic,
+            time_ring_start,
+            _CFIELD_DATA_TYPES[self.data.dtype.type],
+            data_zero_code,
+            data_scale,
             (POINTER(POINTER(c_float)) * len(self._c_data_chunks))(*self._c_data_chunks),
             pointer(self.grid.ctypes_struct),
         )
@@ -1755,10 +1967,15 @@ class Field:
 
         attrs = {"units": "seconds since " + str(self.grid.time_origin)} if self.grid.time_origin.calendar else {}
         time_counter = xr.DataArray(self.grid.time, dims=["time_counter"], attrs=attrs)
-        vardata = xr.DataArray(
-            self.data.reshape((self.grid.tdim, self.grid.zdim, self.grid.ydim, self.grid.xdim)),
-            dims=["time_counter", vname_depth, "y", "x"],
-        )
+        data = self.data.reshape((self.grid.tdim, self.grid.zdim, self.grid.ydim, self.grid.xdim))
+        encoding = {}
+        if self._packing is not None:  # write packed data as packed netCDF variable
+            scale_factor, zero_code = self._packing
+            encoding = {"dtype": data.dtype.name, "scale_factor": scale_factor, "add_offset": -zero_code * scale_factor}
+            data = (data.astype(np.float32) - zero_code) * np.float32(scale_factor)
+        elif data.dtype == np.float16:  # netCDF has no half-precision type
+            data = data.astype(np.float32)
+        vardata = xr.DataArray(data, dims=["time_counter", vname_depth, "y", "x"])
         # Create xarray Dataset and output to netCDF format
         attrs = {"parcels_mesh": self.grid.mesh}
         dset = xr.Dataset(
@@ -1766,21 +1983,114 @@ class Field:
             coords={"nav_lon": nav_lon, "nav_lat": nav_lat, "time_counter": time_counter, vname_depth: self.grid.depth},
             attrs=attrs,
         )
-        dset.to_netcdf(filepath, unlimited_dims="time_counter")
+        _close_pooled_datasets(filepath)
+        dset.to_netcdf(filepath, unlimited_dims="time_counter", encoding={varname: encoding})
 
     @deprecated_made_private  # TODO: Remove 6 months after v3.1.0
     def rescale_and_set_minmax(self, *args, **kwargs):
         return self._rescale_and_set_minmax(*args, **kwargs)
 
-    def _rescale_and_set_minmax(self, data):
-        data[np.isnan(data)] = 0
-        if self._scaling_factor:
-            data *= self._scaling_factor
+    def _rescale_and_set_minmax(self, data, out=None):
+        """Set the NaNs in data to zero, apply the scaling factor and set values outside [vmin, vmax] to zero.
+
+        Numpy data is processed in place (or written to out, cast to its dtype) in a single pass, block by block,
+        so that no temporaries of the size of the data are created. Dask data is processed per chunk. Data of
+        Fields with a compact storage type (see cast_data_dtype) is returned as a new array of that type.
+        """
+        compact = self.cast_data_dtype in _COMPACT_DATA_TYPES
+        dtype = self.cast_data_dtype if compact else data.dtype
+        if isinstance(data, da.core.Array):
+            return data.map_blocks(
+                lambda block: self._rescale_and_set_minmax(block, out=np.empty(block.shape, dtype)), dtype=dtype
+            )
+        if out is None:
+            out = np.empty(data.shape, dtype) if compact else data
+        values = np.empty(_RESCALE_BUFFERSIZE, dtype=np.float32) if compact else None
+        zero = np.empty(_RESCALE_BUFFERSIZE, dtype=bool)
+        keep = np.empty(_RESCALE_BUFFERSIZE, dtype=bool)
+        for src, block in _iterate_blocks(data, out):
+            if compact:  # values are processed as float32 and then packed into the block of out
+                dst = values[: block.size]
+                dst[...] = src
+            else:
+                dst = block
+                if src is not None:
+                    dst[...] = src
+            if self._scaling_factor:
+                np.multiply(dst, self._scaling_factor, out=dst, casting="unsafe")
+            # NaNs fail both comparisons, so a single mask zeroes them together with the values outside [vmin, vmax]
+            n = dst.size
+            if self.vmin is None and self.vmax is None:
+                np.isnan(dst, out=zero[:n])
+            else:
+                if self.vmin is not None:
+                    np.greater_equal(dst, self.vmin, out=keep[:n])
+                if self.vmax is not None:
+                    np.less_equal(dst, self.vmax, out=zero[:n])
+                    if self.vmin is not None:
+                        np.logical_and(keep[:n], zero[:n], out=keep[:n])
+                    else:
+                        keep[:n] = zero[:n]
+                np.logical_not(keep[:n], out=zero[:n])
+            np.copyto(dst, 0, where=zero[:n])
+            if compact:
+                self._pack(dst, out=block)
+        return out
+
+    def _packing_of_range(self):
+        """Return the (scale_factor, add_offset) with which the range of the (numpy) data fits the packed codes."""
+        if self.grid.defer_load or not isinstance(self.data, np.ndarray):
+            raise ValueError(
+                f"Provide the packing for cast_data_dtype={np.dtype(self.cast_data_dtype)} of Field {self.name}, "
+                "as it can only be derived from the range of data that is held in memory"
+            )
+        # the range includes zero (e.g. land, and NaNs, which are ignored here), and is limited to [vmin, vmax]
+        lo = float(np.fmin.reduce(self.data, axis=None, initial=0.0))
+        hi = float(np.fmax.reduce(self.data, axis=None, initial=0.0))
         if self.vmin is not None:
-            data[data < self.vmin] = 0
+            lo = min(max(lo, self.vmin), 0.0)
         if self.vmax is not None:
-            data[data > self.vmax] = 0
-        return data
+            hi = max(min(hi, self.vmax), 0.0)
+        if not np.isfinite(hi - lo):
+            raise ValueError(f"Provide the packing for cast_data_dtype of Field {self.name}, which has infinite values")
+        info = np.iinfo(self.cast_data_dtype)
+        # one code less than the number of codes, as the offset is rounded to a multiple of the scale factor
+        scale_factor = (hi - lo) / (int(info.max) - int(info.min) - 1) if hi > lo else 1.0
+        zero_code = np.ceil(info.min - lo / scale_factor)
+        return scale_factor, -zero_code * scale_factor
+
+    def _zero_coded_packing(self, packing):
+        """Return the (scale_factor, code of zero) of the packing (scale_factor, add_offset).
+
+        The offset is rounded to a multiple of the scale factor, so that zero is represented exactly by a code.
+        """
+        scale_factor, add_offset = (float(v) for v in packing)
+        if not scale_factor > 0:
+            raise ValueError(f"The scale_factor of the packing of Field {self.name} must be positive: {scale_factor}")
+        zero_code = int(np.rint(-add_offset / scale_factor))
+        info = np.iinfo(self.cast_data_dtype)
+        if not info.min <= zero_code <= info.max:
+            raise ValueError(
+                f"The packing {packing} of Field {self.name} can not represent zero with a code of "
+                f"{np.dtype(self.cast_data_dtype)} (in [{info.min}, {info.max}])"
+            )
+        return scale_factor, zero_code
+
+    def _pack(self, values, out):
+        """Write the float values into out, which has the compact storage type of the Field (see cast_data_dtype).
+
+        Packed values are rounded to the nearest code (values outside the range of codes are clipped).
+        """
+        if self._packing is None:
+            out[...] = values
+            return
+        scale_factor, zero_code = self._packing
+        info = np.iinfo(out.dtype)
+        np.divide(values, scale_factor, out=values)
+        np.add(values, zero_code, out=values)
+        np.rint(values, out=values)
+        np.clip(values, info.min, info.max, out=values)
+        out[...] = values
 
     @deprecated_made_private  # TODO: Remove 6 months after v3.1.0
     def data_concatenate(self, *args, **kwargs):
@@ -1801,35 +2111,200 @@ class Field:
             raise ValueError("data_concatenate is used for computeTimeChunk, with tindex in [0, 1]")
         return data
 
+    @property
+    def _time_ring_active(self):
+        """Whether self.data is (a view on) the time ring buffer of this Field."""
+        ring = self._time_ring
+        return ring is not None and (self.data is ring or getattr(self.data, "base", None) is ring)
+
+    def _load_snapshot_into_ring(self, tindex):
+        """Read the snapshot at local time index tindex of a deferred-load Field into its time ring buffer.
+
+        The slot of the snapshot that drops out of the time window is overwritten and the ring is rotated,
+        so that the other snapshot is not moved. self.data is then a zero-copy, time-ordered view on the ring.
+        If the ring is shared by the MPI ranks of the node (see :meth:`FieldSet.add_node_shared_memory`), only
+        the first rank of the node reads the snapshot. In a worker process of a ProcessPool, the ring loaded by
+        the parent process is mapped instead.
+        """
+        if self._parent_ring is not None:
+            self._time_ring, self._time_ring_start = self._parent_ring
+            self.data = self._time_ring if self._time_ring_start == 0 else self._time_ring[::-1]
+            return
+        g = self.grid
+        ring = self._time_ring
+        self._time_ring_start = 1 - self._time_ring_start
+        comm = self._node_comm
+        if comm is not None:
+            comm.Barrier()  # the other ranks of the node no longer sample the snapshot that is overwritten
+            if comm.Get_rank() > 0:
+                comm.Barrier()  # wait until the first rank of the node has read the snapshot
+                self.data = ring if self._time_ring_start == 0 else ring[::-1]
+                return
+        slot = ring[(tindex + self._time_ring_start) % 2]
+
+        snapshot = self._read_snapshot(tindex)[0]
+        if g._lat_flipped:
+            snapshot = np.flip(snapshot, axis=-2)
+        rows = slice(g.meridional_halo, slot.shape[-2] - g.meridional_halo)
+        interior = slot[..., rows, g.zonal_halo : slot.shape[-1] - g.zonal_halo]
+        self._rescale_and_set_minmax(np.reshape(snapshot, interior.shape), out=interior)
+        if g.zonal_halo > 0:
+            h = g.zonal_halo
+            slot[..., rows, :h] = slot[..., rows, -2 * h : -h]
+            slot[..., rows, -h:] = slot[..., rows, h : 2 * h]
+        if g.meridional_halo > 0:
+            h = g.meridional_halo
+            slot[..., :h, :] = slot[..., -2 * h : -h, :]
+            slot[..., -h:, :] = slot[..., h : 2 * h, :]
+        if comm is not None:
+            comm.Barrier()
+        self.data = ring if self._time_ring_start == 0 else ring[::-1]
+
+    def _node_shared_ring(self, data):
+        """Return the time ring buffer of this Field in memory shared by the MPI ranks of the node, filled with data.
+
+        data is the time window as read by the first rank of the node, and None on the other ranks, which
+        map the buffer read-only. The buffer is only reallocated when the shape or dtype of the data changes.
+        """
+        comm = self._node_comm
+        first = comm.Get_rank() == 0
+        shape, dtype = comm.bcast((data.shape, data.dtype) if first else None, root=0)
+        ring = self._time_ring
+        if self._node_window is None or ring.shape != shape or ring.dtype != dtype:
+            if self._node_window is not None:
+                self._node_window.Free()
+            nbytes = math.prod(shape) * dtype.itemsize if first else 0
+            self._node_window = MPI.Win.Allocate_shared(nbytes, dtype.itemsize, comm=comm)
+            buffer, _ = self._node_window.Shared_query(0)
+            ring = np.ndarray(buffer=buffer, dtype=dtype, shape=shape)
+            ring.flags.writeable = first
+        comm.Barrier()  # the other ranks of the node no longer sample the previous time window
+        if first:
+            ring[...] = data
+        comm.Barrier()
+        return ring
+
+    @property
+    def _snapshot_cache(self):
+        """The snapshot cache of the FieldSet of this Field, if any, used only for deferred-load Fields."""
+        if self.fieldset is None or not self.grid.defer_load:
+            return None
+        return self.fieldset._snapshot_cache
+
+    def _snapshot_source(self):
+        """Return a description of the files and indices that the snapshots of this deferred-load Field are read from.
+
+        A snapshot store is only used for a Field if it was written for the same source, i.e. for the same
+        files (with the same modification time and size), indices, chunks and data type.
+        """
+        return {
+            "files": [str(f) for f in self._dataFiles],
+            "stat": [[st.st_mtime_ns, st.st_size] for st in (os.stat(f) for f in self._dataFiles)],
+            "indices": {dim: [int(i) for i in ind] for dim, ind in sorted((self.indices or {}).items())},
+            "chunksize": repr(self.chunksize),
+            "dtype": np.dtype(np.float32 if self.cast_data_dtype in _CFIELD_DATA_TYPES else self.cast_data_dtype).str,
+        }
+
+    def _read_blocks(self, block_ids, tindices):
+        """Return the data of the dask blocks block_ids at the (local) time indices tindices as numpy arrays.
+
+        All blocks are read in a single (threaded) dask computation. Each time level of a block is looked
+        up in, and added to, the snapshot cache of the FieldSet (if any).
+        """
+        cache = self._snapshot_cache
+        levels = {}
+        to_read = {}
+        for block_id in block_ids:
+            blockdata = self.data.blocks[(slice(self.grid.tdim),) + self._get_block(block_id)]
+            for tind in tindices:
+                key = (self, self.grid._ti + tind, block_id)
+                level = cache.get(key) if cache is not None else None
+                if level is None:
+                    to_read[key] = blockdata[tind]
+                else:
+                    levels[key] = level
+        if to_read:
+            for key, level in zip(to_read, dask.compute(*to_read.values(), scheduler="threads"), strict=True):
+                levels[key] = np.asarray(level, order="C")
+                if cache is not None:
+                    cache.put(key, levels[key])
+        return [
+            np.stack([levels[(self, self.grid._ti + tind, block_id)] for tind in tindices]) for block_id in block_ids
+        ]
+
     def computeTimeChunk(self, data, tindex):
+        return self._data_concatenate(data, self._read_snapshot(tindex), tindex)
+
+    def _read_snapshot(self, tindex):
+        """Return the data at local time index tindex, read from file (or the snapshot cache), as [1, zdim, ydim, xdim].
+
+        Snapshots in the snapshot store of the Field (see :meth:`FieldSet.add_snapshot_store`) are memory-mapped
+        instead of read from file. If the grid has a subset window (see :meth:`FieldSet.add_auto_subsetting`), only the
+        data within the window is read (and returned).
+        """
+        g = self.grid
+        window = g._subset_window
+        cache = self._snapshot_cache
+        cache_key = (self, g._ti + tindex, window)
+        if cache is not None and cache_key in cache:
+            self.filebuffers[tindex] = None
+            return cache.get(cache_key)
+
+        store = self._snapshot_store
+        stored = store.read(self.name, g._ti + tindex) if store is not None else None
+        if stored is not None:
+            self.filebuffers[tindex] = None
+            if self.chunksize not in [False, None]:
+                return da.from_array(stored, chunks=tuple(map(tuple, store.index(self.name)["chunks"])))
+            if window is not None:
+                j0, j1, i0, i1 = window
+                stored = stored[..., j0:j1, i0:i1]
+            return stored
+
+        indices = self.indices
+        if window is not None:
+            j0, j1, i0, i1 = window
+            ydim, xdim = g.ydim - 2 * g.meridional_halo, g.xdim - 2 * g.zonal_halo
+            indices = dict(
+                indices, lat=indices.get("lat", range(ydim))[j0:j1], lon=indices.get("lon", range(xdim))[i0:i1]
+            )
+        rechunk_callback_fields = self._chunk_setup if isinstance(tindex, list) else None
+        filebuffer, buffer_data = self._read_file(g._ti + tindex, g.time[tindex], indices, rechunk_callback_fields)
+        if cache is not None and isinstance(buffer_data, np.ndarray):
+            cache.put(cache_key, buffer_data)
+        self.filebuffers[tindex] = filebuffer
+        return buffer_data
+
+    def _read_file(self, ti, time, indices, rechunk_callback_fields=None):
+        """Open the file of global time index ti and return its FileBuffer and data as [1, zdim, ydim, xdim]."""
         g = self.grid
         timestamp = self.timestamps
         if timestamp is not None:
             summedlen = np.cumsum([len(ls) for ls in self.timestamps])
-            if g._ti + tindex >= summedlen[-1]:
-                ti = g._ti + tindex - summedlen[-1]
+            if ti >= summedlen[-1]:
+                ti_stamp = ti - summedlen[-1]
             else:
-                ti = g._ti + tindex
-            timestamp = self.timestamps[np.where(ti < summedlen)[0][0]]
+                ti_stamp = ti
+            timestamp = self.timestamps[np.where(ti_stamp < summedlen)[0][0]]
 
-        rechunk_callback_fields = self._chunk_setup if isinstance(tindex, list) else None
         filebuffer = self._field_fb_class(
-            self._dataFiles[g._ti + tindex],
+            self._dataFiles[ti],
             self.dimensions,
-            self.indices,
+            indices,
             netcdf_engine=self.netcdf_engine,
             timestamp=timestamp,
             interp_method=self.interp_method,
             data_full_zdim=self.data_full_zdim,
             chunksize=self.chunksize,
-            cast_data_dtype=self.cast_data_dtype,
+            cast_data_dtype=np.float32 if self.cast_data_dtype in _CFIELD_DATA_TYPES else self.cast_data_dtype,
             rechunk_callback_fields=rechunk_callback_fields,
             chunkdims_name_map=self.netcdf_chunkdims_name_map,
+            lease=self._dataset_lease,
         )
         filebuffer.__enter__()
         time_data = filebuffer.time
         time_data = g.time_origin.reltime(time_data)
-        filebuffer.ti = (time_data <= g.time[tindex]).argmin() - 1
+        filebuffer.ti = (time_data <= time).argmin() - 1
         if self.netcdf_engine != "xarray":
             filebuffer.name = filebuffer.parse_name(self.filebuffername)
         buffer_data = filebuffer.data
@@ -1852,9 +2327,7 @@ class Field:
                     (),
                 ),
             )
-        data = self._data_concatenate(data, buffer_data, tindex)
-        self.filebuffers[tindex] = filebuffer
-        return data
+        return filebuffer, buffer_data
 
 
 class VectorField:
@@ -1921,6 +2394,10 @@ class VectorField:
 
         if grid._gtype in [GridType.RectilinearSGrid, GridType.RectilinearZGrid]:
             px = np.array([grid.lon[xi], grid.lon[xi + 1], grid.lon[xi + 1], grid.lon[xi]])
+            if grid._zonal_halo_virtual:
+                x = grid._wrap_lon(x)
+                if xi == -1:
+                    px[1:3] += grid._zonal_period
             py = np.array([grid.lat[yi], grid.lat[yi], grid.lat[yi + 1], grid.lat[yi + 1]])
         else:
             px = np.array([grid.lon[yi, xi], grid.lon[yi, xi + 1], grid.lon[yi + 1, xi + 1], grid.lon[yi + 1, xi]])
@@ -1937,6 +2414,7 @@ class VectorField:
         c2 = self.dist(px[1], px[2], py[1], py[2], grid.mesh, np.dot(i_u.phi2D_lin(1.0, eta), py))
         c3 = self.dist(px[2], px[3], py[2], py[3], grid.mesh, np.dot(i_u.phi2D_lin(xsi, 1.0), py))
         c4 = self.dist(px[3], px[0], py[3], py[0], grid.mesh, np.dot(i_u.phi2D_lin(0.0, eta), py))
+        xi, yi = self.U._window_indices(x, y, z, xi, yi)
         if grid.zdim == 1:
             if self.gridindexingtype == "nemo":
                 U0 = self.U.data[ti, yi + 1, xi] * c4
@@ -1993,6 +2471,10 @@ class VectorField:
 
         if grid._gtype in [GridType.RectilinearSGrid, GridType.RectilinearZGrid]:
             px = np.array([grid.lon[xi], grid.lon[xi + 1], grid.lon[xi + 1], grid.lon[xi]])
+            if grid._zonal_halo_virtual:
+                x = grid._wrap_lon(x)
+                if xi == -1:
+                    px[1:3] += grid._zonal_period
             py = np.array([grid.lat[yi], grid.lat[yi], grid.lat[yi + 1], grid.lat[yi + 1]])
         else:
             px = np.array([grid.lon[yi, xi], grid.lon[yi, xi + 1], grid.lon[yi + 1, xi + 1], grid.lon[yi + 1, xi]])
@@ -2035,6 +2517,7 @@ class VectorField:
                 ]
             )
 
+        xi, yi = self.U._window_indices(x, y, z, xi, yi)
         u0 = self.U.data[ti, zi, yi + 1, xi]
         u1 = self.U.data[ti, zi, yi + 1, xi + 1]
         v0 = self.V.data[ti, zi, yi, xi + 1]
@@ -2231,6 +2714,7 @@ class VectorField:
 
     def spatial_slip_interpolation(self, ti, z, y, x, time, particle=None, applyConversion=True):
         (xsi, eta, zeta, xi, yi, zi) = self.U._search_indices(x, y, z, ti, time, particle=particle)
+        xi, yi = self.U._window_indices(x, y, z, xi, yi)
         di = ti if self.U.grid.zdim == 1 else zi  # general third dimension
 
         f_u, f_v, f_w = 1, 1, 1
@@ -1,6 +1,14 @@
 import datetime
+import functools
+import hashlib
+import json
 import math
+import multiprocessing
+import os
+import threading
 import warnings
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 import dask.array as da
 import numpy as np
@@ -11,10 +19,258 @@ from dask import utils as da_utils
 from netCDF4 import Dataset as ncDataset
 
 from parcels._typing import InterpMethodOption
+from parcels.tools._cache import LRUCache
 from parcels.tools.converters import convert_xarray_time_units
+from parcels.tools.global_statics import get_cache_dir
 from parcels.tools.statuscodes import DaskChunkingError
 from parcels.tools.warnings import FileWarning
 
+# Maximum number of datasets kept open in the process-wide pool of opened datasets
+_DATASET_POOL_SIZE = 32
+
+_dataset_pool = LRUCache(_DATASET_POOL_SIZE, on_evict=lambda key, dataset: dataset.close())
+
+# Number of leases (see _DatasetLease) holding each key of the pool of opened datasets
+_dataset_users: dict = {}
+_dataset_users_lock = threading.RLock()
+
+
+class _DatasetLease:
+    """Hold on to the pooled datasets opened for a Field (or a single FileBuffer), for as long as the lease is alive.
+
+    A pooled dataset is closed, and removed from the pool, as soon as no lease holds it anymore: once all Fields
+    that read from it are garbage collected, or have released their lease (see :meth:`FieldSet.close`).
+    """
+
+    def __init__(self):
+        self._keys = set()
+        weakref.finalize(self, _release_datasets, self._keys)
+
+    def hold(self, key):
+        with _dataset_users_lock:
+            if key not in self._keys:
+                self._keys.add(key)
+                _dataset_users[key] = _dataset_users.get(key, 0) + 1
+
+    def release(self):
+        """Release the datasets held by the lease, which holds the datasets opened afterwards again."""
+        _release_datasets(self._keys)
+
+
+def _release_datasets(keys):
+    """Release the pooled datasets of keys (of a lease), closing those that no other lease holds."""
+    with _dataset_users_lock:
+        for key in keys:
+            _dataset_users[key] -= 1
+            if _dataset_users[key] == 0:
+                del _dataset_users[key]
+                dataset = _dataset_pool.pop(key)
+                if dataset is not None:
+                    dataset.close()
+        keys.clear()
+
+
+def _open_dataset(filename, netcdf_engine, lease, decode_cf=None, chunks=None, lock=True):
+    """Return the xarray Dataset of filename from the process-wide pool of opened datasets, opening it if needed.
+
+    Datasets are shared by all FileBuffers and Fields. Each dataset is held by lease (see _DatasetLease) and is
+    closed when no lease holds it anymore, or when it is evicted from the pool.
+    With decode_cf=None, the file is opened with CF decoding, falling back to no decoding if that fails.
+    """
+    filename = str(filename)
+    try:
+        stat = os.stat(filename)
+        file_id = (os.path.abspath(filename), stat.st_mtime_ns, stat.st_size)
+    except OSError:  # e.g. a remote dataset
+        file_id = (filename,)
+    chunks_key = tuple(sorted(chunks.items())) if isinstance(chunks, dict) else chunks
+    key = (file_id, netcdf_engine, chunks_key, decode_cf, lock)
+    with _dataset_users_lock:
+        dataset = _dataset_pool.get(key)
+        if dataset is not None:
+            lease.hold(key)
+            return dataset
+
+    # Unfortunately we need to do if-else here, cause the lock-parameter is either False or a Lock-object
+    # (which we would rather want to have being auto-managed).
+    # If 'lock' is not specified, the Lock-object is auto-created and managed by xarray internally.
+    kwargs = {"engine": netcdf_engine, "chunks": chunks}
+    if not lock:
+        kwargs["lock"] = False
+    if decode_cf is None:
+        try:
+            dataset = xr.open_dataset(filename, decode_cf=True, **kwargs)
+            dataset["decoded"] = True
+        except:
+            warnings.warn(
+                f"File {filename} could not be decoded properly by xarray (version {xr.__version__}). "
+                "It will be opened with no decoding. Filling values might be wrongly parsed.",
+                FileWarning,
+                stacklevel=3,
+            )
+            dataset = xr.open_dataset(filename, decode_cf=False, **kwargs)
+            dataset["decoded"] = False
+    else:
+        dataset = xr.open_dataset(filename, decode_cf=decode_cf, **kwargs)
+        dataset["decoded"] = decode_cf
+    with _dataset_users_lock:
+        pooled = _dataset_pool.setdefault(key, dataset)
+        lease.hold(key)
+    if pooled is not dataset:  # opened concurrently by another thread
+        dataset.close()
+    return pooled
+
+
+def _close_pooled_datasets(filename=None):
+    """Close and remove the datasets of filename (default: all datasets) from the process-wide pool.
+
+    This is needed before overwriting a file that has been read, as open files can not be written to.
+    """
+    if filename is None:
+        _dataset_pool.clear()
+        return
+    file_ids = [(os.path.abspath(str(filename)),), (str(filename),)]
+    for key in [key for key in _dataset_pool.keys() if key[0][:1] in file_ids]:
+        _dataset_pool.pop(key).close()
+
+
+# Directory (in the cache directory) of the index files of the time values of previously scanned files
+_TIME_INDEX_DIRNAME = "time_index"
+
+# Maximum number of index files in the time index directory, beyond which the least recently used are removed
+_TIME_INDEX_MAX_FILES = 2000
+
+# Minimum number of netcdf4 files that are scanned in parallel processes (which take a while to start)
+_PROCESS_SCAN_MIN_FILES = 32
+
+
+def _time_index_path(filename, time_dimension, netcdf_engine):
+    """Return the path of the index file of the time values of filename, or None if these can not be indexed."""
+    if not os.path.isfile(filename):  # e.g. a remote dataset, or a Zarr store (whose mtime does not cover its content)
+        return None
+    key = f"{os.path.abspath(filename)}|{time_dimension}|{netcdf_engine}"
+    return os.path.join(get_cache_dir(), _TIME_INDEX_DIRNAME, hashlib.sha1(key.encode()).hexdigest() + ".json")
+
+
+def _read_time_index(path, filename):
+    """Return the time values in the index file at path, if it was written for the current version of filename."""
+    try:
+        stat = os.stat(filename)
+        with open(path) as f:
+            entry = json.load(f)
+        if entry["mtime_ns"] != stat.st_mtime_ns or entry["size"] != stat.st_size:
+            return None
+        values = np.array(entry["values"]).astype(entry["dtype"])
+    except (OSError, ValueError, KeyError):
+        return None
+    try:
+        os.utime(path)  # the modification time of the index file is the time it was last used
+    except OSError:
+        pass
+    return values
+
+
+def _write_time_index(path, filename, stat, ftime):
+    """Write the time values ftime of filename (with os.stat result stat before the scan) to the index file at path."""
+    if ftime.dtype.kind not in "iufmM":  # e.g. cftime objects
+        return
+    values = ftime.astype(np.int64) if ftime.dtype.kind in "mM" else ftime
+    entry = {
+        "filename": os.path.abspath(filename),
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "dtype": str(ftime.dtype),
+        "values": values.tolist(),
+    }
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, "w") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)  # atomic, so that concurrent processes read either index file completely
+    except OSError:
+        pass  # the index is only an optimisation
+
+
+def _prune_time_index():
+    """Remove index files once there are more than _TIME_INDEX_MAX_FILES of them.
+
+    The least recently used index files are removed, down to half of _TIME_INDEX_MAX_FILES, as well as the
+    index files of files that no longer exist (e.g. in temporary directories).
+    """
+    directory = os.path.join(get_cache_dir(), _TIME_INDEX_DIRNAME)
+    try:
+        entries = [(e.stat().st_mtime_ns, e.path) for e in os.scandir(directory) if e.name.endswith(".json")]
+    except OSError:
+        return
+    if len(entries) <= _TIME_INDEX_MAX_FILES:
+        return
+    entries.sort()
+    nremove = len(entries) - _TIME_INDEX_MAX_FILES // 2
+    for i, (_, path) in enumerate(entries):
+        try:
+            if i >= nremove:
+                with open(path) as f:
+                    if os.path.isfile(json.load(f).get("filename", "")):
+                        continue
+            os.remove(path)
+        except (OSError, ValueError, AttributeError):
+            pass  # e.g. removed by another process
+
+
+def _scan_time(fb_class, filename, dimensions, indices, netcdf_engine, lease=None):
+    with fb_class(filename, dimensions, indices, netcdf_engine=netcdf_engine, lease=lease) as filebuffer:
+        return filebuffer.time
+
+
+def _read_time_axes(filenames, fb_class, dimensions, indices, netcdf_engine, lease=None, time_index=True):
+    """Return the time values in each of the files in filenames.
+
+    Files are scanned in parallel: in threads, or, for the netcdf4 engine (as the netCDF-C and HDF5 libraries are
+    not thread-safe), in processes if there are at least _PROCESS_SCAN_MIN_FILES files. With time_index, the time
+    values of each local file are stored in a small index file in the cache directory, together with the
+    modification time and size of the file, so that later scans of the same (unchanged) file only read its index
+    file. The files opened in this process are held by lease (see _DatasetLease), if given.
+    """
+    time_dimension = dimensions.get("time")
+    paths = {}
+    times = {}
+    for fname in dict.fromkeys(filenames):
+        if time_dimension is None or not time_index:
+            paths[fname] = None
+        else:
+            paths[fname] = _time_index_path(str(fname), time_dimension, netcdf_engine)
+        if paths[fname] is not None:
+            ftime = _read_time_index(paths[fname], str(fname))
+            if ftime is not None:
+                times[fname] = ftime
+
+    to_scan = [fname for fname in paths if fname not in times]
+    stats = {fname: os.stat(fname) for fname in to_scan if paths[fname] is not None}
+    scan = functools.partial(_scan_time, fb_class, dimensions=dimensions, indices=indices, netcdf_engine=netcdf_engine)
+    if netcdf_engine == "netcdf4" and len(to_scan) >= max(_PROCESS_SCAN_MIN_FILES, 2):
+        # processes started from a server process that has imported parcels, not forked from this process
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        if "forkserver" in methods:
+            context.set_forkserver_preload([__name__])
+        nworkers = min(len(to_scan), os.cpu_count() or 1)
+        with ProcessPoolExecutor(nworkers, mp_context=context) as executor:
+            scanned = list(executor.map(scan, to_scan, chunksize=max(1, len(to_scan) // (8 * nworkers))))
+    elif len(to_scan) > 1 and netcdf_engine != "netcdf4":
+        with ThreadPoolExecutor() as executor:
+            scanned = list(executor.map(functools.partial(scan, lease=lease), to_scan))
+    else:
+        scanned = [scan(fname, lease=lease) for fname in to_scan]
+
+    for fname, ftime in zip(to_scan, scanned, strict=True):
+        times[fname] = ftime
+        if fname in stats:
+            _write_time_index(paths[fname], str(fname), stats[fname], ftime)
+    if stats:
+        _prune_time_index()
+    return [times[fname].copy() for fname in filenames]
+
 
 class _FileBuffer:
     def __init__(
@@ -33,6 +289,9 @@ class _FileBuffer:
         self.dataset = None
         self.timestamp = timestamp
         self.cast_data_dtype = kwargs.pop("cast_data_dtype", np.float32)
+        lease = kwargs.pop("lease", None)
+        self._own_lease = lease is None  # without a lease (of a Field), the datasets are released when closing
+        self._lease = _DatasetLease() if lease is None else lease
         self.ti = None
         self.interp_method = interp_method
         self.data_full_zdim = data_full_zdim
@@ -49,22 +308,7 @@ class NetcdfFileBuffer(_FileBuffer):
         super().__init__(*args, **kwargs)
 
     def __enter__(self):
-        try:
-            # Unfortunately we need to do if-else here, cause the lock-parameter is either False or a Lock-object
-            # (which we would rather want to have being auto-managed).
-            # If 'lock' is not specified, the Lock-object is auto-created and managed by xarray internally.
-            self.dataset = xr.open_dataset(str(self.filename), decode_cf=True, engine=self.netcdf_engine)
-            self.dataset["decoded"] = True
-        except:
-            warnings.warn(
-                f"File {self.filename} could not be decoded properly by xarray (version {xr.__version__}). "
-                "It will be opened with no decoding. Filling values might be wrongly parsed.",
-                FileWarning,
-                stacklevel=2,
-            )
-
-            self.dataset = xr.open_dataset(str(self.filename), decode_cf=False, engine=self.netcdf_engine)
-            self.dataset["decoded"] = False
+        self.dataset = _open_dataset(self.filename, self.netcdf_engine, self._lease)
         for inds in self.indices.values():
             if type(inds) not in [list, range]:
                 raise RuntimeError("Indices for field subsetting need to be a list")
@@ -74,9 +318,10 @@ class NetcdfFileBuffer(_FileBuffer):
         self.close()
 
     def close(self):
-        if self.dataset is not None:
-            self.dataset.close()
-            self.dataset = None
+        # the dataset itself is kept open in the pool of opened datasets, for as long as a lease holds it
+        self.dataset = None
+        if self._own_lease:
+            self._lease.release()
 
     def parse_name(self, name):
         if isinstance(name, list):
@@ -172,6 +417,14 @@ class NetcdfFileBuffer(_FileBuffer):
             else:
                 return np.empty((0, len(self.indices["depth"]), len(self.indices["lat"]), len(self.indices["lon"])))
 
+    @property
+    def packing(self):
+        """The (scale_factor, add_offset) with which the variable is packed in the file, or None if it is not packed."""
+        encoding = self.dataset[self.name].encoding
+        if "scale_factor" not in encoding and "add_offset" not in encoding:
+            return None
+        return float(encoding.get("scale_factor", 1.0)), float(encoding.get("add_offset", 0.0))
+
     def _check_extend_depth(self, data, di):
         return (
             self.indices["depth"][-1] == self.data_full_zdim - 1
@@ -323,35 +576,9 @@ class DaskFileBuffer(NetcdfFileBuffer):
         init_chunk_dict = None
         if self.chunksize not in [False, None]:
             init_chunk_dict = self._get_initial_chunk_dictionary()
-        try:
-            # Unfortunately we need to do if-else here, cause the lock-parameter is either False or a Lock-object
-            # (which we would rather want to have being auto-managed).
-            # If 'lock' is not specified, the Lock-object is auto-created and managed by xarray internally.
-            if self.lock_file:
-                self.dataset = xr.open_dataset(
-                    str(self.filename), decode_cf=True, engine=self.netcdf_engine, chunks=init_chunk_dict
-                )
-            else:
-                self.dataset = xr.open_dataset(
-                    str(self.filename), decode_cf=True, engine=self.netcdf_engine, chunks=init_chunk_dict, lock=False
-                )
-            self.dataset["decoded"] = True
-        except:
-            warnings.warn(
-                f"File {self.filename} could not be decoded properly by xarray (version {xr.__version__}). "
-                "It will be opened with no decoding. Filling values might be wrongly parsed.",
-                FileWarning,
-                stacklevel=2,
-            )
-            if self.lock_file:
-                self.dataset = xr.open_dataset(
-                    str(self.filename), decode_cf=False, engine=self.netcdf_engine, chunks=init_chunk_dict
-                )
-            else:
-                self.dataset = xr.open_dataset(
-                    str(self.filename), decode_cf=False, engine=self.netcdf_engine, chunks=init_chunk_dict, lock=False
-                )
-            self.dataset["decoded"] = False
+        self.dataset = _open_dataset(
+            self.filename, self.netcdf_engine, self._lease, chunks=init_chunk_dict, lock=self.lock_file
+        )
 
         for inds in self.indices.values():
             if type(inds) not in [list, range]:
@@ -373,11 +600,12 @@ class DaskFileBuffer(NetcdfFileBuffer):
         This function can be called to initialise an orderly teardown of a FileBuffer object with dask, meaning
         to release the file handle, deposing the dataset, and releasing the file lock (if required).
         """
-        if self.dataset is not None:
-            self.dataset.close()
-            self.dataset = None
+        # the dataset itself is kept open in the pool of opened datasets, for as long as a lease holds it
+        self.dataset = None
         self.chunking_finalized = False
         self.chunk_mapping = None
+        if self._own_lease:
+            self._lease.release()
 
     @classmethod
     def add_to_dimension_name_map_global(self, name_map):
@@ -725,10 +953,9 @@ class DaskFileBuffer(NetcdfFileBuffer):
         """
         # ==== check-opening requested dataset to access metadata                   ==== #
         # ==== file-opening and dimension-reading does not require a decode or lock ==== #
-        self.dataset = xr.open_dataset(
-            str(self.filename), decode_cf=False, engine=self.netcdf_engine, chunks={}, lock=False
+        self.dataset = _open_dataset(
+            self.filename, self.netcdf_engine, self._lease, decode_cf=False, chunks={}, lock=False
         )
-        self.dataset["decoded"] = False
         # ==== self.dataset temporarily available ==== #
         init_chunk_dict = {}
         init_chunk_map = {}
@@ -766,8 +993,8 @@ class DaskFileBuffer(NetcdfFileBuffer):
             if depthi is not None and depthi >= 0:
                 init_chunk_dict[depthname] = max(1, depthvalue)
                 init_chunk_map[depthi] = max(1, depthvalue)
-        # ==== closing check-opened requested dataset ==== #
-        self.dataset.close()
+        # ==== releasing check-opened requested dataset ==== #
+        self.dataset = None
         # ==== check if the chunksize reading is successful. if not, load the file ONCE really into memory and ==== #
         # ==== deduce the chunking from the array dims.                                                         ==== #
         if len(init_chunk_dict) == 0 and self.chunksize not in [False, None, "auto"]:
@@ -779,8 +1006,8 @@ class DaskFileBuffer(NetcdfFileBuffer):
         else:
             self.autochunkingfailed = False
         try:
-            self.dataset = xr.open_dataset(
-                str(self.filename), decode_cf=True, engine=self.netcdf_engine, chunks=init_chunk_dict, lock=False
+            self.dataset = _open_dataset(
+                self.filename, self.netcdf_engine, self._lease, decode_cf=True, chunks=init_chunk_dict, lock=False
             )
             if isinstance(self.chunksize, dict):
                 self.chunksize = init_chunk_dict
@@ -796,7 +1023,6 @@ class DaskFileBuffer(NetcdfFileBuffer):
             if isinstance(self.chunksize, dict):
                 self.chunksize = init_chunk_dict
         finally:
-            self.dataset.close()
             self.chunk_mapping = init_chunk_map
         self.dataset = None
         # ==== self.dataset not available ==== #
@@ -844,9 +1070,60 @@ class DaskFileBuffer(NetcdfFileBuffer):
                 self.rechunk_callback_fields()
                 self.chunking_finalized = True
 
-        return data.astype(self.cast_data_dtype)
+        return data.astype(self.cast_data_dtype, copy=False)
 
 
 class DeferredDaskFileBuffer(DaskFileBuffer):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+
+
+class ZarrFileBuffer(DaskFileBuffer):
+    """Class that encapsulates and manages lazy, chunk-aligned access to the data in a Zarr store.
+
+    The dask chunks of the data, and hence the Parcels chunks that are loaded for the particles, are aligned with
+    the chunks of the store: with chunksize='auto', every Parcels chunk is one chunk of the store. The sizes in a
+    chunksize dict are rounded up to a whole number of store chunks, so that no store chunk is read for more than
+    one Parcels chunk.
+    """
+
+    def __enter__(self):
+        if self.chunksize != "auto" and type(self.chunksize) is not dict:
+            raise AttributeError("'chunksize' is of wrong type. Parameter is expected to be a dict or 'auto'.")
+        # chunks={} gives dask arrays with the chunks of the store
+        self.dataset = _open_dataset(self.filename, self.netcdf_engine, self._lease, chunks={})
+        for inds in self.indices.values():
+            if type(inds) not in [list, range]:
+                raise RuntimeError("Indices for field subsetting need to be a list")
+        return self
+
+    def _store_aligned_chunks(self, data):
+        """Return the requested chunk size per axis of the DataArray data, rounded up to whole store chunks."""
+        if not isinstance(self.chunksize, dict):
+            return {}
+        requested = dict(self.chunksize.values())  # {store dimension name: chunk size}
+        store_chunks = self.dataset[self.name].encoding.get("preferred_chunks", {})
+        chunks = {}
+        for axis, dim in enumerate(data.dims):
+            if dim in requested:
+                store_chunk = store_chunks.get(dim, data.chunks[axis][0])
+                chunks[axis] = min(data.shape[axis], -(-requested[dim] // store_chunk) * store_chunk)
+        return chunks
+
+    def data_access(self):
+        data = self.dataset[self.name]
+        ti = range(data.shape[0]) if self.ti is None else self.ti
+        data = self._apply_indices(data, ti)
+        chunks = self._store_aligned_chunks(data)
+        data = data.data
+        if chunks:
+            data = data.rechunk(chunks)
+        if not self.chunking_finalized and self.rechunk_callback_fields is not None:
+            self.rechunk_callback_fields()
+            self.chunking_finalized = True
+        return data.astype(self.cast_data_dtype, copy=False)
+
+
+class DeferredZarrFileBuffer(ZarrFileBuffer):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
@@ -11,10 +11,13 @@ import numpy as np
 from parcels._compat import MPI
 from parcels._typing import GridIndexingType, InterpMethodOption, Mesh, TimePeriodic
 from parcels.field import DeferredArray, Field, NestedField, VectorField
-from parcels.grid import Grid
+from parcels.grid import Grid, GridType
 from parcels.gridset import GridSet
 from parcels.particlefile import ParticleFile
+from parcels.tools._cache import LRUCache
+from parcels.tools._domain_decomposition import DomainDecomposition
 from parcels.tools._helpers import deprecated_made_private
+from parcels.tools._snapshot_store import SnapshotStore
 from parcels.tools.converters import TimeConverter, convert_xarray_time_units
 from parcels.tools.loggers import logger
 from parcels.tools.statuscodes import TimeExtrapolationError
@@ -41,6 +44,10 @@ class FieldSet:
         self.gridset = GridSet()
         self._completed: bool = False
         self._particlefile: ParticleFile | None = None
+        self._snapshot_cache: LRUCache | None = None
+        self._chunk_readahead_velocity: float | None = None
+        self._auto_subset_velocity: float | None = None
+        self._domain_decomposition: DomainDecomposition | None = None
         if U:
             self.add_field(U, "U")
             # see #1663 for type-ignore reason
@@ -373,6 +380,7 @@ class FieldSet:
         time_periodic: TimePeriodic = False,
         deferred_load=True,
         chunksize=None,
+        memory_budget=None,
         **kwargs,
     ):
         """Initialises FieldSet object from NetCDF files.
@@ -438,9 +446,19 @@ class FieldSet:
             size of the chunks in dask loading. Default is None (no chunking). Can be None or False (no chunking),
             'auto' (chunking is done in the background, but results in one grid per field individually), or a dict in the format
             ``{parcels_varname: {netcdf_dimname : (parcels_dimname, chunksize_as_int)}, ...}``, where ``parcels_dimname`` is one of ('time', 'depth', 'lat', 'lon')
+        memory_budget : int
+            Maximum memory (in bytes) to hold the full time series of deferred_load Fields in memory.
+            Fields are fully loaded (in the order of variables) as long as the data of all their
+            time steps fits within the remaining budget; the other Fields are deferred loaded.
+            Fully loaded Fields are not read from file during the particle set execution.
+            Not used for Fields with dask chunking, which are read lazily. Default is None (no budget)
         netcdf_engine :
             engine to use for netcdf reading in xarray. Default is 'netcdf',
             but in cases where this doesn't work, setting netcdf_engine='scipy' could help. Accepted options are the same as the ``engine`` parameter in ``xarray.open_dataset()``.
+        time_index : bool
+            Whether to store the time values of the files in an index in the cache directory, from which
+            they are read (instead of the files) as long as the files are unchanged. Use time_index=False
+            e.g. for files in temporary directories. Default is True
         **kwargs :
             Keyword arguments passed to the :class:`parcels.Field` constructor.
 
@@ -470,6 +488,7 @@ class FieldSet:
         fields: dict[str, Field] = {}
         if "creation_log" not in kwargs.keys():
             kwargs["creation_log"] = "from_netcdf"
+        resident_grid_ids = set()  # grids that are fully loaded because they fit in the memory_budget
         for var, name in variables.items():
             # Resolve all matching paths for the current variable
             paths = filenames[var] if type(filenames) is dict and var in filenames else filenames
@@ -522,6 +541,15 @@ class FieldSet:
                         if procpaths == nowpaths:
                             dFiles = fields[procvar]._dataFiles
                             break
+            field_budget = None
+            if memory_budget is not None and deferred_load:
+                field_budget = memory_budget
+                if grid is not None and id(grid) in resident_grid_ids:
+                    cast_data_dtype = kwargs.get("cast_data_dtype", "float32")
+                    if Field._resident_nbytes(grid, cast_data_dtype) > memory_budget:
+                        # a Field on a fully loaded grid must be fully loaded too, so use a new grid instead
+                        grid = None
+                        dFiles = None
             fields[var] = Field.from_netcdf(
                 paths,
                 (var, name),
@@ -533,16 +561,96 @@ class FieldSet:
                 allow_time_extrapolation=allow_time_extrapolation,
                 time_periodic=time_periodic,
                 deferred_load=deferred_load,
+                memory_budget=field_budget,
                 fieldtype=fieldtype,
                 chunksize=varchunksize,
                 dataFiles=dFiles,
                 **kwargs,
             )
+            if field_budget is not None and not fields[var].grid.defer_load and fields[var].grid.tdim > 2:
+                memory_budget -= Field._resident_nbytes(fields[var].grid, fields[var].cast_data_dtype)
+                resident_grid_ids.add(id(fields[var].grid))
 
         u = fields.pop("U", None)
         v = fields.pop("V", None)
         return cls(u, v, fields=fields)
 
+    @classmethod
+    def from_zarr(
+        cls,
+        store,
+        variables,
+        dimensions,
+        indices=None,
+        mesh: Mesh = "spherical",
+        allow_time_extrapolation: bool | None = None,
+        time_periodic: TimePeriodic = False,
+        deferred_load=True,
+        chunksize="auto",
+        **kwargs,
+    ):
+        """Initialises FieldSet object from a (consolidated) Zarr store.
+
+        All variables and time steps are read from the one store. The data is read lazily, per chunk of the store:
+        the chunks that Parcels loads for the particles are aligned with the chunks of the store, and only the
+        chunks that particles touch are read (concurrently) during the particle set execution.
+
+        Parameters
+        ----------
+        store : str
+            Path to the Zarr store.
+        variables : dict
+            Dictionary mapping variables to variable names in the store.
+            Note that the built-in Advection kernels assume that U and V are in m/s
+        dimensions : dict
+            Dictionary mapping data dimensions (lon, lat, depth, time) to dimensions in the store.
+            Note that dimensions can also be a dictionary of dictionaries if
+            dimension names are different for each variable.
+        indices :
+            Optional dictionary of indices for each dimension
+            to read from the store, to allow for reading of subset of data.
+            Default is to read the full extent of each dimension.
+        mesh : str
+            String indicating the type of mesh coordinates and
+            units used during velocity interpolation, see also `this tutorial <../examples/tutorial_unitconverters.ipynb>`__:
+
+            1. spherical (default): Lat and lon in degree, with a
+               correction for zonal velocity U near the poles.
+            2. flat: No conversion, lat/lon are assumed to be in m.
+        allow_time_extrapolation : bool
+            boolean whether to allow for extrapolation
+            (i.e. beyond the last available time snapshot)
+            Default is False if dimensions includes time, else True
+        time_periodic : bool, float or datetime.timedelta
+            To loop periodically over the time component of the Field. It is set to either False or the length of the period (either float in seconds or datetime.timedelta object). (Default: False)
+            This flag overrides the allow_time_extrapolation and sets it to False
+        deferred_load : bool
+            boolean whether to only pre-load data (in deferred mode) or
+            fully load them (default: True).
+        chunksize :
+            Default is 'auto', where every Parcels chunk is one chunk of the store. Can also be a dict in the format
+            ``{parcels_dimname: (store_dimname, chunksize_as_int)}`` (or a dict of those per variable), where the
+            chunk sizes are rounded up to a whole number of store chunks. With None or False, each time step is read
+            from the store as a whole.
+        **kwargs :
+            Keyword arguments passed to :meth:`FieldSet.from_netcdf`.
+        """
+        if "creation_log" not in kwargs.keys():
+            kwargs["creation_log"] = "from_zarr"
+        kwargs["netcdf_engine"] = "zarr"
+        return cls.from_netcdf(
+            store,
+            variables,
+            dimensions,
+            indices=indices,
+            mesh=mesh,
+            allow_time_extrapolation=allow_time_extrapolation,
+            time_periodic=time_periodic,
+            deferred_load=deferred_load,
+            chunksize=chunksize,
+            **kwargs,
+        )
+
     @classmethod
     def from_nemo(
         cls,
@@ -1394,7 +1502,219 @@ class FieldSet:
         """
         setattr(self, name, value)
 
-    def add_periodic_halo(self, zonal=False, meridional=False, halosize=5):
+    def add_snapshot_cache(self, max_bytes):
+        """Keep recently loaded time snapshots of deferred-load Fields in memory.
+
+        Without a cache, only the two time snapshots around the current time are held in memory,
+        so that snapshots are read from file again whenever the simulation revisits them, e.g. for
+        `time_periodic` Fields or when a ParticleSet is executed forward and then backward in time.
+        With a cache, :meth:`computeTimeChunk` first looks up the snapshot (or, for dask-chunked
+        Fields in JIT mode, the data block) in the cache, and only reads from file on a miss. The least
+        recently used snapshots are evicted when the cache exceeds max_bytes. Note that dask-chunked
+        Fields sampled in Scipy mode are read lazily by dask, and do not use the cache.
+
+        Parameters
+        ----------
+        max_bytes : int
+            Maximum memory (in bytes) used by the cached snapshots. Use 0 to remove the cache.
+        """
+        self._snapshot_cache = LRUCache(int(max_bytes), sizeof=lambda a: a.nbytes) if max_bytes else None
+
+    def _deferred_file_fields(self):
+        return [f for f in self.get_fields() if isinstance(f, Field) and f.grid.defer_load and f._dataFiles is not None]
+
+    def write_snapshot_store(self, directory):
+        """Write all time snapshots of the deferred-load Fields to a snapshot store in directory.
+
+        The store holds every snapshot as an uncompressed .npy file (one per Field and time step), with the
+        data as read from file, i.e. before the scaling factor and vmin/vmax are applied. Use
+        :meth:`add_snapshot_store` to memory-map the snapshots from the store in later runs, instead of
+        reading and decompressing them from the original files. Stored snapshots of Fields whose files or
+        indices changed are removed. A store is not used for files that were modified after it was written.
+
+        Parameters
+        ----------
+        directory : str or Path
+            Directory of the snapshot store.
+        """
+        store = SnapshotStore(directory)
+        for f in self._deferred_file_fields():
+            for ti in range(len(f.grid.time_full)):
+                filebuffer, data = f._read_file(ti, f.grid.time_full[ti], f.indices)
+                chunks = [list(c) for c in data.chunks] if isinstance(data, da.core.Array) else None
+                data = np.asarray(data)
+                filebuffer.close()
+                if ti == 0:
+                    index = {"source": f._snapshot_source(), "shape": list(data.shape), "chunks": chunks}
+                    store.write_index(f.name, index)
+                store.write(f.name, ti, data)
+
+    def add_snapshot_store(self, directory):
+        """Memory-map the time snapshots of deferred-load Fields from the snapshot store in directory.
+
+        The store must have been written with :meth:`write_snapshot_store`. Snapshots of Fields that are
+        not in the store are read from file. Dask-chunked Fields keep the chunks they had when the store
+        was written.
+
+        Parameters
+        ----------
+        directory : str or Path
+            Directory of the snapshot store. Use None to read all snapshots from file again.
+        """
+        store = SnapshotStore(directory) if directory is not None else None
+        for f in self._deferred_file_fields():
+            f._snapshot_store = None
+            index = store.index(f.name) if store is not None else None
+            if index is None:
+                continue
+            if index["source"] != f._snapshot_source():
+                warnings.warn(
+                    f"Snapshot store {directory} was written for other (or modified) files or indices of Field "
+                    f"{f.name}; its snapshots are read from file instead.",
+                    FieldSetWarning,
+                    stacklevel=2,
+                )
+                continue
+            f._snapshot_store = store
+
+    def add_node_shared_memory(self):
+        """Share the time snapshots of deferred-load Fields between the MPI ranks on the same node.
+
+        Without sharing, every MPI rank reads and holds its own copy of the snapshots. With sharing, the
+        snapshots of each Field are held once per node, in an MPI-3 shared memory window: the first rank of
+        the node reads them from file, and the other ranks sample them read-only. The ranks of a node
+        synchronise at every load of a snapshot, so all ranks must call this method and execute their
+        ParticleSets over the same times. Only available for Fields without dask chunking, and not with
+        ``compute_on_defer`` (the snapshots are read-only on all but the first rank of a node); without MPI
+        (or with a single rank per node) this has no effect.
+        """
+        if MPI is None:
+            return
+        node_comm = MPI.COMM_WORLD.Split_type(MPI.COMM_TYPE_SHARED)
+        if node_comm.Get_size() == 1:
+            return
+        for f in self._deferred_file_fields():
+            if f.chunksize in [False, None]:
+                f._node_comm = node_comm
+                f.grid._ti = -1
+                f.grid._reload = True  # so that the time window is loaded into shared memory
+
+    @property
+    def _node_shared(self):
+        """Whether Field snapshots are shared between the MPI ranks of a node (see :meth:`add_node_shared_memory`)."""
+        return any(getattr(f, "_node_comm", None) is not None for f in self.get_fields())
+
+    def add_chunk_readahead(self, max_velocity):
+        """Load the dask chunks of Fields ahead of the particles in JIT mode.
+
+        Without readahead, a chunk of a Field is only loaded after a particle has entered it, which
+        interrupts the JIT execution to read the chunk from file. With readahead, all chunks within
+        reach of the particles (based on max_velocity and the time until the next interruption of the
+        execution) are loaded before the execution. Only available for Fields on rectilinear grids.
+
+        Parameters
+        ----------
+        max_velocity : float
+            Upper bound of the particle velocities (in m/s). Use None to switch readahead off.
+        """
+        self._chunk_readahead_velocity = max_velocity
+
+    def add_auto_subsetting(self, max_velocity):
+        """Only read the data around the particles for deferred-load Fields.
+
+        Instead of the whole domain (or the subset given by the indices of :meth:`from_netcdf`), only the
+        data within a window around the bounding box of the particles is read from file. The window has a
+        margin of twice the distance particles can travel in one input time step (based on max_velocity),
+        and is moved, with a reload of the data, when the particles come within one such distance of its
+        edge. The data of the Fields only holds the window, and sampling outside of it (e.g. with a too
+        low max_velocity) raises a FieldSamplingError. Only available for grids with rectilinear lon/lat,
+        on which all Fields are read without dask chunking; the window spans the whole domain in directions
+        with a periodic halo.
+
+        Parameters
+        ----------
+        max_velocity : float
+            Upper bound of the particle velocities (in m/s). Use None to switch auto-subsetting off.
+        """
+        self._auto_subset_velocity = max_velocity
+        if max_velocity is None:
+            for g in self.gridset.grids:
+                if g._subset_window is not None:
+                    g._subset_window = None
+                    g._ti = -1
+                    g._reload = True
+
+    def _subset_grids(self):
+        """Return the grids of deferred-load Fields that can be read in a subset window.
+
+        These are the rectilinear grids (without time-varying depth) on which all Fields are read from file
+        without dask chunking.
+        """
+        fields = [f for f in self.get_fields() if isinstance(f, Field)]
+        grids = {
+            id(f.grid): f.grid
+            for f in fields
+            if f.grid.defer_load
+            and f.grid._gtype in [GridType.RectilinearZGrid, GridType.RectilinearSGrid]
+            and f.grid.depth_field is None
+            and len(f.grid.time_full) > 1
+        }
+        for f in fields:
+            if f._dataFiles is None or f.chunksize not in [False, None]:
+                grids.pop(id(f.grid), None)
+        return list(grids.values())
+
+    def add_domain_decomposition(self, max_velocity):
+        """Decompose the domain into one lon/lat tile per MPI rank, on which the rank advects the particles.
+
+        Instead of the KMeans clustering of the particles at the creation of a ParticleSet, particles are
+        assigned to the rank owning the tile they are in, and :meth:`ParticleSet.execute` moves particles
+        that leave a tile to the rank owning their new tile, after every interruption of the kernel execution.
+        Each rank only reads the data of its tile, plus a halo of the distance particles can travel in one
+        input time step (based on max_velocity), of the deferred-load Fields without dask chunking on
+        rectilinear grids (see also :meth:`add_auto_subsetting`). All ranks must call this method before
+        creating their ParticleSets, and execute them over the same times. Without MPI (or with a single
+        rank) this has no effect.
+
+        Parameters
+        ----------
+        max_velocity : float
+            Upper bound of the particle velocities (in m/s).
+        """
+        if MPI is None or MPI.COMM_WORLD.Get_size() == 1:
+            return
+        comm = MPI.COMM_WORLD
+        grid = self.gridset.grids[0]
+        self._domain_decomposition = DomainDecomposition(
+            (np.nanmin(grid.lon), np.nanmax(grid.lon)), (np.nanmin(grid.lat), np.nanmax(grid.lat)), comm.Get_size()
+        )
+        tile_lon, tile_lat = self._domain_decomposition.tile(comm.Get_rank())
+        corners_lon, corners_lat = np.meshgrid(tile_lon, tile_lat)
+        for g in self._subset_grids():
+            distance = max_velocity * np.max(np.abs(np.diff(g.time_full)))
+            g._subset_window = g._particle_window(corners_lon.ravel(), corners_lat.ravel(), distance)
+            g._ti = -1
+            g._reload = True
+
+    def _update_subset_windows(self, lon, lat):
+        """Move the subset windows (see :meth:`add_auto_subsetting`) that particles at lon, lat come too close to.
+
+        The grids of which the window is moved are reloaded at the next call to :meth:`computeTimeChunk`.
+        """
+        if self._auto_subset_velocity is None or self._domain_decomposition is not None or len(lon) == 0:
+            return
+        for g in self._subset_grids():
+            distance = self._auto_subset_velocity * np.max(np.abs(np.diff(g.time_full)))
+            window = g._subset_window
+            if window is not None:
+                j0, j1, i0, i1 = g._particle_window(lon, lat, distance)
+                if window[0] <= j0 and j1 <= window[1] and window[2] <= i0 and i1 <= window[3]:
+                    continue
+            g._subset_window = g._particle_window(lon, lat, 2 * distance)
+            g._ti = -1
+            g._reload = True
+
+    def add_periodic_halo(self, zonal=False, meridional=False, halosize=5, virtual=False):
         """Add a 'halo' to all :class:`parcels.field.Field` objects in a FieldSet,
         through extending the Field (and lon/lat) by copying a small portion
         of the field on one side of the domain to the other.
@@ -1407,9 +1727,16 @@ class FieldSet:
             Create a halo in meridional direction (Default value = False)
         halosize : int
             size of the halo (in grid points). Default is 5 grid points
+        virtual : bool
+            If True, no data is copied. Instead, the zonal grid index wraps around
+            the domain during sampling, which costs no memory and also works for
+            deferred-load and dask-chunked Fields. Only available for zonal halos
+            on rectilinear grids (Default value = False)
         """
         for grid in self.gridset.grids:
-            grid.add_periodic_halo(zonal, meridional, halosize)
+            grid.add_periodic_halo(zonal, meridional, halosize, virtual=virtual)
+        if virtual:
+            return
         for value in self.__dict__.values():
             if isinstance(value, Field):
                 value.add_periodic_halo(zonal, meridional, halosize)
@@ -1434,6 +1761,16 @@ class FieldSet:
                 if isinstance(v, Field) and (v.name != "U") and (v.name != "V"):
                     v.write(filename)
 
+    def close(self):
+        """Close the files from which the Fields of the FieldSet read their data.
+
+        Files are otherwise closed once all Fields that read from them are garbage collected. Fields that need
+        data from file after this call (e.g. in a later :meth:`ParticleSet.execute`) open their files again.
+        """
+        for f in self.get_fields():
+            if isinstance(f, Field) and f._dataset_lease is not None:
+                f._dataset_lease.release()
+
     def computeTimeChunk(self, time=0.0, dt=1):
         """Load a chunk of three data time steps into the FieldSet.
         This is used when FieldSet uses data imported from netcdf,
@@ -1450,6 +1787,11 @@ class FieldSet:
             time step of the integration scheme, needed to set the direction of time chunk loading.
             Default is 1.
         """
+        if self.compute_on_defer and self._node_shared:
+            raise ValueError(
+                "compute_on_defer is not available with node-shared memory, in which the snapshots are read-only "
+                "on all but the first MPI rank of a node"
+            )
         signdt = np.sign(dt)
         nextTime = np.inf if dt > 0 else -np.inf
 
@@ -1476,43 +1818,66 @@ class FieldSet:
                         for i in range(len(f.data)):
                             del f.data[i, :]
 
-                lib = np if f.chunksize in [False, None] else da
-                if f.gridindexingtype == "pop" and g.zdim > 1:
-                    zd = g.zdim - 1
-                else:
-                    zd = g.zdim
-                data = lib.empty(
-                    (g.tdim, zd, g.ydim - 2 * g.meridional_halo, g.xdim - 2 * g.zonal_halo), dtype=np.float32
-                )
                 f._loaded_time_indices = range(2)
-                for tind in f._loaded_time_indices:
-                    for fb in f.filebuffers:
-                        if fb is not None:
-                            fb.close()
-                        fb = None
-                    data = f.computeTimeChunk(data, tind)
-                data = f._rescale_and_set_minmax(data)
+                if f._parent_ring is None and (f._node_comm is None or f._node_comm.Get_rank() == 0):
+                    lib = np if f.chunksize in [False, None] else da
+                    if f.gridindexingtype == "pop" and g.zdim > 1:
+                        zd = g.zdim - 1
+                    else:
+                        zd = g.zdim
+                    data = lib.empty((g.tdim, zd, *g._read_shape()), dtype=np.float32)
+                    for tind in f._loaded_time_indices:
+                        for fb in f.filebuffers:
+                            if fb is not None:
+                                fb.close()
+                            fb = None
+                        data = f.computeTimeChunk(data, tind)
+                    data = f._rescale_and_set_minmax(data)
+                    data = f._reshape(data)
+                else:
+                    data = None  # read by the first rank of the node (or the parent process), into a shared buffer
 
                 if isinstance(f.data, DeferredArray):
                     f.data = DeferredArray()
-                f.data = f._reshape(data)
-                if not f._chunk_set:
-                    f._chunk_setup()
+                if f._parent_ring is not None:
+                    f._time_ring, f._time_ring_start = f._parent_ring
+                    f.data = f._time_ring if f._time_ring_start == 0 else f._time_ring[::-1]
+                elif f._node_comm is not None:
+                    f.data = f._time_ring = f._node_shared_ring(data)
+                    f._time_ring_start = 0
+                elif isinstance(data, np.ndarray):
+                    f.data = f._time_ring = np.ascontiguousarray(data)
+                    f._time_ring_start = 0
+                else:
+                    f.data = data
+                    f._time_ring = None
+                if not f._chunk_set or g._subset_window is not None:
+                    f._chunk_setup()  # the blocks of a subset window move with the window
                 if len(g._load_chunk) > g._chunk_not_loaded:
                     g._load_chunk = np.where(
                         g._load_chunk == g._chunk_loaded_touched, g._chunk_loading_requested, g._load_chunk
                     )
                     g._load_chunk = np.where(g._load_chunk == g._chunk_deprecated, g._chunk_not_loaded, g._load_chunk)
 
+            elif g._update_status == "updated" and f._time_ring_active:
+                tind = 1 if signdt >= 0 else 0
+                f._loaded_time_indices = [tind]
+                if f.filebuffers[1 - tind] is not None:
+                    f.filebuffers[1 - tind].close()
+                f.filebuffers[1 - tind] = f.filebuffers[tind]
+                f._load_snapshot_into_ring(tind)
+                g._load_chunk = np.where(
+                    g._load_chunk == g._chunk_loaded_touched, g._chunk_loading_requested, g._load_chunk
+                )
+                g._load_chunk = np.where(g._load_chunk == g._chunk_deprecated, g._chunk_not_loaded, g._load_chunk)
+
             elif g._update_status == "updated":
                 lib = np if isinstance(f.data, np.ndarray) else da
                 if f.gridindexingtype == "pop" and g.zdim > 1:
                     zd = g.zdim - 1
                 else:
                     zd = g.zdim
-                data = lib.empty(
-                    (g.tdim, zd, g.ydim - 2 * g.meridional_halo, g.xdim - 2 * g.zonal_halo), dtype=np.float32
-                )
+                data = lib.empty((g.tdim, zd, *g._read_shape()), dtype=np.float32)
                 if signdt >= 0:
                     f._loaded_time_indices = [1]
                     if f.filebuffers[0] is not None:
@@ -1557,26 +1922,19 @@ class FieldSet:
                 )
                 g._load_chunk = np.where(g._load_chunk == g._chunk_deprecated, g._chunk_not_loaded, g._load_chunk)
                 if isinstance(f.data, da.core.Array) and len(g._load_chunk) > 0:
-                    if signdt >= 0:
-                        for block_id in range(len(g._load_chunk)):
-                            if g._load_chunk[block_id] == g._chunk_loaded_touched:
-                                if f._data_chunks[block_id] is None:
-                                    # file chunks were never loaded.
-                                    # happens when field not called by kernel, but shares a grid with another field called by kernel
-                                    break
-                                block = f.get_block(block_id)
-                                f._data_chunks[block_id][0] = None
-                                f._data_chunks[block_id][1] = np.array(f.data.blocks[(slice(2),) + block][1])
-                    else:
-                        for block_id in range(len(g._load_chunk)):
-                            if g._load_chunk[block_id] == g._chunk_loaded_touched:
-                                if f._data_chunks[block_id] is None:
-                                    # file chunks were never loaded.
-                                    # happens when field not called by kernel, but shares a grid with another field called by kernel
-                                    break
-                                block = f.get_block(block_id)
-                                f._data_chunks[block_id][1] = None
-                                f._data_chunks[block_id][0] = np.array(f.data.blocks[(slice(2),) + block][0])
+                    tind = 1 if signdt >= 0 else 0
+                    to_load = []
+                    for block_id in range(len(g._load_chunk)):
+                        if g._load_chunk[block_id] == g._chunk_loaded_touched:
+                            if f._data_chunks[block_id] is None:
+                                # file chunks were never loaded.
+                                # happens when field not called by kernel, but shares a grid with another field called by kernel
+                                break
+                            f._data_chunks[block_id][1 - tind] = None
+                            to_load.append(block_id)
+                    if to_load:
+                        for block_id, block in zip(to_load, f._read_blocks(to_load, [tind]), strict=True):
+                            f._data_chunks[block_id][tind] = block[0]
         # do user-defined computations on fieldset data
         if self.compute_on_defer:
             self.compute_on_defer(self)
@@ -81,9 +81,14 @@ class Grid:
         self._cell_edge_sizes: dict[str, npt.NDArray] = {}
         self._zonal_periodic = False
         self._zonal_halo = 0
+        self._zonal_halo_virtual = False
+        self._zonal_period = 0.0
         self._meridional_halo = 0
         self._lat_flipped = False
         self._defer_load = False
+        self._resident_by_budget = False  # fully loaded, instead of deferred, as it fits in a memory_budget
+        self._subset_window: tuple[int, int, int, int] | None = None
+        self._reload = False  # forces a first load of the time window at the next computeTimeChunk
         self._lonlat_minmax = np.array(
             [np.nanmin(lon), np.nanmax(lon), np.nanmin(lat), np.nanmax(lat)], dtype=np.float32
         )
@@ -138,6 +143,12 @@ class Grid:
     def zonal_halo(self):
         return self._zonal_halo
 
+    def _wrap_lon(self, x):
+        """Map longitude x into [lon[0], lon[0] + period) on a grid with a virtual zonal halo."""
+        if not self._zonal_halo_virtual:
+            return x
+        return self.lon[0] + (x - self.lon[0]) % self._zonal_period
+
     @property
     def defer_load(self):
         return self._defer_load
@@ -241,10 +252,12 @@ class Grid:
                 ("z4d", c_int),
                 ("mesh_spherical", c_int),
                 ("zonal_periodic", c_int),
+                ("zonal_halo_virtual", c_int),
                 ("chunk_info", POINTER(c_int)),
                 ("load_chunk", POINTER(c_int)),
                 ("tfull_min", c_double),
                 ("tfull_max", c_double),
+                ("zonal_period", c_double),
                 ("periods", POINTER(c_int)),
                 ("lonlat_minmax", POINTER(c_float)),
                 ("lon", POINTER(c_float)),
@@ -266,10 +279,12 @@ class Grid:
                 self._z4d,
                 int(self.mesh == "spherical"),
                 int(self.zonal_periodic),
+                int(self._zonal_halo_virtual),
                 (c_int * len(self.chunk_info))(*self.chunk_info),
                 self._load_chunk.ctypes.data_as(POINTER(c_int)),
                 self.time_full[0],
                 self.time_full[-1],
+                self._zonal_period,
                 pointer(self.periods),
                 self.lonlat_minmax.ctypes.data_as(POINTER(c_float)),
                 self.lon.ctypes.data_as(POINTER(c_float)),
@@ -343,7 +358,8 @@ class Grid:
     def _computeTimeChunk(self, f, time, signdt):
         nextTime_loc = np.inf if signdt >= 0 else -np.inf
         periods = self.periods.value if isinstance(self.periods, c_int) else self.periods
-        prev_time_indices = self.time
+        prev_time_indices = None if self._reload else self.time
+        self._reload = False
         if self._update_status == "not_updated":
             if self._ti >= 0:
                 if (
@@ -414,6 +430,65 @@ class Grid:
                 nextTime_loc = self.time[0] + periods * (self.time_full[-1] - self.time_full[0])
         return nextTime_loc
 
+    def _particle_window(self, lon, lat, distance):
+        """Return the window (j0, j1, i0, i1) of the grid nodes within distance (in m) of the particle bounding box.
+
+        The window indexes the data as it is read from file, i.e. before the latitudes are flipped and without
+        periodic halo. In directions with a periodic halo, the window spans the whole domain.
+        """
+        ydim = self.ydim - 2 * self.meridional_halo
+        xdim = self.xdim - 2 * self.zonal_halo
+        latmin, latmax = np.nanmin(lat), np.nanmax(lat)
+        if self.mesh == "spherical":
+            dlat = distance / 1852.0 / 60.0
+            dlon = dlat / np.cos(np.deg2rad(min(max(abs(latmin - dlat), abs(latmax + dlat)), 89.0)))
+        else:
+            dlat = dlon = distance
+
+        def node_range(coords, pos_min, pos_max):
+            if len(coords) == 1:
+                return 0, 1
+            lo = int(np.clip(np.searchsorted(coords, pos_min, side="right") - 1, 0, len(coords) - 2))
+            hi = int(np.clip(np.searchsorted(coords, pos_max), lo + 1, len(coords) - 1))
+            return lo, hi + 1  # at least one cell
+
+        if self.meridional_halo > 0:
+            j0, j1 = 0, ydim
+        else:
+            j0, j1 = node_range(self.lat, latmin - dlat, latmax + dlat)
+            if self._lat_flipped:
+                j0, j1 = ydim - j1, ydim - j0
+        if self.zonal_periodic:
+            i0, i1 = 0, xdim
+        else:
+            i0, i1 = node_range(self.lon, np.nanmin(lon) - dlon, np.nanmax(lon) + dlon)
+        return j0, j1, i0, i1
+
+    def _read_shape(self):
+        """Return the (ydim, xdim) of the data read from file: the subset window if any, else the grid without halo."""
+        if self._subset_window is None:
+            return self.ydim - 2 * self.meridional_halo, self.xdim - 2 * self.zonal_halo
+        j0, j1, i0, i1 = self._subset_window
+        return j1 - j0, i1 - i0
+
+    def _subset_bounds(self):
+        """Return the rows (y0, y1) and columns (x0, x1) of the grid that the data of its deferred-load Fields holds.
+
+        Without a subset window these are the whole grid. With a subset window they are the window, in the
+        (flipped) order of the grid, or the whole grid (including any periodic halo) in directions it spans.
+        """
+        if self._subset_window is None:
+            return 0, self.ydim, 0, self.xdim
+        j0, j1, i0, i1 = self._subset_window
+        ydim, xdim = self.ydim - 2 * self.meridional_halo, self.xdim - 2 * self.zonal_halo
+        if (j0, j1) == (0, ydim):
+            j1 = self.ydim
+        elif self._lat_flipped:
+            j0, j1 = ydim - j1, ydim - j0
+        if (i0, i1) == (0, xdim):
+            i1 = self.xdim
+        return j0, j1, i0, i1
+
     @property
     @deprecated_made_private  # TODO: Remove 6 months after v3.1.0
     def chunk_not_loaded(self):
@@ -459,6 +534,10 @@ class Grid:
     def _chunk_loaded(self):
         return [2, 3]
 
+    @property
+    def _chunk_outside_window(self):
+        return -1  # block of the grid outside the subset window, of which the data is not read
+
 
 class RectilinearGrid(Grid):
     """Rectilinear Grid class
@@ -495,7 +574,7 @@ class RectilinearGrid(Grid):
     def ydim(self):
         return self.lat.size
 
-    def add_periodic_halo(self, zonal: bool, meridional: bool, halosize: int = 5):
+    def add_periodic_halo(self, zonal: bool, meridional: bool, halosize: int = 5, virtual: bool = False):
         """Add a 'halo' to the Grid, through extending the Grid (and lon/lat)
         similarly to the halo created for the Fields
 
@@ -507,7 +586,17 @@ class RectilinearGrid(Grid):
             Create a halo in meridional direction
         halosize : int
             size of the halo (in grid points). Default is 5 grid points
+        virtual : bool
+            If True, the zonal halo is not copied but emulated by wrapping the zonal index
+            around the domain during sampling, so that lon and all Field data keep their size.
+            Only available for zonal halos. Default is False
         """
+        if virtual:
+            if meridional:
+                raise NotImplementedError("Virtual periodic halos are only available in the zonal direction")
+            if zonal:
+                self._add_virtual_zonal_halo()
+            return
         if zonal:
             lonshift = self.lon[-1] - 2 * self.lon[0] + self.lon[1]
             if not np.allclose(self.lon[1] - self.lon[0], self.lon[-1] - self.lon[-2]):
@@ -539,6 +628,21 @@ class RectilinearGrid(Grid):
         if isinstance(self, RectilinearSGrid):
             self._add_Sdepth_periodic_halo(zonal, meridional, halosize)
 
+    def _add_virtual_zonal_halo(self):
+        if self.xdim < 2 or not np.all(np.diff(self.lon) > 0):
+            raise ValueError("A virtual zonal halo requires a strictly increasing longitude vector of at least 2 nodes")
+        if not np.allclose(self.lon[1] - self.lon[0], self.lon[-1] - self.lon[-2]):
+            warnings.warn(
+                "The virtual zonal halo connects the east and west of current grid, "
+                "with a dx = lon[1]-lon[0] between the last and first nodes of the grid. "
+                "In your grid, lon[1]-lon[0] != lon[-1]-lon[-2]. Is the halo computed as you expect?",
+                FieldSetWarning,
+                stacklevel=3,
+            )
+        self._zonal_period = float(self.lon[-1] - 2 * self.lon[0] + self.lon[1])
+        self._zonal_periodic = True
+        self._zonal_halo_virtual = True
+
 
 class RectilinearZGrid(RectilinearGrid):
     """Rectilinear Z Grid.
@@ -687,7 +791,7 @@ class CurvilinearGrid(Grid):
     def ydim(self):
         return self.lon.shape[0]
 
-    def add_periodic_halo(self, zonal, meridional, halosize=5):
+    def add_periodic_halo(self, zonal, meridional, halosize=5, virtual=False):
         """Add a 'halo' to the Grid, through extending the Grid (and lon/lat)
         similarly to the halo created for the Fields
 
@@ -699,7 +803,11 @@ class CurvilinearGrid(Grid):
             Create a halo in meridional direction
         halosize : int
             size of the halo (in grid points). Default is 5 grid points
+        virtual : bool
+            Virtual (zero-copy) halos are not available on curvilinear grids. Default is False
         """
+        if virtual:
+            raise NotImplementedError("Virtual periodic halos are only available for rectilinear grids")
         if zonal:
             lonshift = self.lon[:, -1] - 2 * self.lon[:, 0] + self.lon[:, 1]
             if not np.allclose(self.lon[:, 1] - self.lon[:, 0], self.lon[:, -1] - self.lon[:, -2]):
@@ -21,6 +21,8 @@ class GridSet:
             sameGrid = True
             if grid.time_origin != g.time_origin:
                 continue
+            if grid.defer_load != g.defer_load and (grid._resident_by_budget or g._resident_by_budget):
+                continue  # a Field that did not fit in the memory_budget keeps its own deferred grid
             for attr in ["lon", "lat", "depth", "time"]:
                 gattr = getattr(g, attr)
                 gridattr = getattr(grid, attr)
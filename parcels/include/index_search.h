@@ -38,10 +38,10 @@ typedef struct
 typedef struct
 {
   int xdim, ydim, zdim, tdim, z4d;
-  int sphere_mesh, zonal_periodic;
+  int sphere_mesh, zonal_periodic, zonal_halo_virtual;
   int *chunk_info;
   int *load_chunk;
-  double tfull_min, tfull_max;
+  double tfull_min, tfull_max, zonal_period;
   int* periods;
   float *lonlat_minmax;
   float *lon, *lat, *depth;
@@ -122,6 +122,35 @@ static inline StatusCode search_indices_vertical_z(type_coord z, int zdim, float
   return SUCCESS;
 }
 
+/* Depth of s-level zii at the (xsi, eta) location in cell (xi, yi), interpolated in time for 4D depth arrays.
+ * Levels are evaluated on demand so that the vertical search only touches O(log zdim) levels. */
+static inline float s_level_depth(int zii, int xdim, int ydim, int zdim, float *zvals, int xi, int yi,
+                                  double xsi, double eta, int z4d, int ti, int ti1, double tfrac)
+{
+  /* with a virtual zonal halo, the last cell (xi == xdim-1) wraps around onto the first column */
+  int xi1 = (xi < xdim-1) ? xi+1 : 0;
+  if (z4d == 1){
+    float (*zvalstab)[zdim][ydim][xdim] = (float (*)[zdim][ydim][xdim]) zvals;
+    double zt0, zt1;
+    zt0 = (1-xsi)*(1-eta) * zvalstab[ti ][zii][yi  ][xi  ]
+        + (  xsi)*(1-eta) * zvalstab[ti ][zii][yi  ][xi1 ]
+        + (  xsi)*(  eta) * zvalstab[ti ][zii][yi+1][xi1 ]
+        + (1-xsi)*(  eta) * zvalstab[ti ][zii][yi+1][xi  ];
+    zt1 = (1-xsi)*(1-eta) * zvalstab[ti1][zii][yi  ][xi  ]
+        + (  xsi)*(1-eta) * zvalstab[ti1][zii][yi  ][xi1 ]
+        + (  xsi)*(  eta) * zvalstab[ti1][zii][yi+1][xi1 ]
+        + (1-xsi)*(  eta) * zvalstab[ti1][zii][yi+1][xi  ];
+    return zt0 + (zt1 - zt0) * (float)tfrac;
+  }
+  else{
+    float (*zvalstab)[ydim][xdim] = (float (*)[ydim][xdim]) zvals;
+    return (1-xsi)*(1-eta) * zvalstab[zii][yi  ][xi  ]
+         + (  xsi)*(1-eta) * zvalstab[zii][yi  ][xi1 ]
+         + (  xsi)*(  eta) * zvalstab[zii][yi+1][xi1 ]
+         + (1-xsi)*(  eta) * zvalstab[zii][yi+1][xi  ];
+  }
+}
+
 static inline StatusCode search_indices_vertical_s(type_coord z, int xdim, int ydim, int zdim, float *zvals,
                                     int xi, int yi, int *zi, double xsi, double eta, double *zeta,
                                     int z4d, int ti, int tdim, double time, double t0, double t1, int interp_method)
@@ -130,52 +159,52 @@ static inline StatusCode search_indices_vertical_s(type_coord z, int xdim, int y
     xsi = 1;
     eta = 1;
   }
-  float zcol[zdim];
-  int zii;
+  int ti1 = ti;
+  double tfrac = 0;
   if (z4d == 1){
-    float (*zvalstab)[zdim][ydim][xdim] = (float (*)[zdim][ydim][xdim]) zvals;
-    int ti1 = ti;
     if (ti < tdim-1)
        ti1= ti+1;
-    double zt0, zt1;
-    for (zii=0; zii < zdim; zii++){
-      zt0 = (1-xsi)*(1-eta) * zvalstab[ti ][zii][yi  ][xi  ]
-          + (  xsi)*(1-eta) * zvalstab[ti ][zii][yi  ][xi+1]
-          + (  xsi)*(  eta) * zvalstab[ti ][zii][yi+1][xi+1]
-          + (1-xsi)*(  eta) * zvalstab[ti ][zii][yi+1][xi  ];
-      zt1 = (1-xsi)*(1-eta) * zvalstab[ti1][zii][yi  ][xi  ]
-          + (  xsi)*(1-eta) * zvalstab[ti1][zii][yi  ][xi+1]
-          + (  xsi)*(  eta) * zvalstab[ti1][zii][yi+1][xi+1]
-          + (1-xsi)*(  eta) * zvalstab[ti1][zii][yi+1][xi  ];
-      zcol[zii] = zt0 + (zt1 - zt0) * (float)((time - t0) / (t1 - t0));
-    }
-
+    tfrac = (time - t0) / (t1 - t0);
   }
-  else{
-    float (*zvalstab)[ydim][xdim] = (float (*)[ydim][xdim]) zvals;
-    for (zii=0; zii < zdim; zii++){
-      zcol[zii] = (1-xsi)*(1-eta) * zvalstab[zii][yi  ][xi  ]
-                + (  xsi)*(1-eta) * zvalstab[zii][yi  ][xi+1]
-                + (  xsi)*(  eta) * zvalstab[zii][yi+1][xi+1]
-                + (1-xsi)*(  eta) * zvalstab[zii][yi+1][xi  ];
+#define ZCOL(k) s_level_depth(k, xdim, ydim, zdim, zvals, xi, yi, xsi, eta, z4d, ti, ti1, tfrac)
+
+  float ztop = ZCOL(0);
+  float zbot = ZCOL(zdim-1);
+  /* sign flips the comparisons so that the search below always works on an increasing column */
+  float sign = (zbot > ztop) ? 1 : -1;
+  if (sign*z < sign*ztop) {return ERRORTHROUGHSURFACE;}
+  if (sign*z > sign*zbot) {return ERROROUTOFBOUNDS;}
+
+  /* bracket the level with the particle's previous index first, as particles rarely move more than one level */
+  int lo = 0, hi = zdim-1;
+  float zlo = ztop, zhi = zbot;
+  if (*zi > 0 && *zi < zdim-1){
+    float zhint = ZCOL(*zi);
+    if (sign*z < sign*zhint){
+      hi = *zi;
+      zhi = zhint;
+    }
+    else{
+      lo = *zi;
+      zlo = zhint;
     }
   }
-
-  if (zcol[zdim-1] > zcol[0]){
-    if (z < zcol[0]) {return ERRORTHROUGHSURFACE;}
-    if (z > zcol[zdim-1]) {return ERROROUTOFBOUNDS;}
-    while (*zi < zdim-1 && z > zcol[*zi+1]) ++(*zi);
-    while (*zi > 0 && z < zcol[*zi]) --(*zi);
-  }
-  else{
-    if (z > zcol[0]) {return ERRORTHROUGHSURFACE;}
-    if (z < zcol[zdim-1]) {return ERROROUTOFBOUNDS;}
-    while (*zi < zdim-1 && z < zcol[*zi+1]) ++(*zi);
-    while (*zi > 0 && z > zcol[*zi]) --(*zi);
+  while (hi - lo > 1){
+    int mid = (lo + hi) / 2;
+    float zmid = ZCOL(mid);
+    if (sign*z > sign*zmid){
+      lo = mid;
+      zlo = zmid;
+    }
+    else{
+      hi = mid;
+      zhi = zmid;
+    }
   }
-  if (*zi == zdim-1) {--*zi;}
+#undef ZCOL
+  *zi = lo;
 
-  *zeta = (z - zcol[*zi]) / (zcol[*zi+1] - zcol[*zi]);
+  *zeta = (z - zlo) / (zhi - zlo);
   return SUCCESS;
 }
 
@@ -234,6 +263,23 @@ static inline StatusCode search_indices_rectilinear(type_coord x, type_coord y,
     *xi = 0;
     *xsi = 0;
   }
+  else if (grid->zonal_halo_virtual == 1){
+    /* virtual zonal halo: wrap x into [lon[0], lon[0]+period), the cell xdim-1 spans lon[xdim-1] to lon[0]+period */
+    double period = grid->zonal_period;
+    double xw = xvals[0] + fmod(x - xvals[0], period);
+    if (xw < xvals[0]) xw += period;
+    if (xw >= xvals[xdim-1]){
+      *xi = xdim-1;
+      *xsi = (xw - xvals[xdim-1]) / (xvals[0] + period - xvals[xdim-1]);
+    }
+    else{
+      if (*xi < 0) *xi = 0;
+      if (*xi > xdim-2) *xi = xdim-2;
+      while (*xi < xdim-2 && xw > xvals[*xi+1]) ++(*xi);
+      while (*xi > 0 && xw < xvals[*xi]) --(*xi);
+      *xsi = (xw - xvals[*xi]) / (xvals[*xi+1] - xvals[*xi]);
+    }
+  }
   else if (sphere_mesh == 0){
     while (*xi < xdim-1 && x > xvals[*xi+1]) ++(*xi);
     while (*xi > 0 && x < xvals[*xi]) --(*xi);
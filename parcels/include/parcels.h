@@ -16,13 +16,65 @@ extern "C" {
 #define min(X, Y) (((X) < (Y)) ? (X) : (Y))
 #define max(X, Y) (((X) > (Y)) ? (X) : (Y))
 
+typedef enum
+  {
+    FLOAT32=0, FLOAT16=1, INT16=2, UINT16=3
+  } DataType;
+
 typedef struct
 {
-  int xdim, ydim, zdim, tdim, igrid, allow_time_extrapolation, time_periodic;
+  int xdim, ydim, zdim, tdim, igrid, allow_time_extrapolation, time_periodic, time_ring_start;
+  int data_type, data_zero_code;
+  double data_scale;
   float ****data_chunks;
   CGrid *grid;
 } CField;
 
+/* Slot in the data of time index ti; the two snapshots of deferred-load fields are kept in a ring buffer */
+static inline int time_slot(CField *f, int ti)
+{
+  return (ti + f->time_ring_start) % f->tdim;
+}
+
+/* Convert an IEEE 754 half-precision number, given by its bits h, to float */
+static inline float half_to_float(unsigned short h)
+{
+  unsigned int sign = (unsigned int) (h & 0x8000) << 16;
+  unsigned int exponent = (h >> 10) & 0x1f;
+  unsigned int mantissa = h & 0x3ff;
+  union {unsigned int u; float f;} bits;
+  if (exponent == 0){  // zero or subnormal
+    float value = ldexpf((float) mantissa, -24);
+    return sign ? -value : value;
+  }
+  if (exponent == 0x1f)  // inf or nan
+    bits.u = sign | 0x7f800000 | (mantissa << 13);
+  else
+    bits.u = sign | ((exponent + 112) << 23) | (mantissa << 13);
+  return bits.f;
+}
+
+/* Value i of a data block of field f, decoded from the storage type of the field */
+static inline float field_value(CField *f, void *block, size_t i)
+{
+  switch (f->data_type){
+    case FLOAT16:
+      return half_to_float(((unsigned short *) block)[i]);
+    case INT16:
+      return (float) ((((short *) block)[i] - f->data_zero_code) * f->data_scale);
+    case UINT16:
+      return (float) ((((unsigned short *) block)[i] - f->data_zero_code) * f->data_scale);
+    default:
+      return ((float *) block)[i];
+  }
+}
+
+/* Index of element [ti][zi][yi][xi] in a data block of shape [tdim][zdim][ydim][xdim] */
+static inline size_t block_index(int ti, int zi, int yi, int xi, int zdim, int ydim, int xdim)
+{
+  return (((size_t) ti * zdim + zi) * ydim + yi) * xdim + xi;
+}
+
 /* Bilinear interpolation routine for 2D grid */
 static inline StatusCode spatial_interpolation_bilinear(double xsi, double eta, float data[2][2], float *value)
 {
@@ -241,6 +293,14 @@ static inline StatusCode spatial_interpolation_nearest3D(double xsi, double eta,
   return SUCCESS;
 }
 
+/* Column index xi, wrapped onto the first column when the grid has a virtual zonal halo */
+static inline int zonal_wrap_index(CStructuredGrid *grid, int xi)
+{
+  if ((grid->zonal_halo_virtual == 1) && (xi >= grid->xdim))
+    return xi - grid->xdim;
+  return xi;
+}
+
 static inline int getBlock2D(int *chunk_info, int yi, int xi, int *block, int *index_local)
 {
   int ndim = chunk_info[0];
@@ -280,7 +340,11 @@ static inline StatusCode getCell2D(CField *f, int xi, int yi, int ti, float cell
 
   int tii, yii, xii;
 
+  if ((grid->zonal_halo_virtual == 1) && (xi < 0))
+    xi += grid->xdim;
   int blockid = getBlock2D(chunk_info, yi, xi, block, ilocal);
+  if (grid->load_chunk[blockid] < 0)  // outside the subset window of the data
+    return ERROR;
   if (grid->load_chunk[blockid] < 2){
     grid->load_chunk[blockid] = 1;
     return REPEAT;
@@ -297,7 +361,9 @@ static inline StatusCode getCell2D(CField *f, int xi, int yi, int ti, float cell
     for (tii=0; tii<2; ++tii){
       for (yii=0; yii<2; ++yii){
         for (xii=0; xii<2; ++xii){
-          blockid = getBlock2D(chunk_info, yi+yii, xi+xii, block, ilocal);
+          blockid = getBlock2D(chunk_info, yi+yii, zonal_wrap_index(grid, xi+xii), block, ilocal);
+          if (grid->load_chunk[blockid] < 0)  // outside the subset window of the data
+            return ERROR;
           if (grid->load_chunk[blockid] < 2){
             grid->load_chunk[blockid] = 1;
             return REPEAT;
@@ -307,9 +373,8 @@ static inline StatusCode getCell2D(CField *f, int xi, int yi, int ti, float cell
           ydim = chunk_info[1+ndim+block[0]];
           yshift = chunk_info[1];
           xdim = chunk_info[1+ndim+yshift+block[1]];
-          float (*data_block)[zdim][ydim][xdim] = (float (*)[zdim][ydim][xdim]) f->data_chunks[blockid];
-          float (*data)[xdim] = (float (*)[xdim]) (data_block[ti+tii]);
-          cell_data[tii][yii][xii] = data[ilocal[0]][ilocal[1]];
+          cell_data[tii][yii][xii] = field_value(f, f->data_chunks[blockid],
+                                                 block_index(time_slot(f, ti+tii), 0, ilocal[0], ilocal[1], zdim, ydim, xdim));
         }
       }
       if (first_tstep_only == 1)
@@ -318,14 +383,15 @@ static inline StatusCode getCell2D(CField *f, int xi, int yi, int ti, float cell
   }
   else
   {
-    float (*data_block)[zdim][ydim][xdim] = (float (*)[zdim][ydim][xdim]) f->data_chunks[blockid];
+    void *data_block = f->data_chunks[blockid];
     for (tii=0; tii<2; ++tii){
-      float (*data)[xdim] = (float (*)[xdim]) (data_block[ti+tii]);
+      int slot = time_slot(f, ti+tii);
       int xiid = ((xdim==1) ? 0 : 1);
       int yiid = ((ydim==1) ? 0 : 1);
       for (yii=0; yii<2; yii++)
         for (xii=0; xii<2; xii++)
-          cell_data[tii][yii][xii] = data[ilocal[0]+(yii*yiid)][ilocal[1]+(xii*xiid)];
+          cell_data[tii][yii][xii] = field_value(f, data_block,
+                                                 block_index(slot, 0, ilocal[0]+(yii*yiid), ilocal[1]+(xii*xiid), zdim, ydim, xdim));
       if (first_tstep_only == 1)
          break;
     }
@@ -373,7 +439,11 @@ static inline StatusCode getCell3D(CField *f, int xi, int yi, int zi, int ti, fl
 
   int tii, zii, yii, xii;
 
+  if ((grid->zonal_halo_virtual == 1) && (xi < 0))
+    xi += grid->xdim;
   int blockid = getBlock3D(chunk_info, zi, yi, xi, block, ilocal);
+  if (grid->load_chunk[blockid] < 0)  // outside the subset window of the data
+    return ERROR;
   if (grid->load_chunk[blockid] < 2){
     grid->load_chunk[blockid] = 1;
     return REPEAT;
@@ -392,7 +462,9 @@ static inline StatusCode getCell3D(CField *f, int xi, int yi, int zi, int ti, fl
       for (zii=0; zii<2; ++zii){
         for (yii=0; yii<2; ++yii){
           for (xii=0; xii<2; ++xii){
-            blockid = getBlock3D(chunk_info, zi+zii, yi+yii, xi+xii, block, ilocal);
+            blockid = getBlock3D(chunk_info, zi+zii, yi+yii, zonal_wrap_index(grid, xi+xii), block, ilocal);
+            if (grid->load_chunk[blockid] < 0)  // outside the subset window of the data
+              return ERROR;
             if (grid->load_chunk[blockid] < 2){
               grid->load_chunk[blockid] = 1;
               return REPEAT;
@@ -403,9 +475,8 @@ static inline StatusCode getCell3D(CField *f, int xi, int yi, int zi, int ti, fl
             ydim = chunk_info[1+ndim+zshift+block[1]];
             yshift = chunk_info[1+1];
             xdim = chunk_info[1+ndim+zshift+yshift+block[2]];
-            float (*data_block)[zdim][ydim][xdim] = (float (*)[zdim][ydim][xdim]) f->data_chunks[blockid];
-            float (*data)[ydim][xdim] = (float (*)[ydim][xdim]) (data_block[ti+tii]);
-            cell_data[tii][zii][yii][xii] = data[ilocal[0]][ilocal[1]][ilocal[2]];
+            cell_data[tii][zii][yii][xii] = field_value(f, f->data_chunks[blockid],
+                                                        block_index(time_slot(f, ti+tii), ilocal[0], ilocal[1], ilocal[2], zdim, ydim, xdim));
           }
         }
       }
@@ -415,16 +486,17 @@ static inline StatusCode getCell3D(CField *f, int xi, int yi, int zi, int ti, fl
   }
   else
   {
-    float (*data_block)[zdim][ydim][xdim] = (float (*)[zdim][ydim][xdim]) f->data_chunks[blockid];
+    void *data_block = f->data_chunks[blockid];
     for (tii=0; tii<2; ++tii){
-      float (*data)[ydim][xdim] = (float (*)[ydim][xdim]) (data_block[ti+tii]);
+      int slot = time_slot(f, ti+tii);
       int xiid = ((xdim==1) ? 0 : 1);
       int yiid = ((ydim==1) ? 0 : 1);
       int ziid = ((zdim==1) ? 0 : 1);
       for (zii=0; zii<2; zii++)
         for (yii=0; yii<2; yii++)
           for (xii=0; xii<2; xii++)
-            cell_data[tii][zii][yii][xii] = data[ilocal[0]+(zii*ziid)][ilocal[1]+(yii*yiid)][ilocal[2]+(xii*xiid)];
+            cell_data[tii][zii][yii][xii] = field_value(f, data_block,
+                                                        block_index(slot, ilocal[0]+(zii*ziid), ilocal[1]+(yii*yiid), ilocal[2]+(xii*xiid), zdim, ydim, xdim));
       if (first_tstep_only == 1)
          break;
     }
@@ -576,7 +648,8 @@ static inline StatusCode spatial_interpolation_UV_c_grid(double xsi, double eta,
     float *xgrid = grid->lon;
     float *ygrid = grid->lat;
     for (iN=0; iN < 4; ++iN){
-      xgrid_loc[iN] = xgrid[xi+min(1, (iN%3))];
+      int xiN = xi+min(1, (iN%3));
+      xgrid_loc[iN] = (xiN < xdim) ? xgrid[xiN] : xgrid[0] + grid->zonal_period;
       ygrid_loc[iN] = ygrid[yi+iN/2];
     }
   }
@@ -740,7 +813,8 @@ static inline StatusCode spatial_interpolation_UVW_c_grid(double xsi, double eta
     float *xgrid = grid->lon;
     float *ygrid = grid->lat;
     for (iN=0; iN < 4; ++iN){
-      xgrid_loc[iN] = xgrid[xi+min(1, (iN%3))];
+      int xiN = xi+min(1, (iN%3));
+      xgrid_loc[iN] = (xiN < xdim) ? xgrid[xiN] : xgrid[0] + grid->zonal_period;
       ygrid_loc[iN] = ygrid[yi+iN/2];
     }
   }
@@ -773,15 +847,15 @@ static inline StatusCode spatial_interpolation_UVW_c_grid(double xsi, double eta
   if (grid->z4d == 1){
     float (*zvals)[zdim][ydim][xdim] = (float (*)[zdim][ydim][xdim]) grid->depth;
     for (iN=0; iN < 4; ++iN){
-      pz[iN] = zvals[ti][zi][yi+iN/2][xi+min(1, (iN%3))];
-      pz[iN+4] = zvals[ti][zi+1][yi+iN/2][xi+min(1, (iN%3))];
+      pz[iN] = zvals[ti][zi][yi+iN/2][zonal_wrap_index(grid, xi+min(1, (iN%3)))];
+      pz[iN+4] = zvals[ti][zi+1][yi+iN/2][zonal_wrap_index(grid, xi+min(1, (iN%3)))];
     }
   }
   else{
     float (*zvals)[ydim][xdim] = (float (*)[ydim][xdim]) grid->depth;
     for (iN=0; iN < 4; ++iN){
-      pz[iN] = zvals[zi][yi+iN/2][xi+min(1, (iN%3))];
-      pz[iN+4] = zvals[zi+1][yi+iN/2][xi+min(1, (iN%3))];
+      pz[iN] = zvals[zi][yi+iN/2][zonal_wrap_index(grid, xi+min(1, (iN%3)))];
+      pz[iN+4] = zvals[zi+1][yi+iN/2][zonal_wrap_index(grid, xi+min(1, (iN%3)))];
     }
   }
 
@@ -11,8 +11,10 @@ import sys
 import textwrap
 import types
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
-from ctypes import byref, c_double, c_int
+from ctypes import POINTER, byref, c_double, c_int
+from itertools import pairwise
 from time import time as ostime
 
 import numpy as np
@@ -28,7 +30,7 @@ from parcels.application_kernels.advection import (
     AdvectionRK45,
 )
 from parcels.compilation.codegenerator import KernelGenerator, LoopGenerator
-from parcels.field import Field, NestedField, VectorField
+from parcels.field import _CFIELD_DATA_TYPES, _COMPACT_DATA_TYPES, Field, NestedField, VectorField
 from parcels.grid import GridType
 from parcels.tools.global_statics import get_cache_dir
 from parcels.tools.loggers import logger
@@ -43,6 +45,17 @@ from parcels.tools.warnings import KernelWarning
 
 __all__ = ["Kernel", "BaseKernel"]
 
+# States of the particles after the kernel loop that do not need handling, and error states that end the handling
+_NO_ERROR_STATES = [StatusCode.Success, StatusCode.Evaluate]
+_FINAL_STATES = [
+    StatusCode.StopExecution,
+    StatusCode.StopAllExecution,
+    StatusCode.ErrorTimeExtrapolation,
+    StatusCode.ErrorOutOfBounds,
+    StatusCode.ErrorThroughSurface,
+    StatusCode.Error,
+]
+
 
 class BaseKernel(abc.ABC):
     """Superclass for 'normal' and Interactive Kernels"""
@@ -72,6 +85,7 @@ class BaseKernel(abc.ABC):
         self.funcname = funcname or pyfunc.__name__
         self.name = f"{ptype.name}{self.funcname}"
         self.ccode = ""
+        self._draws_random = False  # whether the C code draws from the random number generator shared by all threads
         self.funcvars = funcvars
         self.funccode = funccode
         self.py_ast = py_ast
@@ -260,6 +274,7 @@ class Kernel(BaseKernel):
                         if sF_name != "not_defined":
                             self.field_args[sF_name] = getattr(f, sF_component)
             self.const_args = kernelgen.const_args
+            self._draws_random = kernelgen.draws_random
             loopgen = LoopGenerator(fieldset, ptype)
             if os.path.isfile(self._c_include):
                 with open(self._c_include) as f:
@@ -582,8 +597,8 @@ class Kernel(BaseKernel):
             for f in pset.fieldset.get_fields():
                 if isinstance(f, (VectorField, NestedField)):
                     continue
-                if f.data.dtype != np.float32:
-                    raise RuntimeError(f"Field {f.name} data needs to be float32 in JIT mode")
+                if f.data.dtype.type not in _CFIELD_DATA_TYPES:
+                    raise RuntimeError(f"Field {f.name} data needs to be float32, float16, int16 or uint16 in JIT mode")
                 if f in self.field_args.values():
                     f._chunk_data()
                 else:
@@ -605,34 +620,96 @@ class Kernel(BaseKernel):
                 if not g.lat.flags.c_contiguous:
                     g._lat = np.array(g.lat, order="C")
 
-    def execute_jit(self, pset, endtime, dt):
-        """Invokes JIT engine to perform the core update loop."""
+    def request_chunks_ahead(self, pset, endtime, dt):
+        """Requests loading of the Field chunks that particles can reach before endtime."""
+        if pset.fieldset is None or pset.fieldset._chunk_readahead_velocity is None:
+            return
+        time = pset.particledata.data["time"]
+        if len(time) == 0:
+            return
+        interval = np.nanmax(np.append(np.abs(endtime - time), abs(dt)))
+        distance = pset.fieldset._chunk_readahead_velocity * interval
+        for f in self.field_args.values():
+            if isinstance(f, (VectorField, NestedField)):
+                continue
+            f._request_chunks_ahead(
+                pset.particledata.data["lon"],
+                pset.particledata.data["lat"],
+                pset.particledata.data["depth"],
+                distance,
+            )
+
+    def execute_jit(self, pset, endtime, dt, nthreads=None, indices=None):
+        """Invokes JIT engine to perform the core update loop.
+
+        With nthreads, the particles are split into contiguous shards (views on the particle data), over which
+        the C loop is executed in a pool of threads, which run in parallel as ctypes releases the GIL. Kernels
+        that draw random numbers are executed in one thread, so that their results are reproducible.
+        With indices, the C loop only visits the particles at these indices (in one thread).
+        Returns StatusCode.StopAllExecution if a particle (in any of the shards) stopped all execution.
+        """
+        self.request_chunks_ahead(pset, endtime, dt)
         self.load_fieldset_jit(pset)
 
         fargs = [byref(f.ctypes_struct) for f in self.field_args.values()]
         fargs += [c_double(f) for f in self.const_args.values()]
-        particle_data = byref(pset.ctypes_struct)
-        return self._function(c_int(len(pset)), particle_data, c_double(endtime), c_double(dt), *fargs)
+        if indices is not None:
+            indices = np.ascontiguousarray(indices, dtype=np.int32)
+            pindices = indices.ctypes.data_as(POINTER(c_int))
+            particle_data = byref(pset.ctypes_struct)
+            self._function(c_int(len(indices)), pindices, particle_data, c_double(endtime), c_double(dt), *fargs)
+            return self._stopped_all(pset.particledata.state[indices])
+        if nthreads is None or nthreads < 2 or len(pset) < 2 or self._draws_random:
+            particle_data = byref(pset.ctypes_struct)
+            self._function(c_int(len(pset)), None, particle_data, c_double(endtime), c_double(dt), *fargs)
+            return self._stopped_all(pset.particledata.state)
+
+        # More shards than threads, to balance particles that take longer. The threads only share the Field data and
+        # the load_chunk flags, to which every thread writes the same value (only Python loads chunks in between).
+        bounds = np.linspace(0, len(pset), min(4 * nthreads, len(pset)) + 1).astype(int)
+        shards = [pset.particledata.cstruct(start, stop) for start, stop in pairwise(bounds)]
+
+        def execute_shard(i):
+            npart = c_int(int(bounds[i + 1] - bounds[i]))
+            self._function(npart, None, byref(shards[i]), c_double(endtime), c_double(dt), *fargs)
+            return self._stopped_all(pset.particledata.state[bounds[i] : bounds[i + 1]])
+
+        with ThreadPoolExecutor(nthreads) as executor:
+            results = list(executor.map(execute_shard, range(len(shards))))
+        if StatusCode.StopAllExecution in results:
+            return StatusCode.StopAllExecution
 
-    def execute_python(self, pset, endtime, dt):
-        """Performs the core update loop via Python."""
+    @staticmethod
+    def _stopped_all(states):
+        """Return StatusCode.StopAllExecution if any of the states is StopAllExecution (the C loop returns nothing)."""
+        if np.any(states == StatusCode.StopAllExecution):
+            return StatusCode.StopAllExecution
+
+    def execute_python(self, pset, endtime, dt, indices=None):
+        """Performs the core update loop via Python (only over the particles at indices, if given)."""
         if self.fieldset is not None:
             for f in self.fieldset.get_fields():
                 if isinstance(f, (VectorField, NestedField)):
                     continue
-                f.data = np.array(f.data)
+                if f.cast_data_dtype in _COMPACT_DATA_TYPES:
+                    raise RuntimeError(
+                        f"Field {f.name} with {np.dtype(f.cast_data_dtype)} data is only supported in JIT mode"
+                    )
+                f.data = np.asarray(f.data)
 
         if not self.scipy_positionupdate_kernels_added:
             self.add_scipy_positionupdate_kernels()
             self.scipy_positionupdate_kernels_added = True
 
-        for p in pset:
+        particle = pset.particledata._proxy_class()
+        for i in range(len(pset)) if indices is None else indices:
+            p = particle(i)
             self.evaluate_particle(p, endtime)
             if p.state == StatusCode.StopAllExecution:
                 return StatusCode.StopAllExecution
 
-    def execute(self, pset, endtime, dt):
-        """Execute this Kernel over a ParticleSet for several timesteps."""
+    def execute(self, pset, endtime, dt, nthreads=None):
+        """Execute this Kernel over a ParticleSet for several timesteps (in JIT mode optionally in nthreads threads)."""
         pset.particledata.state[:] = StatusCode.Evaluate
 
         if abs(dt) < 1e-6:
@@ -651,7 +728,7 @@ class Kernel(BaseKernel):
 
         # Execute the kernel over the particle set
         if self.ptype.uses_jit:
-            self.execute_jit(pset, endtime, dt)
+            self.execute_jit(pset, endtime, dt, nthreads)
         else:
             self.execute_python(pset, endtime, dt)
 
@@ -659,19 +736,31 @@ class Kernel(BaseKernel):
         self.remove_deleted(pset)
 
         # Identify particles that threw errors
-        n_error = pset._num_error_particles
-
-        while n_error > 0:
-            error_pset = pset._error_particles
-            # Check for StatusCodes
-            for p in error_pset:
+        error_indices = np.where(np.isin(pset.particledata.state, _NO_ERROR_STATES, invert=True))[0]
+
+        while len(error_indices) > 0:
+            state = pset.particledata.state
+            error_states = state[error_indices]
+            # Handle the particles before the first one that stops the execution or raised an error (handled last)
+            final = np.isin(error_states, _FINAL_STATES)
+            nhandled = np.argmax(final) if np.any(final) else len(error_indices)
+            handled, handled_states = error_indices[:nhandled], error_states[:nhandled]
+            repeat = handled[handled_states == StatusCode.Repeat]
+            state[repeat] = StatusCode.Evaluate
+            for i in handled[np.isin(handled_states, [StatusCode.Repeat, StatusCode.Delete], invert=True)]:
+                warnings.warn(
+                    f"Deleting particle {pset.particledata.data['id'][i]} because of non-recoverable error",
+                    RuntimeWarning,
+                    stacklevel=2,
+                )
+                state[i] = StatusCode.Delete
+            if nhandled < len(error_indices):
+                p = pset.particledata.get_single_by_index(error_indices[nhandled])
                 if p.state == StatusCode.StopExecution:
                     return
                 if p.state == StatusCode.StopAllExecution:
                     return StatusCode.StopAllExecution
-                if p.state == StatusCode.Repeat:
-                    p.state = StatusCode.Evaluate
-                elif p.state == StatusCode.ErrorTimeExtrapolation:
+                if p.state == StatusCode.ErrorTimeExtrapolation:
                     raise TimeExtrapolationError(p.time)
                 elif p.state == StatusCode.ErrorOutOfBounds:
                     raise FieldOutOfBoundError(p.lon, p.lat, p.depth)
@@ -679,26 +768,24 @@ class Kernel(BaseKernel):
                     raise FieldOutOfBoundSurfaceError(p.lon, p.lat, p.depth)
                 elif p.state == StatusCode.Error:
                     raise FieldSamplingError(p.lon, p.lat, p.depth)
-                elif p.state == StatusCode.Delete:
-                    pass
-                else:
-                    warnings.warn(
-                        f"Deleting particle {p.id} because of non-recoverable error",
-                        RuntimeWarning,
-                        stacklevel=2,
-                    )
-                    p.delete()
 
-            # Remove all particles that signalled deletion
+            # Remove all particles that signalled deletion, keeping track of the indices of the repeating ones
+            redo = np.zeros(len(state), dtype=bool)
+            redo[repeat] = True
+            redo = redo[state != StatusCode.Delete]
             self.remove_deleted(pset)  # Generalizable version!
 
-            # Execute core loop again to continue interrupted particles
+            # Execute core loop again to continue only the interrupted particles
+            indices = np.where(redo)[0]
+            if len(indices) == 0:
+                break
             if self.ptype.uses_jit:
-                self.execute_jit(pset, endtime, dt)
+                self.execute_jit(pset, endtime, dt, indices=indices)
             else:
-                self.execute_python(pset, endtime, dt)
+                self.execute_python(pset, endtime, dt, indices=indices)
 
-            n_error = pset._num_error_particles
+            # Only the particles that were executed again can be in an error state now
+            error_indices = indices[np.isin(pset.particledata.state[indices], _NO_ERROR_STATES, invert=True)]
 
     def evaluate_particle(self, p, endtime):
         """Execute the kernel evaluation of for an individual particle.
@@ -5,6 +5,7 @@ from operator import attrgetter
 import numpy as np
 
 from parcels._compat import MPI, KMeans
+from parcels.tools._domain_decomposition import exchange_arrays, hilbert_keys, hilbert_partition
 from parcels.tools.statuscodes import StatusCode
 
 
@@ -36,6 +37,34 @@ def partitionParticlesMPI_default(coords, mpi_size=1):
     return mpiProcs
 
 
+def partitionParticlesMPI_hilbert(coords, mpi_size=1):
+    """Partition the particles over the MPI processes along a Hilbert curve through their starting positions.
+
+    The particles are sorted along a space-filling (Hilbert) curve, so that particles close along the curve are
+    close in space, and the curve is split into ranges with equal numbers of particles. Unlike
+    :func:`partitionParticlesMPI_default`, this is vectorized and needs no sklearn. When used as the
+    partition_function of a :class:`parcels.particleset.ParticleSet` in MPI mode, each process only
+    partitions a block of the particles, and receives only the starting positions of its own particles.
+
+    Parameters
+    ----------
+    coords : np.ndarray
+        Array with rows of [lon, lat], so that coords.shape[0] is the number of particles.
+    mpi_size : int
+        The number of MPI processes.
+
+    Returns
+    -------
+    np.ndarray
+        Array of length coords.shape[0], with the MPI process (from 0 to mpi_size-1) of each particle.
+    """
+    lon, lat = coords[:, 0], coords[:, 1]
+    keys = hilbert_keys(lon, lat, (np.nanmin(lon), np.nanmax(lon)), (np.nanmin(lat), np.nanmax(lat)))
+    mpiProcs = np.empty(len(keys), dtype=int)
+    mpiProcs[np.argsort(keys, kind="stable")] = np.arange(len(keys)) * mpi_size // len(keys)
+    return mpiProcs
+
+
 class ParticleData:
     def __init__(self, pclass, lon, lat, depth, time, lonlatdepth_dtype, pid_orig, ngrid=1, **kwargs):
         """
@@ -47,11 +76,14 @@ class ParticleData:
         """
         self._ncount = -1
         self._pu_indicators = None
+        self._pu_pid_orig = None  # pid_orig of the particles of this MPI process, if partitioned without pu_indicators
         self._offset = 0
         self._pclass = None
         self._ptype = None
         self._latlondepth_dtype = np.float32
         self._data = None
+        self._pending = None  # particles that are not released yet, sorted by release time (see _hold_pending)
+        self._pending_keys = None
 
         assert pid_orig is not None, "particle IDs are None - incompatible with the ParticleData class. Invalid state."
         pid = pid_orig + pclass.lastID
@@ -85,7 +117,16 @@ class ParticleData:
                 raise RuntimeError("Cannot initialise with fewer particles than MPI processors")
 
             if mpi_size > 1:
-                if partition_function is not False:
+                if partition_function is partitionParticlesMPI_hilbert:
+                    # each process partitions one block of the particles, and receives the particles of its partition
+                    block = slice(mpi_rank * lon.size // mpi_size, (mpi_rank + 1) * lon.size // mpi_size)
+                    seeds = {"lon": lon, "lat": lat, "time": time, "depth": depth, "pid": pid, **kwargs}
+                    seeds = {name: values[block] for name, values in seeds.items()}
+                    seeds = exchange_arrays(seeds, hilbert_partition(seeds["lon"], seeds["lat"]))
+                    lon, lat, time, depth, pid = (seeds.pop(name) for name in ["lon", "lat", "time", "depth", "pid"])
+                    kwargs.update(seeds)
+                    self._pu_pid_orig = pid - pclass.lastID
+                elif partition_function is not False:
                     if (self._pu_indicators is None) or (len(self._pu_indicators) != len(lon)):
                         if mpi_rank == 0:
                             coords = np.vstack((lon, lat)).transpose()
@@ -231,6 +272,15 @@ class ParticleData:
     def iterator(self):
         return ParticleDataIterator(self)
 
+    def _proxy_class(self):
+        """Return a subclass of :class:`ParticleDataProxy` with a slot for each Variable, on the current data arrays."""
+        names = [v.name for v in self._ptype.variables if v.name in self._data]
+        cls = type("ParticleDataProxy", (ParticleDataProxy,), {"__slots__": tuple(names)})
+        cls._pcoll = self
+        cls._arrays = {name: self._data[name] for name in names}
+        cls._loaders = tuple((getattr(cls, name).__set__, self._data[name]) for name in names)
+        return cls
+
     def __iter__(self):
         """Return an Iterator that allows for forward iteration over the elements in the ParticleData (e.g. `for p in pset:`)."""
         return self.iterator()
@@ -331,8 +381,53 @@ class ParticleData:
 
         self._ncount -= len(indices)
 
-    def cstruct(self):
-        """Return the ctypes mapping of the particle data."""
+    def _hold_pending(self, time, dt):
+        """Move the particles that are released more than one dt after time out of the active arrays.
+
+        The held particles are kept in a queue sorted by their release time, from which they are activated in bulk
+        by :meth:`_release_pending`. This is only done when the particles are sorted by ID, so that
+        the order of the particles is kept when they are activated.
+        """
+        if self._pending is not None or not self._sorted or self._ncount == 0:
+            return
+        keys = np.minimum(np.sign(dt) * self._data["time"], np.sign(dt) * self._data["time_nextloop"])
+        held = keys > np.sign(dt) * (time + dt)
+        if not np.any(held):
+            return
+        order = np.argsort(keys[held], kind="stable")
+        self._pending_keys = keys[held][order]
+        self._pending = {d: self._data[d][held][order] for d in self._data}
+        for d in self._data:
+            self._data[d] = self._data[d][~held]
+        self._ncount -= len(order)
+
+    def _release_pending(self, time=None, dt=1.0):
+        """Activate the held particles that are released before one dt after time (or all if time is None).
+
+        Returns the number of activated particles.
+        """
+        if self._pending is None:
+            return 0
+        if time is None:
+            nrelease = len(self._pending_keys)
+        else:
+            nrelease = np.searchsorted(self._pending_keys, np.sign(dt) * (time + dt), side="right")
+        if nrelease == 0:
+            return 0
+        order = np.argsort(self._pending["id"][:nrelease], kind="stable")
+        positions = np.searchsorted(self._data["id"], self._pending["id"][:nrelease][order])
+        for d in self._data:
+            self._data[d] = np.insert(self._data[d], positions, self._pending[d][:nrelease][order], axis=0)
+        self._ncount += nrelease
+        if nrelease == len(self._pending_keys):
+            self._pending, self._pending_keys = None, None
+        else:
+            self._pending = {d: values[nrelease:] for d, values in self._pending.items()}
+            self._pending_keys = self._pending_keys[nrelease:]
+        return nrelease
+
+    def cstruct(self, start=0, stop=None):
+        """Return the ctypes mapping of the particle data, or of the particles start to stop (without copying)."""
 
         class CParticles(Structure):
             _fields_ = [(v.name, POINTER(np.ctypeslib.as_ctypes_type(v.dtype))) for v in self._ptype.variables]
@@ -340,7 +435,7 @@ class ParticleData:
         def flatten_dense_data_array(vname):
             data_flat = self._data[vname].view()
             data_flat.shape = -1
-            return np.ctypeslib.as_ctypes(data_flat)
+            return np.ctypeslib.as_ctypes(data_flat[start:stop])
 
         cdata = [flatten_dense_data_array(v.name) for v in self._ptype.variables]
         cstruct = CParticles(*cdata)
@@ -474,6 +569,50 @@ class ParticleDataAccessor:
         self.state = StatusCode.Delete
 
 
+class ParticleDataProxy:
+    """Fast proxy of a particle in the ParticleData, for the execution of Scipy kernels.
+
+    Unlike :class:`ParticleDataAccessor`, the values of the Variables of the particle are read into slots when the
+    proxy is created, so that reading them in a kernel is a plain attribute lookup. Setting a Variable writes it to
+    its data array, and caches the value as it is stored (i.e. cast to the dtype of the Variable). The proxy classes
+    are created by :meth:`ParticleData._proxy_class`, and are only valid while the data arrays are not replaced (by
+    adding or removing particles) and not changed by other means than their proxies.
+
+    Parameters
+    ----------
+    index :
+        The index of the particle in the data arrays of the ParticleData instance.
+    """
+
+    __slots__ = ("_index",)
+    _pcoll = None
+    _arrays = {}  # data array of each Variable
+    _loaders = ()  # (slot setter, data array) of each Variable
+
+    def __init__(self, index):
+        object.__setattr__(self, "_index", index)
+        for setter, values in self._loaders:
+            setter(self, values[index])
+
+    def __getattr__(self, name):
+        return self._pcoll.data[name][self._index]
+
+    def __setattr__(self, name, value):
+        values = self._arrays[name]
+        values[self._index] = value
+        object.__setattr__(self, name, values[self._index])
+
+    def getPType(self):
+        return self._pcoll.ptype
+
+    def __repr__(self):
+        return repr(ParticleDataAccessor(self._pcoll, self._index))
+
+    def delete(self):
+        """Signal the particle for deletion."""
+        self.state = StatusCode.Delete
+
+
 class ParticleDataIterator:
     """Iterator for looping over the particles in the ParticleData.
 
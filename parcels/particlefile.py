@@ -10,6 +10,7 @@ import zarr
 
 import parcels
 from parcels._compat import MPI
+from parcels.tools._checkpoint import read_checkpoint
 from parcels.tools.warnings import FileWarning
 
 __all__ = ["ParticleFile"]
@@ -121,6 +122,37 @@ class ParticleFile:
             else:
                 self.fname = name if extension in [".zarr"] else f"{name}.zarr"
 
+    @classmethod
+    def from_checkpoint(cls, path, particleset):
+        """Initialise the ParticleFile that continues the output of a checkpoint (see :meth:`ParticleSet.checkpoint`).
+
+        Parameters
+        ----------
+        path : str or Path
+            Directory of the checkpoint.
+        particleset :
+            ParticleSet restarted from the checkpoint (see :meth:`ParticleSet.from_checkpoint`)
+        """
+        arrays, state = read_checkpoint(path)
+        output = state.get("output")
+        if output is None:
+            raise ValueError(f"The checkpoint at {path} has no ParticleFile")
+        name = os.path.dirname(output["fname"]) if MPI and MPI.COMM_WORLD.Get_size() > 1 else output["fname"]
+        obs_written = particleset.particledata.getvardata("obs_written").copy()
+        pfile = cls(
+            name,
+            particleset,
+            outputdt=output["outputdt"],
+            chunks=None if output["chunks"] is None else tuple(output["chunks"]),
+            create_new_zarrfile=output["create_new_zarrfile"],
+        )
+        particleset.particledata.setallvardata("obs_written", obs_written)  # which is reset by the constructor
+        pfile.maxids = output["maxids"]
+        output_arrays = arrays["output"]
+        pfile.pids_written = dict(zip(output_arrays["pids"].tolist(), output_arrays["indices"].tolist(), strict=True))
+        pfile.metadata = output["metadata"]
+        return pfile
+
     def _create_variables_attribute_dict(self):
         """Creates the dictionary with variable attributes.
 
@@ -227,7 +259,9 @@ class ParticleFile:
             ids = np.array([self.pids_written[p] for p in pids], dtype=int)
             self.maxids = len(self.pids_written)
 
-            once_ids = np.where(pset.particledata.getvardata("obs_written", indices_to_write) == 0)[0]
+            # Variables written once are written when a particle is first written to this file, which for particles
+            # that moved from another MPI rank (see FieldSet.add_domain_decomposition) is not at their first output
+            once_ids = np.where(np.isin(pids, to_add))[0]
             if len(once_ids) > 0:
                 ids_once = ids[once_ids]
                 indices_to_write_once = indices_to_write[once_ids]
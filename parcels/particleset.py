@@ -3,6 +3,7 @@ import sys
 import warnings
 from copy import copy
 from datetime import date, datetime, timedelta
+from time import perf_counter
 
 import cftime
 import numpy as np
@@ -10,6 +11,7 @@ import xarray as xr
 from scipy.spatial import KDTree
 from tqdm import tqdm
 
+import parcels.rng as ParcelsRandom
 from parcels._compat import MPI
 from parcels.application_kernels.advection import AdvectionRK4
 from parcels.compilation.codecompiler import GNUCompiler
@@ -26,7 +28,11 @@ from parcels.kernel import Kernel
 from parcels.particle import JITParticle, Variable
 from parcels.particledata import ParticleData, ParticleDataIterator
 from parcels.particlefile import ParticleFile
+from parcels.tools._checkpoint import read_checkpoint, write_checkpoint
+from parcels.tools._domain_decomposition import balanced_split, exchange_particles, hilbert_keys, time_range
 from parcels.tools._helpers import deprecated_made_private
+from parcels.tools._process_pool import ProcessPool
+from parcels.tools._scheduler import EventScheduler
 from parcels.tools.converters import _get_cftime_calendars, convert_to_flat_array
 from parcels.tools.global_statics import get_package_dir
 from parcels.tools.loggers import logger
@@ -35,6 +41,8 @@ from parcels.tools.warnings import FileWarning
 
 __all__ = ["ParticleSet"]
 
+_REBALANCE_TOLERANCE = 1.1  # largest over mean load of the MPI ranks above which particles are rebalanced
+
 
 def _convert_to_reltime(time):
     """Check to determine if the value of the time parameter needs to be converted to a relative value (relative to the time_origin)."""
@@ -75,7 +83,8 @@ class ParticleSet:
     pid_orig :
         Optional list of (offsets for) the particle IDs
     partition_function :
-        Function to use for partitioning particles over processors. Default is to use kMeans
+        Function to use for partitioning particles over processors. Default is to use kMeans. For large numbers
+        of particles, use :func:`parcels.particledata.partitionParticlesMPI_hilbert`
     periodic_domain_zonal :
         Zonal domain size, used to apply zonally periodic boundaries for particle-particle
         interaction. If None, no zonally periodic boundaries are applied
@@ -111,6 +120,8 @@ class ParticleSet:
         self.fieldset = fieldset
         self.fieldset._check_complete()
         self.time_origin = fieldset.time_origin
+        if self.fieldset._domain_decomposition is not None:
+            kwargs.setdefault("partition_function", self.fieldset._domain_decomposition.partition)
 
         # ==== first: create a new subclass of the pclass that includes the required variables ==== #
         # ==== see dynamic-instantiation trick here: https://www.python-course.eu/python3_classes_and_type.php ==== #
@@ -277,6 +288,8 @@ class ParticleSet:
                 mpi_comm = MPI.COMM_WORLD
                 mpi_rank = mpi_comm.Get_rank()
                 self._repeatpid = pid_orig[self.particledata.pu_indicators == mpi_rank]
+            elif MPI and self.particledata._pu_pid_orig is not None:
+                self._repeatpid = self.particledata._pu_pid_orig
 
         self._kernel = None
 
@@ -859,6 +872,119 @@ class ParticleSet:
             **kwargs,
         )
 
+    @classmethod
+    def from_checkpoint(cls, fieldset, pclass, path):
+        """Initialise the ParticleSet from a checkpoint written by :meth:`checkpoint`.
+
+        All particle Variables and the state of the repeated release are restored. As the last particle ID is
+        shared by all ParticleSets of the particle class, it is only raised to that of the checkpoint (so that
+        new particles get IDs that are unique in both). If the checkpoint was written with a seed, the global
+        random number generator (ParcelsRandom) is reseeded with it, so that the simulation continues as it
+        would have without the restart; otherwise the generator is left as it is.
+        To continue writing to the ParticleFile of the simulation, use :meth:`ParticleFile.from_checkpoint`.
+
+        Parameters
+        ----------
+        fieldset : parcels.fieldset.FieldSet
+            mod:`parcels.fieldset.FieldSet` object from which to sample velocity
+        pclass : parcels.particle.JITParticle or parcels.particle.ScipyParticle
+            Particle class of the ParticleSet that was checkpointed.
+        path : str or Path
+            Directory of the checkpoint.
+        """
+        arrays, state = read_checkpoint(path)
+        data = arrays["particles"]
+        last_id = pclass.lastID
+        pclass.setLastID(0)  # the IDs of the particles are those of the checkpoint
+        pset = cls(
+            fieldset=fieldset,
+            pclass=pclass,
+            lon=data["lon"],
+            lat=data["lat"],
+            depth=data["depth"],
+            time=data["time"],
+            pid_orig=data["id"],
+            lonlatdepth_dtype=np.dtype(state["lonlatdepth_dtype"]).type,
+            partition_function=False,
+        )
+        for v in pset.particledata.ptype.variables:
+            if v.dtype != object and (v.name not in data or data[v.name].dtype != v.dtype):
+                raise ValueError(f"Variable {v.name} of pclass does not match the checkpoint at {path}")
+        pset.particledata._data.update(data)
+        pclass.setLastID(max(last_id, state["last_id"]))
+
+        pset.repeatdt = state["repeatdt"]
+        if pset.repeatdt:
+            repeat = arrays["repeat"]
+            pset._repeat_starttime = state["repeat_starttime"]
+            pset._repeatlon, pset._repeatlat, pset._repeatdepth = repeat["lon"], repeat["lat"], repeat["depth"]
+            if "pid" in repeat:
+                pset._repeatpid = repeat["pid"]
+            pset._repeatpclass = pclass
+            pset._repeatkwargs = arrays.get("repeatkwargs", {})
+        if state["seed"] is not None:
+            ParcelsRandom.seed(state["seed"])
+        return pset
+
+    def checkpoint(self, path, output_file=None, seed=None):
+        """Write the state of the ParticleSet to a checkpoint, from which it is restarted with :meth:`from_checkpoint`.
+
+        The checkpoint is a directory with the raw arrays of all particle Variables (including the search indices
+        and the Variables that are not written to output), the state of the repeated release and, if given, of the
+        ParticleFile. An existing checkpoint at path is only replaced once the new one is complete. In MPI mode,
+        each rank writes its particles to its own subdirectory, so that the simulation must be restarted on the
+        same number of ranks.
+
+        The state of the random number generator cannot be read, so it is not part of the checkpoint: unless a
+        seed is given, a restarted simulation draws other random numbers than this simulation does after the
+        checkpoint. With a seed, the generator is reseeded with it now and again in :meth:`from_checkpoint`.
+
+        Parameters
+        ----------
+        path : str or Path
+            Directory of the checkpoint.
+        output_file : parcels.particlefile.ParticleFile
+            Optional, ParticleFile of the simulation, which can be continued after the restart with
+            :meth:`ParticleFile.from_checkpoint` (Default value = None)
+        seed : int
+            Optional, seed with which the random number generator (ParcelsRandom) is reseeded, both now and at the
+            restart, so that the restarted simulation draws the same random numbers (Default value = None)
+        """
+        if self.particledata._release_pending():  # a checkpoint during execution holds all particles
+            self._dirty_neighbor = True
+        data = self.particledata._data
+        arrays = {"particles": {name: values for name, values in data.items() if values.dtype != object}}
+        if seed is not None:
+            ParcelsRandom.seed(seed)
+        state = {
+            "lonlatdepth_dtype": np.dtype(self.particledata.lonlatdepth_dtype).str,
+            "last_id": int(self.particledata._pclass.lastID),
+            "seed": seed,
+            "repeatdt": self.repeatdt,
+            "repeat_starttime": None if self._repeat_starttime is None else float(self._repeat_starttime),
+        }
+        if self.repeatdt:
+            arrays["repeat"] = {"lon": self._repeatlon, "lat": self._repeatlat, "depth": self._repeatdepth}
+            if isinstance(self._repeatpid, np.ndarray):
+                arrays["repeat"]["pid"] = self._repeatpid
+            arrays["repeatkwargs"] = self._repeatkwargs
+        if output_file is not None:
+            if not isinstance(output_file.fname, (str, os.PathLike)):
+                raise ValueError("Only a ParticleFile that is written to a file name can be checkpointed")
+            state["output"] = {
+                "fname": str(output_file.fname),
+                "outputdt": output_file.outputdt,
+                "chunks": output_file.chunks,
+                "maxids": output_file.maxids,
+                "create_new_zarrfile": output_file.create_new_zarrfile,
+                "metadata": output_file.metadata,
+            }
+            arrays["output"] = {
+                "pids": np.array(list(output_file.pids_written.keys()), dtype=np.int64),
+                "indices": np.array(list(output_file.pids_written.values()), dtype=np.int64),
+            }
+        write_checkpoint(path, arrays, state)
+
     def Kernel(self, pyfunc, c_include="", delete_cfiles=True):
         """Wrapper method to convert a `pyfunc` into a :class:`parcels.kernel.Kernel` object.
 
@@ -973,6 +1099,26 @@ class ParticleSet:
         """
         self.particledata.set_variable_write_status(var, write_status)
 
+    def _rebalance(self, kernel_time=None):
+        """Redistribute the particles over the MPI ranks if their load is unbalanced.
+
+        The load of a rank is its number of particles or, if given, its kernel execution time. If the largest
+        load exceeds the mean load by more than 10%, the particles are sorted along a Hilbert curve through
+        the domain and split into contiguous ranges of equal load, which are sent to the ranks with MPI
+        alltoallv. Particles keep their IDs, and are written to the ParticleFile of their new rank.
+        """
+        comm = MPI.COMM_WORLD
+        loads = np.array(comm.allgather(len(self) if kernel_time is None else kernel_time), dtype=np.float64)
+        if loads.max() <= _REBALANCE_TOLERANCE * loads.mean():
+            return
+        weights = np.full(len(self), 1.0 if kernel_time is None else kernel_time / max(len(self), 1))
+        grid = self.fieldset.gridset.grids[0]
+        lon_range = (np.nanmin(grid.lon), np.nanmax(grid.lon))
+        lat_range = (np.nanmin(grid.lat), np.nanmax(grid.lat))
+        keys = hilbert_keys(self.particledata.data["lon"], self.particledata.data["lat"], lon_range, lat_range)
+        exchange_particles(self.particledata, balanced_split(keys, weights, comm.Get_size()))
+        self._dirty_neighbor = True
+
     def execute(
         self,
         pyfunc=AdvectionRK4,
@@ -985,6 +1131,11 @@ class ParticleSet:
         postIterationCallbacks=None,
         callbackdt=None,
         delete_cfiles=True,
+        rebalance_every=None,
+        rebalance_by_time=False,
+        nprocesses=None,
+        nthreads=None,
+        events=None,
     ):
         """Execute a given kernel function over the particle set for multiple timesteps.
 
@@ -1019,13 +1170,100 @@ class ParticleSet:
             (Default value = None)
         delete_cfiles : bool
             Whether to delete the C-files after compilation in JIT mode (default is True)
+        rebalance_every : int
+            Optional, number of outputs of output_file after which the particles are redistributed over the
+            MPI ranks if their load is unbalanced (see :meth:`_rebalance`). All ranks must execute over the
+            same times. Not available with :meth:`FieldSet.add_domain_decomposition` (Default value = None)
+        rebalance_by_time : bool
+            Whether to balance the kernel execution time of the MPI ranks, instead of their number of
+            particles, when rebalancing (Default value = False)
+        nprocesses : int
+            Optional, number of processes (on this machine, or on this MPI rank) over which the particles are split
+            for the execution of the kernel. The processes are forked once per call, and map the snapshots of
+            deferred-load Fields from shared memory, into which only this process reads them; the output is written
+            by this process. The generator of each process is seeded from ParcelsRandom and the index of its shard,
+            so random kernels draw different numbers in each process, and do not reproduce the results of a run in
+            a single process (or in another number of processes). The number is not available with an interaction
+            kernel, with :meth:`FieldSet.add_node_shared_memory` or with deferred-load Fields with dask chunking.
+            (Default value = None, a single process)
+        nthreads : int
+            Optional, number of threads over which the particles are split for the execution of a JIT kernel. Kernels
+            that draw random numbers are executed in a single thread. A particle that stops all execution only stops the
+            particles of its own shard. (Default value = None, a single thread)
+        events : list of (float or datetime.timedelta, function) pairs
+            Optional, functions without arguments that are each called at their own interval (in seconds) from the
+            start of the execution, e.g. to write a checkpoint with :meth:`checkpoint`. At the same time, they are
+            called after the output, the ``postIterationCallbacks`` and the release of repeated particles.
+            (Default value = None)
 
         Notes
         -----
         ``ParticleSet.execute()`` acts as the main entrypoint for simulations, and provides the simulation time-loop. This method encapsulates the logic controlling the switching between kernel execution (where control in handed to C in JIT mode), output file writing, reading in fields for new timesteps, adding new particles to the simulation domain, stopping the simulation, and executing custom functions (``postIterationCallbacks`` provided by the user).
+
+        Particles that are released later in the simulation (e.g. with a ``time`` array of release times) are held
+        outside the ParticleSet until their release time, so that they cost nothing in the time loop before.
+        During the execution (e.g. in a ``postIterationCallbacks`` function), the ParticleSet only contains the
+        released particles; all particles are in the ParticleSet again after the execution.
+        """
+        steps = self._execute_steps(
+            pyfunc=pyfunc,
+            pyfunc_inter=pyfunc_inter,
+            endtime=endtime,
+            runtime=runtime,
+            dt=dt,
+            output_file=output_file,
+            verbose_progress=verbose_progress,
+            postIterationCallbacks=postIterationCallbacks,
+            callbackdt=callbackdt,
+            delete_cfiles=delete_cfiles,
+            rebalance_every=rebalance_every,
+            rebalance_by_time=rebalance_by_time,
+            nprocesses=nprocesses,
+            nthreads=nthreads,
+            events=events,
+        )
+        while True:
+            try:
+                next(steps)
+            except StopIteration as stop:
+                return stop.value
+
+    def _execute_steps(
+        self,
+        pyfunc,
+        pyfunc_inter,
+        endtime,
+        runtime,
+        dt,
+        output_file,
+        verbose_progress,
+        postIterationCallbacks,
+        callbackdt,
+        delete_cfiles,
+        rebalance_every,
+        rebalance_by_time,
+        nprocesses,
+        nthreads,
+        events,
+    ):
+        """Generator running the time loop of :meth:`execute`, which yields the time before each loading of Field data.
+
+        Several ParticleSets on one FieldSet can thus be executed in lockstep (see :class:`parcels.ParticleSetEnsemble`),
+        such that each snapshot of the Fields is only loaded once. The generator returns the status of the execution.
         """
-        # check if particleset is empty. If so, return immediately
-        if len(self) == 0:
+        if rebalance_every is not None and self.fieldset._domain_decomposition is not None:
+            raise ValueError("Rebalancing is not available with domain decomposition, where tiles own the particles")
+        if MPI is None or MPI.COMM_WORLD.Get_size() == 1:
+            rebalance_every = None
+        if nprocesses is not None and nprocesses > 1 and (pyfunc_inter is not None or self._interaction_kernel):
+            raise ValueError("Execution in multiple processes is not available with an interaction kernel")
+
+        # the MPI ranks share their times if particles move between them, or if they load snapshots together
+        share_times = (
+            self.fieldset._domain_decomposition is not None or rebalance_every is not None or self.fieldset._node_shared
+        )
+        # check if particleset is empty. If so, return immediately (unless the rank has to take part in the time loop)
+        if len(self) == 0 and not share_times:
             return
 
         # check if pyfunc has changed since last compile. If so, recompile
@@ -1092,8 +1330,12 @@ class ParticleSet:
             self.particledata.data["time_nextloop"][np.isnan(self.particledata.data["time_nextloop"])] = (
                 default_release_time
             )
-        min_rt = np.min(self.particledata.data["time_nextloop"])
-        max_rt = np.max(self.particledata.data["time_nextloop"])
+        if share_times:
+            # ranks may hold no particles, but all share their times
+            min_rt, max_rt = time_range(self.particledata.data["time_nextloop"])
+        else:
+            min_rt = np.min(self.particledata.data["time_nextloop"])
+            max_rt = np.max(self.particledata.data["time_nextloop"])
 
         # Derive starttime and endtime from arguments or fieldset defaults
         starttime = min_rt if dt >= 0 else max_rt
@@ -1126,102 +1368,134 @@ class ParticleSet:
         if verbose_progress:
             pbar = tqdm(total=abs(endtime - starttime), file=sys.stdout)
 
-        # Set up variables for first iteration
+        # Set up the events of the time loop, at which the execution needs to be handed back to python
+        scheduler = EventScheduler(dt)
+        noutputs = 0
+        kernel_time = 0.0
+
+        def write_output():
+            nonlocal noutputs, kernel_time
+            for fld in fields_to_write:
+                if fld.grid.tdim > 1:
+                    raise RuntimeError("Field writing during execution only works for Fields with one snapshot in time")
+                fldfilename = str(output_file.fname).replace(".zarr", "_%.4d" % fld.to_write)
+                fld.write(fldfilename)
+                fld.to_write += 1
+            if output_file.analytical:  # output analytical solution at later time
+                output_file.write_latest_locations(self, time)
+            else:
+                output_file.write(self, time_at_startofloop)
+            noutputs += 1
+            if rebalance_every is not None and noutputs % rebalance_every == 0:
+                self._rebalance(kernel_time if rebalance_by_time else None)
+                kernel_time = 0.0
+
+        def run_callbacks():
+            for extFunc in postIterationCallbacks:
+                extFunc()
+
+        def release_repeated():
+            pset_new = self.__class__(
+                fieldset=self.fieldset,
+                time=time,
+                lon=self._repeatlon,
+                lat=self._repeatlat,
+                depth=self._repeatdepth,
+                pclass=self._repeatpclass,
+                lonlatdepth_dtype=self.particledata.lonlatdepth_dtype,
+                partition_function=False,
+                pid_orig=self._repeatpid,
+                **self._repeatkwargs,
+            )
+            pset_new.particledata._data["dt"][:] = dt
+            self.add(pset_new)
+
+        if output_file:
+            fields_to_write = [fld for fld in self.fieldset.get_fields() if getattr(fld, "to_write", False)]
+            scheduler.add(write_output, starttime + dt, outputdt, priority=0)
+        # ==== insert post-process here to also allow for memory clean-up via external func ==== #
+        if postIterationCallbacks is not None:
+            scheduler.add(run_callbacks, starttime + callbackdt * np.sign(dt), callbackdt, priority=1)
         if self.repeatdt:
             next_prelease = self._repeat_starttime + (
                 abs(starttime - self._repeat_starttime) // self.repeatdt + 1
             ) * self.repeatdt * np.sign(dt)
-        else:
-            next_prelease = np.inf if dt > 0 else -np.inf
-        if output_file:
-            next_output = starttime + dt
-        else:
-            next_output = np.inf * np.sign(dt)
-        next_callback = starttime + callbackdt * np.sign(dt)
+            scheduler.add(release_repeated, next_prelease, self.repeatdt, priority=2)
+        for interval, function in events or []:
+            if isinstance(interval, timedelta):
+                interval = interval.total_seconds()
+            if not interval > 0:
+                raise ValueError(f"The interval of an event must be positive, not {interval}")
+            scheduler.add(function, starttime + interval * np.sign(dt), interval, priority=3)
 
-        tol = 1e-12
         time = starttime
 
-        while (time < endtime and dt > 0) or (time > endtime and dt < 0):
-            time_at_startofloop = time
-
-            next_input = self.fieldset.computeTimeChunk(time, dt)
-
-            # Define next_time (the timestamp when the execution needs to be handed back to python)
-            if dt > 0:
-                next_time = min(next_prelease, next_input, next_output, next_callback, endtime)
-            else:
-                next_time = max(next_prelease, next_input, next_output, next_callback, endtime)
-
-            # If we don't perform interaction, only execute the normal kernel efficiently.
-            if self._interaction_kernel is None:
-                res = self._kernel.execute(self, endtime=next_time, dt=dt)
-                if res == StatusCode.StopAllExecution:
-                    return StatusCode.StopAllExecution
-            # Interaction: interleave the interaction and non-interaction kernel for each time step.
-            # E.g. Normal -> Inter -> Normal -> Inter if endtime-time == 2*dt
-            else:
-                cur_time = time
-                while (cur_time < next_time and dt > 0) or (cur_time > next_time and dt < 0):
-                    if dt > 0:
-                        cur_end_time = min(cur_time + dt, next_time)
-                    else:
-                        cur_end_time = max(cur_time + dt, next_time)
-                    self._kernel.execute(self, endtime=cur_end_time, dt=dt)
-                    self._interaction_kernel.execute(self, endtime=cur_end_time, dt=dt)
-                    cur_time += dt
-            # End of interaction specific code
-            time = next_time
-
-            if abs(time - next_output) < tol:
-                for fld in self.fieldset.get_fields():
-                    if hasattr(fld, "to_write") and fld.to_write:
-                        if fld.grid.tdim > 1:
-                            raise RuntimeError(
-                                "Field writing during execution only works for Fields with one snapshot in time"
-                            )
-                        fldfilename = str(output_file.fname).replace(".zarr", "_%.4d" % fld.to_write)
-                        fld.write(fldfilename)
-                        fld.to_write += 1
-
-            if abs(time - next_output) < tol:
-                if output_file:
-                    if output_file.analytical:  # output analytical solution at later time
-                        output_file.write_latest_locations(self, time)
-                    else:
-                        output_file.write(self, time_at_startofloop)
-                if np.isfinite(outputdt):
-                    next_output += outputdt * np.sign(dt)
-
-            # ==== insert post-process here to also allow for memory clean-up via external func ==== #
-            if abs(time - next_callback) < tol:
-                if postIterationCallbacks is not None:
-                    for extFunc in postIterationCallbacks:
-                        extFunc()
-                next_callback += callbackdt * np.sign(dt)
-
-            if abs(time - next_prelease) < tol:
-                pset_new = self.__class__(
-                    fieldset=self.fieldset,
-                    time=time,
-                    lon=self._repeatlon,
-                    lat=self._repeatlat,
-                    depth=self._repeatdepth,
-                    pclass=self._repeatpclass,
-                    lonlatdepth_dtype=self.particledata.lonlatdepth_dtype,
-                    partition_function=False,
-                    pid_orig=self._repeatpid,
-                    **self._repeatkwargs,
-                )
-                for p in pset_new:
-                    p.dt = dt
-                self.add(pset_new)
-                next_prelease += self.repeatdt * np.sign(dt)
-
-            if time != endtime:
+        # particles that are released later are held outside the active arrays, until their release time
+        if self.fieldset._domain_decomposition is None:
+            self.particledata._hold_pending(starttime, dt)
+        process_pool = None
+        try:
+            yield time
+            while (time < endtime and dt > 0) or (time > endtime and dt < 0):
+                time_at_startofloop = time
+
+                if self.fieldset._domain_decomposition is not None:
+                    if self.fieldset._domain_decomposition.migrate(self.particledata):
+                        self._dirty_neighbor = True
+                self.fieldset._update_subset_windows(self.particledata.data["lon"], self.particledata.data["lat"])
                 next_input = self.fieldset.computeTimeChunk(time, dt)
-            if verbose_progress:
-                pbar.update(abs(time - time_at_startofloop))
 
+                # Define next_time (the timestamp when the execution needs to be handed back to python)
+                if dt > 0:
+                    next_time = min(scheduler.next_time(), next_input, endtime)
+                else:
+                    next_time = max(scheduler.next_time(), next_input, endtime)
+
+                if self.particledata._release_pending(next_time, dt):
+                    self._dirty_neighbor = True
+                    # the released particles may be outside the subset windows of the Fields
+                    if self.fieldset._auto_subset_velocity is not None:
+                        lon, lat = self.particledata.data["lon"], self.particledata.data["lat"]
+                        self.fieldset._update_subset_windows(lon, lat)
+                        self.fieldset.computeTimeChunk(time, dt)
+
+                tic = perf_counter()
+                # If we don't perform interaction, only execute the normal kernel efficiently.
+                if self._interaction_kernel is None:
+                    if nprocesses is not None and nprocesses > 1 and len(self) > 1:
+                        if process_pool is None:  # forked once, with the Field data loaded so far
+                            process_pool = ProcessPool(self._kernel, self, nprocesses)
+                        res = process_pool.execute(self, time, next_time, dt)
+                    else:
+                        res = self._kernel.execute(self, endtime=next_time, dt=dt, nthreads=nthreads)
+                    if res == StatusCode.StopAllExecution:
+                        return StatusCode.StopAllExecution
+                # Interaction: interleave the interaction and non-interaction kernel for each time step.
+                # E.g. Normal -> Inter -> Normal -> Inter if endtime-time == 2*dt
+                else:
+                    cur_time = time
+                    while (cur_time < next_time and dt > 0) or (cur_time > next_time and dt < 0):
+                        if dt > 0:
+                            cur_end_time = min(cur_time + dt, next_time)
+                        else:
+                            cur_end_time = max(cur_time + dt, next_time)
+                        self._kernel.execute(self, endtime=cur_end_time, dt=dt, nthreads=nthreads)
+                        self._interaction_kernel.execute(self, endtime=cur_end_time, dt=dt)
+                        cur_time += dt
+                # End of interaction specific code
+                kernel_time += perf_counter() - tic
+                time = next_time
+
+                scheduler.run(time)
+
+                if time != endtime:
+                    yield time
+                if verbose_progress:
+                    pbar.update(abs(time - time_at_startofloop))
+        finally:
+            if process_pool is not None:
+                process_pool.close()
+            if self.particledata._release_pending():
+                self._dirty_neighbor = True
         if verbose_progress:
             pbar.close()
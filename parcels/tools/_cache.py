@@ -0,0 +1,103 @@
+"""Internal least-recently-used caches for Parcels."""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+
+class LRUCache:
+    """Least-recently-used cache with a cap on the summed size of its items.
+
+    The cache can be shared between threads.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum summed size of the cached items, as measured by `sizeof`.
+        Items larger than maxsize are never cached.
+    sizeof : callable, optional
+        Function returning the size of an item. Default is 1 per item, so that
+        maxsize is the maximum number of items. Use e.g. ``lambda a: a.nbytes``
+        to cap the memory of cached numpy arrays.
+    on_evict : callable, optional
+        Function called with (key, item) for every item removed from the cache.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        sizeof: Callable[[Any], int] | None = None,
+        on_evict: Callable[[Hashable, Any], None] | None = None,
+    ):
+        self.maxsize = maxsize
+        self._sizeof = sizeof if sizeof is not None else (lambda item: 1)
+        self._on_evict = on_evict
+        self._items: OrderedDict[Hashable, Any] = OrderedDict()
+        self._sizes: dict[Hashable, int] = {}
+        self._lock = threading.RLock()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def __len__(self):
+        return len(self._items)
+
+    def keys(self):
+        """Return the cached keys, from least to most recently used."""
+        with self._lock:
+            return list(self._items)
+
+    def get(self, key, default=None):
+        """Return the item for key and mark it as most recently used, or default if not cached."""
+        with self._lock:
+            if key not in self._items:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._items.move_to_end(key)
+            return self._items[key]
+
+    def put(self, key, item):
+        """Add item to the cache, evicting the least recently used items to stay within maxsize."""
+        itemsize = self._sizeof(item)
+        with self._lock:
+            if key in self._items:
+                self.pop(key)
+            if itemsize > self.maxsize:
+                return
+            while self._items and self.size + itemsize > self.maxsize:
+                self._evict(next(iter(self._items)))
+            self._items[key] = item
+            self._sizes[key] = itemsize
+            self.size += itemsize
+
+    def setdefault(self, key, item):
+        """Return the item for key if cached, else add item to the cache and return it."""
+        with self._lock:
+            if key in self._items:
+                return self.get(key)
+            self.put(key, item)
+            return item
+
+    def pop(self, key, default=None):
+        """Remove key from the cache (without calling on_evict) and return its item."""
+        with self._lock:
+            if key not in self._items:
+                return default
+            self.size -= self._sizes.pop(key)
+            return self._items.pop(key)
+
+    def clear(self):
+        """Evict all items."""
+        with self._lock:
+            while self._items:
+                self._evict(next(iter(self._items)))
+
+    def _evict(self, key):
+        item = self.pop(key)
+        if self._on_evict is not None:
+            self._on_evict(key, item)
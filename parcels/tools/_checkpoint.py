@@ -0,0 +1,53 @@
+"""Internal reading and writing of checkpoints of the state of a ParticleSet."""
+
+import json
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+
+from parcels._compat import MPI
+
+
+def _checkpoint_dir(path):
+    """Return the directory of the checkpoint of this MPI rank in path."""
+    if MPI and MPI.COMM_WORLD.Get_size() > 1:
+        return Path(path) / f"proc{MPI.COMM_WORLD.Get_rank():02d}"
+    return Path(path)
+
+
+def write_checkpoint(path, arrays, state):
+    """Write a checkpoint to directory path, replacing an existing checkpoint only once the new one is complete.
+
+    arrays is a dict of groups of named arrays, which are stored as uncompressed .npy files in a subdirectory
+    per group, and state is a JSON-serialisable dict.
+    """
+    directory = _checkpoint_dir(path)
+    tmpdir = directory.with_name(directory.name + ".tmp")
+    olddir = directory.with_name(directory.name + ".old")
+    shutil.rmtree(tmpdir, ignore_errors=True)
+    tmpdir.mkdir(parents=True)
+    for group, group_arrays in arrays.items():
+        (tmpdir / group).mkdir()
+        for name, values in group_arrays.items():
+            np.save(tmpdir / group / f"{name}.npy", values)
+    (tmpdir / "checkpoint.json").write_text(json.dumps(state))
+
+    shutil.rmtree(olddir, ignore_errors=True)
+    if directory.exists():
+        os.replace(directory, olddir)
+    os.replace(tmpdir, directory)
+    shutil.rmtree(olddir, ignore_errors=True)
+
+
+def read_checkpoint(path):
+    """Return the arrays (per group) and the state of the checkpoint in directory path."""
+    directory = _checkpoint_dir(path)
+    state = json.loads((directory / "checkpoint.json").read_text())
+    arrays = {
+        group.name: {file.stem: np.load(file) for file in group.glob("*.npy")}
+        for group in directory.iterdir()
+        if group.is_dir()
+    }
+    return arrays, state
@@ -0,0 +1,163 @@
+"""Internal spatial decomposition of the domain of a FieldSet over MPI ranks."""
+
+import math
+
+import numpy as np
+
+from parcels._compat import MPI
+
+
+class DomainDecomposition:
+    """Decomposition of a lon/lat extent into an array of tiles, one per MPI rank.
+
+    The number of tiles in each direction is chosen such that the tiles are as close to square as possible.
+    Particles outside of the extent belong to the nearest tile.
+
+    Parameters
+    ----------
+    lon_range : tuple of float
+        Minimum and maximum longitude of the extent.
+    lat_range : tuple of float
+        Minimum and maximum latitude of the extent.
+    nranks : int
+        Number of tiles (MPI ranks).
+    """
+
+    def __init__(self, lon_range, lat_range, nranks):
+        width, height = lon_range[1] - lon_range[0], lat_range[1] - lat_range[0]
+        aspect = width / height if width > 0 and height > 0 else 1.0
+        divisors = [d for d in range(1, nranks + 1) if nranks % d == 0]
+        nlon = min(divisors, key=lambda d: abs(math.log(d * d / (nranks * aspect))))
+        self.lon_edges = np.linspace(lon_range[0], lon_range[1], nlon + 1)
+        self.lat_edges = np.linspace(lat_range[0], lat_range[1], nranks // nlon + 1)
+
+    def tile(self, rank):
+        """Return the (lon, lat) edges of the tile of rank."""
+        j, i = divmod(rank, len(self.lon_edges) - 1)
+        return self.lon_edges[i : i + 2], self.lat_edges[j : j + 2]
+
+    def owner(self, lon, lat):
+        """Return the rank owning the tile of each position."""
+        i = np.clip(np.searchsorted(self.lon_edges, lon, side="right") - 1, 0, len(self.lon_edges) - 2)
+        j = np.clip(np.searchsorted(self.lat_edges, lat, side="right") - 1, 0, len(self.lat_edges) - 2)
+        return j * (len(self.lon_edges) - 1) + i
+
+    def partition(self, coords, mpi_size=1):
+        """Partition function (see :class:`ParticleSet`) assigning particles to the rank of their tile."""
+        return self.owner(coords[:, 0], coords[:, 1])
+
+    def migrate(self, particledata):
+        """Send the particles that left the tile of this rank to the ranks owning their new tiles.
+
+        Returns whether any particle moved.
+        """
+        comm = MPI.COMM_WORLD
+        dest = self.owner(particledata._data["lon"], particledata._data["lat"])
+        if comm.allreduce(int(np.count_nonzero(dest != comm.Get_rank())), op=MPI.SUM) == 0:
+            return False
+        exchange_particles(particledata, dest)
+        return True
+
+
+def time_range(times):
+    """Return the minimum and maximum of times over all MPI ranks (some of which may hold no particles)."""
+    comm = MPI.COMM_WORLD
+    tmin = comm.allreduce(float(np.min(times)) if len(times) else np.inf, op=MPI.MIN)
+    tmax = comm.allreduce(float(np.max(times)) if len(times) else -np.inf, op=MPI.MAX)
+    return tmin, tmax
+
+
+def exchange_particles(particledata, dest):
+    """Send each particle to MPI rank dest, and receive the particles that other ranks send to this rank."""
+    data = particledata._data
+    exceptions = {name: values for name, values in data.items() if values.dtype == object}
+    received = exchange_arrays({name: values for name, values in data.items() if name not in exceptions}, dest)
+    nrecv = len(received["id"])
+    for name in exceptions:  # the exceptions of Scipy particles, which only live within a kernel call
+        received[name] = np.empty(nrecv, dtype=object)
+    particledata._data = {name: received[name] for name in data}
+    particledata._ncount = nrecv
+    particledata._sorted = bool(np.all(np.diff(received["id"]) >= 0))
+
+
+def exchange_arrays(arrays, dest):
+    """Send row i of each of the arrays to MPI rank dest[i], and return the rows received from all ranks.
+
+    The rows are exchanged with MPI alltoallv, ordered by the rank they are received from.
+    """
+    comm = MPI.COMM_WORLD
+    sendcounts = np.bincount(dest, minlength=comm.Get_size())
+    recvcounts = np.array(comm.alltoall(sendcounts.tolist()))
+    nrecv = int(recvcounts.sum())
+    order = np.argsort(dest, kind="stable")
+    received = {}
+    for name, values in arrays.items():
+        rowsize = math.prod(values.shape[1:])
+        received[name] = np.empty((nrecv,) + values.shape[1:], dtype=values.dtype)
+        comm.Alltoallv(
+            [np.ascontiguousarray(values[order]), (sendcounts * rowsize).tolist()],
+            [received[name], (recvcounts * rowsize).tolist()],
+        )
+    return received
+
+
+def hilbert_keys(lon, lat, lon_range, lat_range, order=16):
+    """Return the index of each position along a Hilbert curve through 2**order x 2**order cells of the extent.
+
+    Positions that are close along the curve are close in space, so that contiguous ranges of keys
+    are compact regions. Positions outside of the extent get the key of the nearest cell.
+    """
+    n = 1 << order
+    width = max(lon_range[1] - lon_range[0], 1e-12)
+    height = max(lat_range[1] - lat_range[0], 1e-12)
+    x = np.clip(((np.asarray(lon, dtype=np.float64) - lon_range[0]) / width * n).astype(np.int64), 0, n - 1)
+    y = np.clip(((np.asarray(lat, dtype=np.float64) - lat_range[0]) / height * n).astype(np.int64), 0, n - 1)
+    keys = np.zeros(x.shape, dtype=np.int64)
+    s = n >> 1
+    while s > 0:
+        rx = (x & s) > 0
+        ry = (y & s) > 0
+        keys += s * s * ((3 * rx) ^ ry)
+        flip = rx & ~ry  # rotate the quadrant, so that the curve is continuous
+        x = np.where(flip, n - 1 - x, x)
+        y = np.where(flip, n - 1 - y, y)
+        x, y = np.where(ry, x, y), np.where(ry, y, x)
+        s >>= 1
+    return keys
+
+
+def balanced_split(keys, weights, nranks, order=16, nbins=2**20):
+    """Return the MPI rank of each key, such that each rank gets a contiguous range of keys of equal total weight.
+
+    keys (see :func:`hilbert_keys`) and weights are those of the particles on this rank. The split is computed
+    from a histogram of the keys over all ranks, so that no particle data is gathered.
+    """
+    comm = MPI.COMM_WORLD
+    shift = max(2 * order - int(math.log2(nbins)), 0)
+    bins = keys >> shift
+    hist = np.bincount(bins, weights=weights, minlength=4**order >> shift).astype(np.float64)
+    comm.Allreduce(MPI.IN_PLACE, hist, op=MPI.SUM)
+    cumulative = np.cumsum(hist)
+    if cumulative[-1] <= 0:
+        return np.zeros(len(keys), dtype=int)
+    binrank = np.minimum(((cumulative - hist / 2) / cumulative[-1] * nranks).astype(int), nranks - 1)
+    return binrank[bins]
+
+
+def hilbert_partition(lon, lat):
+    """Return the MPI rank of each position on this rank, splitting the positions of all ranks along a Hilbert curve.
+
+    Each rank gets a contiguous range of the curve, through the extent of all positions, with an equal
+    number of positions.
+    """
+    comm = MPI.COMM_WORLD
+    lon_range = (
+        comm.allreduce(float(np.nanmin(lon)) if len(lon) else np.inf, op=MPI.MIN),
+        comm.allreduce(float(np.nanmax(lon)) if len(lon) else -np.inf, op=MPI.MAX),
+    )
+    lat_range = (
+        comm.allreduce(float(np.nanmin(lat)) if len(lat) else np.inf, op=MPI.MIN),
+        comm.allreduce(float(np.nanmax(lat)) if len(lat) else -np.inf, op=MPI.MAX),
+    )
+    keys = hilbert_keys(lon, lat, lon_range, lat_range)
+    return balanced_split(keys, np.ones(len(keys)), comm.Get_size())
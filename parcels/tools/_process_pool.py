@@ -0,0 +1,240 @@
+"""Internal execution of a Kernel over shards of a ParticleSet in a pool of forked worker processes."""
+
+import ctypes
+import multiprocessing
+import pickle
+import random
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from parcels.fieldfilebuffer import _close_pooled_datasets
+from parcels.tools.statuscodes import StatusCode
+
+_worker_state = None  # the Kernel and ParticleSet of the pool, set before the worker processes are forked
+_worker_windows = {}  # name of a Field: SharedMemory of its time window, as mapped by a worker process
+
+
+class ProcessPool:
+    """Pool of nprocesses forked worker processes, which execute kernel over shards of pset.
+
+    The workers are forked once (for a call of :meth:`parcels.particleset.ParticleSet.execute`), so that they
+    start with the memory of this process (copy-on-write), including the Field data loaded so far. The snapshots
+    of deferred-load Fields are only read by this process: before each execution, the time window of every such
+    Field is copied (if it changed) to shared memory, which the workers map read-only instead of reading from
+    file, so that neither the reads nor the memory of the snapshots grow with the number of workers. This is
+    not available for deferred-load Fields with dask chunking, whose blocks are read while the kernel executes
+    (and a dask thread pool can not be used after a fork). The datasets opened before the fork are closed in the
+    workers, as HDF5 is not fork-safe.
+    The particles are passed to and from the workers in shared memory, from which the ParticleSet is
+    reassembled in the original order. The random number generators of the workers are seeded from the
+    generator of this process plus the index of the shard, so that random kernels draw different numbers in each
+    shard, but not the numbers of an execution in a single process (or in another number of processes).
+    A particle that stops all execution only stops the execution of its own shard.
+    """
+
+    def __init__(self, kernel, pset, nprocesses):
+        global _worker_state
+        if "fork" not in multiprocessing.get_all_start_methods():
+            raise RuntimeError("Executing a ParticleSet in multiple processes needs the 'fork' start method")
+        if pset.fieldset._node_shared:
+            raise ValueError("Execution in multiple processes is not available with node-shared memory")
+        if any(f.chunksize not in [False, None] for f in pset.fieldset._deferred_file_fields()):
+            raise ValueError("Execution in multiple processes is not available for deferred-load Fields with chunksize")
+        self.nprocesses = nprocesses
+        self._windows = {}  # name of a Field: SharedMemory, array and key of the time window mapped by the workers
+        _worker_state = (kernel, pset)
+        resource_tracker.ensure_running()  # shared with the workers, which attach to the shared memory of this process
+        self._pool = multiprocessing.get_context("fork").Pool(nprocesses, initializer=_close_pooled_datasets)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Stop the worker processes and free the shared memory of the time windows."""
+        global _worker_state
+        self._pool.close()
+        self._pool.join()
+        _worker_state = None
+        for name in list(self._windows):
+            self._free_window(name)
+
+    def _free_window(self, name):
+        buffer, _, _ = self._windows.pop(name)
+        buffer.close()
+        buffer.unlink()
+
+    def _share_windows(self, fieldset):
+        """Copy the time windows of the deferred-load Fields that changed since the last execution to shared memory.
+
+        Returns, for each Field, the name of its shared memory, the shape and dtype of its time window (in time
+        order) and the subset window of its grid, for the workers to map.
+        """
+        windows = {}
+        for f in fieldset._deferred_file_fields():
+            if not isinstance(f.data, np.ndarray):
+                continue
+            g = f.grid
+            key = (id(f.data), f._time_ring_start, g._ti, tuple(g.time), g._subset_window)
+            shared = self._windows.get(f.name)
+            if shared is not None and (shared[1].shape != f.data.shape or shared[1].dtype != f.data.dtype):
+                self._free_window(f.name)  # the workers keep their mapping of it until they remap
+                shared = None
+            if shared is None:
+                buffer = SharedMemory(create=True, size=max(f.data.nbytes, 1))
+                shared = (buffer, np.ndarray(f.data.shape, dtype=f.data.dtype, buffer=buffer.buf), None)
+            if shared[2] != key or fieldset.compute_on_defer:  # compute_on_defer may change the data in place
+                shared[1][...] = f.data
+                shared = (shared[0], shared[1], key)
+            self._windows[f.name] = shared
+            windows[f.name] = (shared[0].name, f.data.shape, f.data.dtype.str, g._subset_window)
+        return windows
+
+    def execute(self, pset, time, endtime, dt):
+        """Execute the kernel from time to endtime over pset, split into contiguous shards (one per process)."""
+        data = pset.particledata._data
+        nshards = min(self.nprocesses, len(pset))
+        bounds = np.linspace(0, len(pset), nshards + 1).astype(int)
+        layout, nbytes = {}, 0
+        for name, values in data.items():
+            if values.dtype != object:
+                nbytes = -(-nbytes // 8) * 8  # aligned to 8 bytes
+                layout[name] = (values.dtype.str, values.shape[1:], nbytes)
+                nbytes += values.nbytes
+        buffer = SharedMemory(create=True, size=max(nbytes, 1))
+        arrays = None
+        try:
+            arrays = _buffer_arrays(buffer, layout, len(pset))
+            for name in arrays:
+                arrays[name][:] = data[name]
+            seed = ctypes.CDLL(None).rand()  # the C library generator, which is also used by the JIT kernels
+            particlefile = pset.fieldset.particlefile
+            windows = self._share_windows(pset.fieldset)
+            args = [
+                (shard, buffer.name, layout, bounds, time, endtime, dt, seed, particlefile is not None, windows)
+                for shard in range(nshards)
+            ]
+            results = self._pool.map(_execute_shard, args, chunksize=1)
+            for result in results:
+                if isinstance(result, Exception):  # an exception in a worker, which is re-raised here
+                    if isinstance(getattr(result, "field", None), str):
+                        result.field = getattr(pset.fieldset, result.field, None)
+                    raise result
+
+            # each shard holds its remaining particles, followed by its deleted ones (if these are written)
+            kept = [np.arange(bounds[i], bounds[i] + count) for i, (_, count, _) in enumerate(results)]
+            deleted = [
+                np.arange(bounds[i] + count, bounds[i] + count + ndeleted)
+                for i, (_, count, ndeleted) in enumerate(results)
+            ]
+            rows = np.concatenate(kept + deleted)
+            for name in data:
+                data[name] = arrays[name][rows] if name in arrays else np.empty(len(rows), dtype=object)
+        finally:
+            arrays = None  # views on the buffer, which can only be closed without them
+            buffer.close()
+            buffer.unlink()
+        pset.particledata._ncount = len(rows)
+        ndeleted = sum(len(d) for d in deleted)
+        if ndeleted > 0:
+            indices = np.arange(len(rows) - ndeleted, len(rows))
+            particlefile.write(pset, None, indices=indices)
+            pset.remove_indices(indices)
+        statuses = [status for status, _, _ in results]
+        return StatusCode.StopAllExecution if StatusCode.StopAllExecution in statuses else None
+
+
+def _buffer_arrays(buffer, layout, nrows):
+    """Return the arrays of the particle Variables in the shared memory buffer."""
+    return {
+        name: np.ndarray((nrows, *shape), dtype=dtype, buffer=buffer.buf, offset=offset)
+        for name, (dtype, shape, offset) in layout.items()
+    }
+
+
+class _DeletedParticles:
+    """Stand-in for the ParticleFile in the worker processes, which keeps the deleted particles (written by the parent).
+
+    The ParticleFile itself can only be written by the parent process, which holds its state.
+    """
+
+    def __init__(self):
+        self.data = []
+
+    def write(self, pset, time, indices=None):
+        self.data.append({name: values[indices] for name, values in pset.particledata._data.items()})
+
+
+def _map_windows(fieldset, windows):
+    """Map the time windows of the deferred-load Fields, loaded by the parent process, in a worker process.
+
+    The Fields sample the (read-only) shared memory of the parent process, and take over the subset windows of
+    its grids, so that :meth:`parcels.fieldset.FieldSet.computeTimeChunk` only updates the time window of the grids.
+    """
+    fieldset.compute_on_defer = None  # applied by the parent process to the shared time windows
+    for name, (buffer_name, shape, dtype, subset_window) in windows.items():
+        f = getattr(fieldset, name)
+        buffer = _worker_windows.get(name)
+        if buffer is None or buffer.name != buffer_name:
+            buffer = _worker_windows[name] = SharedMemory(name=buffer_name)  # a previous one is freed at exit
+        window = np.ndarray(shape, dtype=dtype, buffer=buffer.buf)
+        window.flags.writeable = False
+        f._parent_ring = (window, 0)
+        f.data = f._time_ring = window
+        f._time_ring_start = 0
+        g = f.grid
+        if g._subset_window != subset_window:
+            g._subset_window = subset_window
+            g._ti = -1
+            g._reload = True
+
+
+def _execute_shard(args):
+    """Execute the kernel over a shard of the particles, in a worker process.
+
+    Returns the status of the execution, the number of particles left in the shard and the number of deleted
+    particles (which follow them in the shared memory, if they are to be written), or the exception raised.
+    """
+    shard, buffer_name, layout, bounds, time, endtime, dt, seed, write_deleted, windows = args
+    kernel, pset = _worker_state
+    start, stop = bounds[shard], bounds[shard + 1]
+    ctypes.CDLL(None).srand(seed + shard)
+    random.seed(seed + shard)
+    buffer = SharedMemory(name=buffer_name)
+    arrays = None
+    try:
+        arrays = _buffer_arrays(buffer, layout, bounds[-1])
+        # the same subset windows and snapshots of the Fields as in the parent process
+        _map_windows(pset.fieldset, windows)
+        pset.fieldset.computeTimeChunk(time, dt)
+        pset.particledata._data = {
+            name: arrays[name][start:stop].copy() if name in arrays else np.empty(stop - start, dtype=object)
+            for name in pset.particledata._data
+        }
+        pset.particledata._ncount = stop - start
+        deleted = _DeletedParticles() if write_deleted else None
+        kernel.fieldset._particlefile = deleted
+        try:
+            status = kernel.execute(pset, endtime=endtime, dt=dt)
+        except Exception as e:
+            if getattr(e, "field", None) is not None:  # the Field is restored by its name in the parent process
+                e.field = e.field.name
+            try:  # an error that can not be unpickled would stop the pool from returning
+                pickle.loads(pickle.dumps(e))
+            except Exception:
+                return RuntimeError(f"{type(e).__name__} in worker process: {e}")
+            return e
+        count = len(pset)
+        ndeleted = sum(len(d["id"]) for d in deleted.data) if deleted is not None else 0
+        for name in arrays:
+            arrays[name][start : start + count] = pset.particledata._data[name]
+            if ndeleted > 0:
+                arrays[name][start + count : start + count + ndeleted] = np.concatenate([d[name] for d in deleted.data])
+    finally:
+        arrays = None
+        buffer.close()
+    return status, count, ndeleted
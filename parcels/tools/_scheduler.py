@@ -0,0 +1,42 @@
+"""Internal scheduling of the events in the time loop of :meth:`parcels.particleset.ParticleSet.execute`."""
+
+import heapq
+from itertools import count
+
+import numpy as np
+
+
+class EventScheduler:
+    """Priority queue of the events (e.g. output, particle release, callbacks) of a time loop in the direction of dt.
+
+    Each event has an action (a function without arguments), which is called when the time loop reaches the time of
+    the event, and an interval after which the event recurs. Events at the same time are executed in order of their
+    priority, and then in order of their registration.
+    """
+
+    def __init__(self, dt, tol=1e-12):
+        self._sign = np.sign(dt)
+        self._tol = tol
+        self._queue = []
+        self._order = count()
+
+    def __len__(self):
+        return len(self._queue)
+
+    def add(self, action, time, interval=np.inf, priority=0):
+        """Schedule action at time, and then every interval after time (only once if interval is inf)."""
+        heapq.heappush(self._queue, (self._sign * time, priority, next(self._order), interval, action))
+
+    def next_time(self):
+        """Return the time of the next event (or inf in the direction of dt if there are none)."""
+        return self._sign * self._queue[0][0] if self._queue else self._sign * np.inf
+
+    def run(self, time):
+        """Execute the actions of the events at time, and reschedule the recurring ones."""
+        due = []
+        while self._queue and self._queue[0][0] <= self._sign * time + self._tol:
+            due.append(heapq.heappop(self._queue))
+        for key, priority, _, interval, action in sorted(due, key=lambda event: event[1:3]):
+            action()
+            if np.isfinite(interval):
+                self.add(action, self._sign * key + self._sign * interval, interval, priority)
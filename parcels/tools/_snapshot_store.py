@@ -0,0 +1,57 @@
+"""Internal on-disk store of the time snapshots of deferred-load Fields."""
+
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+
+class SnapshotStore:
+    """Directory with the time snapshots of Fields as uncompressed .npy files, which are memory-mapped when read.
+
+    Each Field has a subdirectory with one file per time index, and an index.json file that describes the
+    source of the snapshots, so that a store is only used for the Fields it was written for.
+
+    Parameters
+    ----------
+    directory : str or Path
+        Directory of the store. It is created when the first snapshot is written.
+    """
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self._indices = {}
+
+    def _path(self, name, ti):
+        return self.directory / name / f"{ti:06d}.npy"
+
+    def index(self, name):
+        """Return the index of the snapshots of Field name, or None if the store has no snapshots of it."""
+        if name not in self._indices:
+            path = self.directory / name / "index.json"
+            self._indices[name] = json.loads(path.read_text()) if path.is_file() else None
+        return self._indices[name]
+
+    def write_index(self, name, index):
+        """Set the index of the snapshots of Field name, removing all its snapshots if the index changed."""
+        if self.index(name) != index:
+            (self.directory / name).mkdir(parents=True, exist_ok=True)
+            for path in (self.directory / name).glob("*.npy"):
+                path.unlink()
+            (self.directory / name / "index.json").write_text(json.dumps(index))
+        self._indices[name] = index
+
+    def read(self, name, ti):
+        """Return the snapshot at time index ti of Field name as read-only memory map, or None if not stored."""
+        path = self._path(name, ti)
+        if not path.is_file():
+            return None
+        return np.load(path, mmap_mode="r")
+
+    def write(self, name, ti, data):
+        """Store data as the snapshot at time index ti of Field name."""
+        path = self._path(name, ti)
+        tmppath = path.with_suffix(".tmp.npy")
+        np.save(tmppath, np.ascontiguousarray(data))
+        os.replace(tmppath, path)  # so that a partially written snapshot is never read
@@ -26,7 +26,22 @@ class StatusCode:
     ErrorTimeExtrapolation = 70
 
 
-class DaskChunkingError(RuntimeError):
+def _rebuild_error(error_type, args, attributes):
+    """Return an error of error_type with args and attributes, without calling its __init__ (used in unpickling)."""
+    error = error_type.__new__(error_type)
+    error.args = args
+    error.__dict__.update(attributes)
+    return error
+
+
+class _PicklableError(RuntimeError):
+    """Base of the errors whose __init__ takes other arguments than their args, so that they can be pickled."""
+
+    def __reduce__(self):
+        return _rebuild_error, (type(self), self.args, self.__dict__)
+
+
+class DaskChunkingError(_PicklableError):
     """Error indicating to the user that something with setting up Dask and chunked fieldsets went wrong."""
 
     def __init__(self, src_class_type, message):
@@ -34,7 +49,7 @@ class DaskChunkingError(RuntimeError):
         super().__init__(msg)
 
 
-class FieldSamplingError(RuntimeError):
+class FieldSamplingError(_PicklableError):
     """Utility error class to propagate erroneous field sampling."""
 
     def __init__(self, x, y, z, field=None):
@@ -46,7 +61,7 @@ class FieldSamplingError(RuntimeError):
         super().__init__(message)
 
 
-class FieldOutOfBoundError(RuntimeError):
+class FieldOutOfBoundError(_PicklableError):
     """Utility error class to propagate out-of-bound field sampling."""
 
     def __init__(self, x, y, z, field=None):
@@ -58,7 +73,7 @@ class FieldOutOfBoundError(RuntimeError):
         super().__init__(message)
 
 
-class FieldOutOfBoundSurfaceError(RuntimeError):
+class FieldOutOfBoundSurfaceError(_PicklableError):
     """Utility error class to propagate out-of-bound field sampling at the surface."""
 
     def __init__(self, x, y, z, field=None):
@@ -72,7 +87,7 @@ class FieldOutOfBoundSurfaceError(RuntimeError):
         super().__init__(message)
 
 
-class TimeExtrapolationError(RuntimeError):
+class TimeExtrapolationError(_PicklableError):
     """Utility error class to propagate erroneous time extrapolation sampling."""
 
     def __init__(self, time, field=None, msg="allow_time_extrapoltion"):
@@ -88,7 +103,7 @@ class TimeExtrapolationError(RuntimeError):
         super().__init__(message)
 
 
-class KernelError(RuntimeError):
+class KernelError(_PicklableError):
     """General particle kernel error with optional custom message."""
 
     def __init__(self, particle, fieldset=None, msg=None):
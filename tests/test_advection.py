@@ -220,6 +220,19 @@ def test_advection_periodic_zonal(mode):
     assert abs(pset.lon[0] - 0.15) < 0.1
 
 
+@pytest.mark.parametrize("mode", ["scipy", "jit"])
+def test_advection_periodic_zonal_virtual(mode):
+    xdim, ydim = 100, 100
+    fieldset = create_periodic_fieldset(xdim, ydim, uvel=1.0, vvel=0.0)
+    fieldset.add_periodic_halo(zonal=True, virtual=True)
+    assert len(fieldset.U.lon) == xdim
+    assert fieldset.U.data.shape[-1] == xdim
+
+    pset = ParticleSet(fieldset, pclass=ptype[mode], lon=[0.5], lat=[0.5])
+    pset.execute(AdvectionRK4 + pset.Kernel(periodicBC), runtime=timedelta(hours=20), dt=timedelta(seconds=30))
+    assert abs(pset.lon[0] - 0.15) < 0.1
+
+
 @pytest.mark.parametrize("mode", ["scipy", "jit"])
 def test_advection_periodic_meridional(mode):
     xdim, ydim = 100, 100
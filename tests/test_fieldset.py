@@ -1,8 +1,11 @@
 import datetime
 import gc
+import json
 import os
+import shutil
 import sys
 from datetime import timedelta
+from types import SimpleNamespace
 
 import cftime
 import dask
@@ -16,15 +19,17 @@ from parcels import (
     AdvectionRK4,
     AdvectionRK4_3D,
     FieldSet,
+    FieldSetWarning,
     JITParticle,
     ParticleSet,
     RectilinearZGrid,
     ScipyParticle,
     TimeExtrapolationError,
     Variable,
+    fieldfilebuffer,
 )
 from parcels.field import Field, VectorField
-from parcels.fieldfilebuffer import DaskFileBuffer
+from parcels.fieldfilebuffer import DaskFileBuffer, NetcdfFileBuffer, _DatasetLease, _time_index_path
 from parcels.tools.converters import (
     GeographicPolar,
     TimeConverter,
@@ -82,6 +87,36 @@ def test_fieldset_vmin_vmax():
     assert np.isclose(np.amax(fieldset.U.data), 7)
 
 
+@pytest.mark.parametrize("datatype", ["numpy", "dask", "float64", "view"])
+def test_field_rescale_and_set_minmax(datatype):
+    data = np.random.default_rng(0).normal(scale=4, size=(2, 30, 40)).astype(np.float32)
+    data[data > 6] = np.nan
+    field = Field("P", np.zeros((2, 30, 40), dtype=np.float32), lon=np.arange(40), lat=np.arange(30), time=np.arange(2))
+    field.vmin, field.vmax = -5, 5
+    field.set_scaling_factor(2.0)
+
+    expected = data.copy()
+    expected[np.isnan(expected)] = 0
+    expected *= 2.0
+    expected[(expected < -5) | (expected > 5)] = 0
+
+    if datatype == "numpy":
+        result = field._rescale_and_set_minmax(data)
+        assert result is data
+    elif datatype == "dask":
+        result = field._rescale_and_set_minmax(da.from_array(data, chunks=(1, 16, 16))).compute()
+        assert np.isnan(data).any()  # the dask input is not modified
+    elif datatype == "float64":
+        result = np.empty(data.shape, dtype=np.float32)
+        field._rescale_and_set_minmax(data.astype(np.float64), out=result)
+    else:
+        padded = np.full((2, 34, 44), -1, dtype=np.float32)
+        result = padded[:, 2:-2, 2:-2]
+        field._rescale_and_set_minmax(data, out=result)
+        assert np.all(padded[:, :2] == -1) and np.all(padded[:, :, -2:] == -1)
+    assert np.array_equal(result, expected)
+
+
 @pytest.mark.parametrize("ttype", ["float", "datetime64"])
 @pytest.mark.parametrize("tdim", [1, 20])
 def test_fieldset_from_data_timedims(ttype, tdim):
@@ -304,6 +339,86 @@ def test_fieldset_float64(cast_data_dtype, mode, tmpdir):
         assert da["U"].dtype == np.float64
 
 
+@pytest.mark.parametrize("cast_data_dtype", ["float16", "int16", "uint16"])
+@pytest.mark.parametrize("chunksize", [False, {"lat": ("y", 8), "lon": ("x", 8)}])
+def test_fieldset_compact_dtype(cast_data_dtype, chunksize, tmpdir):
+    lon = np.arange(20, dtype=np.float32)
+    lat = np.arange(16, dtype=np.float32)
+    filenames = []
+    for t in range(4):
+        UV = 0.2 + 0.5 * np.random.default_rng(t).random((2, 1, 3, lat.size, lon.size))
+        UV[:, :, :, 0, 0] = np.nan  # land
+        coords = {"x": lon, "y": lat, "z": [0.0, 10.0, 20.0], "t": [t * 10.0]}
+        ds = xr.Dataset({"U": (("t", "z", "y", "x"), UV[0]), "V": (("t", "z", "y", "x"), UV[1])}, coords=coords)
+        encoding = {v: {"dtype": "int16", "scale_factor": 1e-4, "add_offset": 0.0, "_FillValue": -32768} for v in "UV"}
+        filenames.append(str(tmpdir.join(f"packed_{t}.nc")))
+        ds.to_netcdf(filenames[-1], encoding=encoding)
+
+    def run(cast_data_dtype, mode="jit"):
+        fieldset = FieldSet.from_netcdf(
+            filenames,
+            {"U": "U", "V": "V"},
+            {"lon": "x", "lat": "y", "depth": "z", "time": "t"},
+            mesh="flat",
+            cast_data_dtype=cast_data_dtype,
+            chunksize=chunksize,
+        )
+        pset = ParticleSet(fieldset, ptype[mode], lon=[2.2, 5.5, 0.1], lat=[3.3, 1.1, 0.1], depth=[1, 5, 15])
+        pset.execute(AdvectionRK4, runtime=25, dt=1)
+        return fieldset, pset
+
+    _, pset_ref = run("float32")
+    fieldset, pset = run(cast_data_dtype)
+    assert fieldset.U.data.dtype == cast_data_dtype
+    if cast_data_dtype == "float16":
+        assert np.allclose(pset.lon, pset_ref.lon, atol=5e-3)
+        assert np.allclose(pset.lat, pset_ref.lat, atol=5e-3)
+    else:  # the data is stored with the packing of the file, so it is decoded to the same values
+        assert fieldset.U._packing == (1e-4, 0)
+        assert np.array_equal(pset.lon, pset_ref.lon)
+        assert np.array_equal(pset.lat, pset_ref.lat)
+    with pytest.raises(RuntimeError):
+        run(cast_data_dtype, mode="scipy")
+
+
+def test_field_packed_data(tmpdir):
+    data, dimensions = generate_fieldset_data(10, 8)
+    data["U"][0, 0] = 0  # land
+    fieldset = FieldSet.from_data(data, dimensions, mesh="flat", cast_data_dtype="int16", packing=(1e-3, 0.3))
+    assert fieldset.U.data.dtype == np.int16
+    assert fieldset.U._packing == (1e-3, -300)  # the offset is a multiple of the scale factor
+
+    filepath = tmpdir.join("packed")
+    fieldset.write(filepath)
+    ds = xr.open_dataset(str(filepath) + "U.nc")
+    assert ds["vozocrtx"].encoding["dtype"] == np.int16
+    assert ds["vozocrtx"].values[0, 0, 0, 0] == 0
+    assert np.allclose(ds["vozocrtx"].values[0, 0], data["U"], atol=5e-4)
+    ds.close()
+
+    fieldset = FieldSet.from_parcels(str(filepath), cast_data_dtype="int16")  # the packing is read from file
+    assert fieldset.U._packing == (1e-3, -300)
+    FieldSet.from_data(data, dimensions, mesh="flat").write(tmpdir.join("unpacked"))
+    with pytest.raises(ValueError):
+        FieldSet.from_parcels(str(tmpdir.join("unpacked")), cast_data_dtype="int16")
+
+
+@pytest.mark.parametrize("cast_data_dtype", ["int16", "uint16"])
+def test_field_packed_data_range(cast_data_dtype):
+    data, dimensions = generate_fieldset_data(10, 8)
+    data["U"] = 1e-3 * data["U"] - 2e-3  # values below 1, which only keep their precision with a fitting packing
+    data["U"][0, 0] = 0  # land
+    fieldset = FieldSet.from_data(data, dimensions, mesh="flat", cast_data_dtype=cast_data_dtype)
+    scale_factor, zero_code = fieldset.U._packing
+    assert scale_factor < 1e-6
+    decoded = (fieldset.U.data.astype(np.float64) - zero_code) * scale_factor
+    assert decoded[0, 0, 0] == 0
+    assert np.allclose(decoded[0], data["U"], rtol=0, atol=scale_factor)
+
+    with pytest.raises(ValueError, match="can not represent zero"):
+        FieldSet.from_data(data, dimensions, mesh="flat", cast_data_dtype=cast_data_dtype, packing=(1e-4, 10.0))
+
+
 @pytest.mark.parametrize("indslon", [range(10, 20), [1]])
 @pytest.mark.parametrize("indslat", [range(30, 60), [22]])
 def test_fieldset_from_file_subsets(indslon, indslat, tmpdir):
@@ -807,6 +922,261 @@ def test_from_netcdf_chunking(mode, time_periodic, chunksize, deferLoad):
     pset.execute(AdvectionRK4, dt=1, runtime=1)
 
 
+@pytest.mark.parametrize("deferLoad", [True, False])
+def test_chunk_readahead(deferLoad):
+    fnameU = str(TEST_DATA / "perlinfieldsU.nc")
+    fnameV = str(TEST_DATA / "perlinfieldsV.nc")
+    timestamps = np.expand_dims(np.arange(0, 4, 1) * 86400.0, 1)
+    files = {"U": [fnameU] * 4, "V": [fnameV] * 4}
+    variables = {"U": "vozocrtx", "V": "vomecrty"}
+    dimensions = {"lon": "nav_lon", "lat": "nav_lat"}
+
+    def run(max_velocity):
+        fieldset = FieldSet.from_netcdf(
+            files,
+            variables,
+            dimensions,
+            timestamps=timestamps,
+            deferred_load=deferLoad,
+            allow_time_extrapolation=True,
+            chunksize={"lat": ("y", 32), "lon": ("x", 32)},
+        )
+        fieldset.add_chunk_readahead(max_velocity)
+        pset = ParticleSet(fieldset, pclass=JITParticle, lon=[-100, 0.5, 100], lat=[-40, 0.5, 40])
+        pset.execute(AdvectionRK4, dt=timedelta(hours=1), runtime=timedelta(days=2))
+        return fieldset, pset
+
+    fieldset_ref, pset_ref = run(None)
+    fieldset, pset = run(1e3)
+    assert np.array_equal(pset.lon, pset_ref.lon)
+    assert np.array_equal(pset.lat, pset_ref.lat)
+    nloaded = sum(c is not None for c in fieldset.U._data_chunks)
+    assert nloaded > sum(c is not None for c in fieldset_ref.U._data_chunks)
+
+    g = fieldset.U.grid
+    g._load_chunk[:] = g._chunk_not_loaded
+    fieldset.U._request_chunks_ahead(pset.lon, pset.lat, pset.depth, 0)
+    assert np.count_nonzero(g._load_chunk == g._chunk_loading_requested) in range(3, 3 * 4 + 1)
+    fieldset.U._request_chunks_ahead(pset.lon, pset.lat, pset.depth, 1e8)
+    assert np.all(g._load_chunk == g._chunk_loading_requested)
+
+
+@pytest.mark.parametrize("mode", ["scipy", "jit"])
+def test_auto_subsetting(mode, tmpdir):
+    lon = np.arange(40, dtype=np.float32)
+    lat = np.arange(30, 0, -1, dtype=np.float32)  # decreasing latitudes, so that the data is flipped
+    filenames = []
+    for t in range(4):
+        filenames.append(str(tmpdir.join(f"subset_{t}.nc")))
+        UV = 0.05 * (1 + np.random.default_rng(t).random((2, 1, lat.size, lon.size), dtype=np.float32))
+        coords = {"x": lon, "y": lat, "t": [t * 10.0]}
+        ds = xr.Dataset({"U": (("t", "y", "x"), UV[0]), "V": (("t", "y", "x"), UV[1])}, coords=coords)
+        ds.to_netcdf(filenames[-1])
+
+    def run(max_velocity):
+        fieldset = FieldSet.from_netcdf(
+            filenames, {"U": "U", "V": "V"}, {"lon": "x", "lat": "y", "time": "t"}, mesh="flat"
+        )
+        fieldset.add_auto_subsetting(max_velocity)
+        pset = ParticleSet(fieldset, pclass=ptype[mode], lon=[10.2, 12.5], lat=[10.4, 11.1])
+        windows = []
+        for _ in range(5):
+            pset.execute(AdvectionRK4, runtime=6, dt=1)
+            windows.append(fieldset.U.grid._subset_window)
+        return fieldset, pset, windows
+
+    fieldset_ref, pset_ref, _ = run(None)
+    fieldset, pset, windows = run(0.1)
+    assert np.array_equal(pset.lon, pset_ref.lon)
+    assert np.array_equal(pset.lat, pset_ref.lat)
+    assert windows[0] != windows[-1]  # the window has moved with the particles
+    j0, j1, i0, i1 = windows[-1]
+    assert j1 - j0 < lat.size and i1 - i0 < lon.size
+    # the data only holds the window, which is read as in the whole domain
+    assert fieldset.U.data.shape[-2:] == (j1 - j0, i1 - i0)
+    y0, y1, x0, x1 = fieldset.U.grid._subset_bounds()
+    assert np.array_equal(fieldset.U.data, fieldset_ref.U.data[..., y0:y1, x0:x1])
+
+    def SampleOutsideWindow(particle, fieldset, time):
+        (u, v) = fieldset.UV[time, particle.depth, 25.5, 35.5]
+
+    with pytest.raises(RuntimeError, match="sampled at"):  # a FieldSamplingError, re-raised in Scipy mode
+        pset.execute(SampleOutsideWindow, runtime=1, dt=-1)
+
+
+@pytest.mark.parametrize("mode", ["scipy", "jit"])
+@pytest.mark.parametrize("chunksize", [False, {"lat": ("y", 32), "lon": ("x", 32)}])
+def test_snapshot_cache(mode, chunksize):
+    fnameU = str(TEST_DATA / "perlinfieldsU.nc")
+    fnameV = str(TEST_DATA / "perlinfieldsV.nc")
+    timestamps = np.expand_dims(np.arange(0, 4, 1) * 86400.0, 1)
+    files = {"U": [fnameU] * 4, "V": [fnameV] * 4}
+    variables = {"U": "vozocrtx", "V": "vomecrty"}
+    dimensions = {"lon": "nav_lon", "lat": "nav_lat"}
+
+    def run(max_bytes):
+        fieldset = FieldSet.from_netcdf(
+            files, variables, dimensions, timestamps=timestamps, time_periodic=4 * 86400.0, chunksize=chunksize
+        )
+        fieldset.add_snapshot_cache(max_bytes)
+        pset = ParticleSet(fieldset, pclass=ptype[mode], lon=[0.2, 0.5, 0.8], lat=[0.3, 0.5, 0.7])
+        pset.execute(AdvectionRK4, dt=timedelta(hours=1), runtime=timedelta(days=10))
+        return pset, fieldset._snapshot_cache
+
+    pset_ref, _ = run(0)
+    pset, cache = run(2**28)
+    if mode == "jit" or chunksize is False:  # dask-chunked Fields are read lazily in scipy mode
+        assert cache.hits > 0
+        assert 0 < cache.size <= 2**28
+    assert np.array_equal(pset.lon, pset_ref.lon)
+    assert np.array_equal(pset.lat, pset_ref.lat)
+
+    _, cache = run(1)  # too small to hold a single snapshot
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize("mode", ["scipy", "jit"])
+@pytest.mark.parametrize("chunksize", [False, {"lat": ("y", 32), "lon": ("x", 32)}])
+def test_snapshot_store(mode, chunksize, tmpdir):
+    fnameU = shutil.copy(TEST_DATA / "perlinfieldsU.nc", tmpdir)
+    fnameV = shutil.copy(TEST_DATA / "perlinfieldsV.nc", tmpdir)
+    timestamps = np.expand_dims(np.arange(0, 4, 1) * 86400.0, 1)
+    files = {"U": [fnameU] * 4, "V": [fnameV] * 4}
+    variables = {"U": "vozocrtx", "V": "vomecrty"}
+    dimensions = {"lon": "nav_lon", "lat": "nav_lat"}
+
+    def create_fieldset(indices=None):
+        fieldset = FieldSet.from_netcdf(
+            files, variables, dimensions, indices=indices, timestamps=timestamps, chunksize=chunksize
+        )
+        fieldset.U.set_scaling_factor(2)  # applied after the (raw) snapshots are read from the store
+        return fieldset
+
+    def run(fieldset):
+        pset = ParticleSet(fieldset, pclass=ptype[mode], lon=[0.2, 0.5, 0.8], lat=[0.3, 0.5, 0.7])
+        pset.execute(AdvectionRK4, dt=timedelta(hours=1), runtime=timedelta(days=2))
+        return pset
+
+    pset_ref = run(create_fieldset())
+    create_fieldset().write_snapshot_store(tmpdir)
+    assert len(tmpdir.join("U").listdir("*.npy")) == 4
+
+    fieldset = create_fieldset()
+    fieldset.add_snapshot_store(tmpdir)
+    pset = run(fieldset)
+    assert np.array_equal(pset.lon, pset_ref.lon)
+    assert np.array_equal(pset.lat, pset_ref.lat)
+    snapshot = fieldset.U._read_snapshot(0)
+    assert isinstance(snapshot if chunksize is False else snapshot.compute(), np.ndarray)
+    if chunksize is False:
+        assert isinstance(snapshot, np.memmap)
+
+    fieldset = create_fieldset(indices={"lon": range(10, 100)})
+    with pytest.warns(FieldSetWarning, match="written for other"):
+        fieldset.add_snapshot_store(tmpdir)
+    assert fieldset.U._snapshot_store is None
+
+    os.utime(fnameU, ns=(os.stat(fnameU).st_atime_ns, os.stat(fnameU).st_mtime_ns + 10**9))
+    fieldset = create_fieldset()
+    with pytest.warns(FieldSetWarning, match="written for other"):
+        fieldset.add_snapshot_store(tmpdir)
+    assert fieldset.U._snapshot_store is None
+    assert fieldset.V._snapshot_store is not None
+
+
+@pytest.mark.parametrize("mode", ["scipy", "jit"])
+@pytest.mark.parametrize("time_periodic", [4 * 86400.0, False])
+def test_from_netcdf_memory_budget(mode, time_periodic):
+    fnameU = str(TEST_DATA / "perlinfieldsU.nc")
+    fnameV = str(TEST_DATA / "perlinfieldsV.nc")
+    timestamps = np.expand_dims(np.arange(0, 4, 1) * 86400.0, 1)
+    files = {"U": [fnameU] * 4, "V": [fnameV] * 4}
+    variables = {"U": "vozocrtx", "V": "vomecrty"}
+    dimensions = {"lon": "nav_lon", "lat": "nav_lat"}
+
+    def create_fieldset(memory_budget):
+        return FieldSet.from_netcdf(
+            files,
+            variables,
+            dimensions,
+            timestamps=timestamps,
+            time_periodic=time_periodic,
+            allow_time_extrapolation=not time_periodic,
+            memory_budget=memory_budget,
+        )
+
+    fieldset_deferred = create_fieldset(None)
+    nbytes = Field._resident_nbytes(fieldset_deferred.U.grid)
+    assert fieldset_deferred.U.grid.defer_load and fieldset_deferred.V.grid.defer_load
+
+    fieldset_resident = create_fieldset(2 * nbytes)
+    assert not fieldset_resident.U.grid.defer_load
+    assert fieldset_resident.U.grid is fieldset_resident.V.grid
+    assert fieldset_resident.U.data.shape[0] >= 4
+
+    fieldset_mixed = create_fieldset(int(1.5 * nbytes))  # only U fits, so V gets its own deferred grid
+    assert not fieldset_mixed.U.grid.defer_load
+    assert fieldset_mixed.V.grid.defer_load
+
+    # the budget is not used for Fields with dask chunking, of which the data would not be resident
+    fieldset_chunked = FieldSet.from_netcdf(
+        files, variables, dimensions, timestamps=timestamps, memory_budget=2 * nbytes, chunksize={"lat": ("y", 32)}
+    )
+    assert fieldset_chunked.U.grid.defer_load and fieldset_chunked.V.grid.defer_load
+
+    lons = []
+    for fieldset in [fieldset_deferred, fieldset_resident, fieldset_mixed]:
+        pset = ParticleSet(fieldset, pclass=ptype[mode], lon=[0.2, 0.5, 0.8], lat=[0.3, 0.5, 0.7])
+        pset.execute(AdvectionRK4, dt=timedelta(hours=1), runtime=timedelta(days=3))
+        lons.append(pset.lon)
+    assert np.allclose(lons[0], lons[1], atol=1e-6)
+    assert np.allclose(lons[0], lons[2], atol=1e-6)
+
+
+@pytest.mark.parametrize("mode", ["scipy", "jit"])
+@pytest.mark.parametrize("direction", [1, -1])
+def test_deferred_load_time_ring(mode, direction, tmpdir):
+    lon = np.linspace(0, 9, 10, dtype=np.float32)
+    lat = np.linspace(5, 0, 6, dtype=np.float32)  # decreasing latitudes, so that the data is flipped
+    filenames = []
+    for t in range(5):
+        filenames.append(str(tmpdir.join(f"ring_{t}.nc")))
+        P = np.random.default_rng(t).random((1, lat.size, lon.size), dtype=np.float32)
+        ds = xr.Dataset({"P": (("t", "y", "x"), P)}, coords={"x": lon, "y": lat, "t": [t * 3600.0]})
+        ds.to_netcdf(filenames[-1])
+
+    def create_fieldset(memory_budget):
+        fieldset = FieldSet.from_netcdf(
+            filenames,
+            {"U": "P", "V": "P", "P": "P"},
+            {"lon": "x", "lat": "y", "time": "t"},
+            mesh="flat",
+            memory_budget=memory_budget,
+        )
+        fieldset.add_periodic_halo(zonal=True, halosize=2)
+        return fieldset
+
+    def SampleP(particle, fieldset, time):
+        particle.p = fieldset.P[time, particle.depth, particle.lat, particle.lon]
+
+    pclass = ptype[mode].add_variable("p", dtype=np.float32)
+    psets = []
+    for fieldset in [create_fieldset(None), create_fieldset(1e9)]:
+        starttime = 0 if direction > 0 else 4 * 3600
+        psets.append(ParticleSet(fieldset, pclass, lon=[0.5, 4.2, 9.5], lat=[0.3, 2.5, 4.9], time=starttime))
+    assert psets[0].fieldset.P.grid.defer_load and not psets[1].fieldset.P.grid.defer_load
+
+    ring = None
+    for _ in range(7):
+        for pset in psets:
+            pset.execute(SampleP, runtime=1800, dt=direction * 600)
+        assert np.allclose(psets[0].p, psets[1].p, rtol=1e-6)
+        field = psets[0].fieldset.P
+        ring = field._time_ring if ring is None else ring
+        assert field._time_ring is ring  # the snapshots are loaded into the same buffer
+        assert np.shares_memory(field.data, ring)
+
+
 @pytest.mark.parametrize("datetype", ["float", "datetime64"])
 def test_timestamps(datetype, tmpdir):
     data1, dims1 = generate_fieldset_data(10, 10, 1, 10)
@@ -1003,6 +1373,103 @@ def test_fieldset_defer_loading_function(zdim, scale_fac, tmpdir):
     assert np.allclose(fieldset.U.data, scale_fac * (zdim - 1.0) / zdim)
 
 
+class FakeNodeComm:
+    """Stand-in for the node communicator of MPI rank `rank` of a node of two ranks, sharing the list `node`.
+
+    The ranks are run one after the other in the same process, rank 0 first, so that Barrier need not wait.
+    As in MPI, the collective calls of the ranks are matched in order: the objects broadcast and the buffers
+    allocated by rank 0 are appended to `node`, in which the other rank finds them by its count of calls.
+    """
+
+    def __init__(self, rank, node):
+        self.rank, self.node, self.ncalls = rank, node, 0
+
+    def Get_rank(self):
+        return self.rank
+
+    def Get_size(self):
+        return 2
+
+    def Split_type(self, split_type):
+        return self
+
+    def Barrier(self):
+        pass
+
+    def _collective(self, value):
+        if self.rank == 0:
+            self.node.append(value)
+        self.ncalls += 1
+        return self.node[self.ncalls - 1]
+
+    def bcast(self, obj, root=0):
+        return self._collective(obj)
+
+
+class FakeWin:
+    """Stand-in for an MPI shared memory window, backed by a NumPy buffer allocated by the first rank of the node."""
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+
+    @classmethod
+    def Allocate_shared(cls, nbytes, itemsize, comm=None):
+        return cls(comm._collective(np.zeros(nbytes, dtype=np.uint8) if comm.Get_rank() == 0 else None))
+
+    def Shared_query(self, rank):
+        return self.buffer, 1
+
+    def Free(self):
+        pass
+
+
+def fake_node_mpi(rank, node):
+    return SimpleNamespace(COMM_WORLD=FakeNodeComm(rank, node), COMM_TYPE_SHARED="shared", Win=FakeWin)
+
+
+def test_fieldset_node_shared_memory(tmpdir, monkeypatch):
+    lon, lat = np.arange(6, dtype=np.float32), np.arange(5, dtype=np.float32)
+    for t in range(4):
+        UV = np.full((1, lat.size, lon.size), t, dtype=np.float32)
+        ds = xr.Dataset(
+            {"U": (("t", "y", "x"), UV), "V": (("t", "y", "x"), UV)}, coords={"x": lon, "y": lat, "t": [float(t)]}
+        )
+        ds.to_netcdf(tmpdir.join(f"node_shared_{t}.nc"))
+    filenames = str(tmpdir.join("node_shared_*.nc"))
+    variables = {"U": "U", "V": "V"}
+    dimensions = {"lon": "x", "lat": "y", "time": "t"}
+    node = []
+    fieldsets = []
+    for rank in range(2):
+        fieldset = FieldSet.from_netcdf(filenames, variables, dimensions, deferred_load=True)
+        monkeypatch.setattr("parcels.fieldset.MPI", fake_node_mpi(rank, node))
+        monkeypatch.setattr("parcels.field.MPI", fake_node_mpi(rank, node))
+        fieldset.add_node_shared_memory()
+        assert fieldset.U._node_comm.Get_rank() == rank
+        fieldsets.append(fieldset)
+    fieldset0, fieldset1 = fieldsets
+
+    def read_on_first_rank_only(*args, **kwargs):
+        raise AssertionError("snapshots are only read by the first rank of the node")
+
+    for f in [fieldset1.U, fieldset1.V]:
+        monkeypatch.setattr(f, "computeTimeChunk", read_on_first_rank_only)
+        monkeypatch.setattr(f, "_read_snapshot", read_on_first_rank_only)
+
+    for time, expected in [(0.5, [0, 1]), (1.5, [1, 2]), (2.5, [2, 3])]:
+        for fieldset in fieldsets:  # the first rank of the node writes the snapshots before the other rank reads
+            fieldset.computeTimeChunk(time, 1)
+        for f0, f1 in [(fieldset0.U, fieldset1.U), (fieldset0.V, fieldset1.V)]:
+            assert np.shares_memory(f0.data, f1.data)
+            assert np.allclose(f1.data[:, 0, 0], expected)
+            assert np.array_equal(f0.data, f1.data)
+            assert f0._time_ring.flags.writeable and not f1._time_ring.flags.writeable
+
+    fieldset1.compute_on_defer = lambda fieldset: None
+    with pytest.raises(ValueError, match="compute_on_defer"):
+        fieldset1.computeTimeChunk(3, 1)
+
+
 @pytest.mark.parametrize("time2", [1, 7])
 def test_fieldset_initialisation_kernel_dask(time2, tmpdir):
     filepath = tmpdir.join("test_parcels_defer_loading")
@@ -1195,3 +1662,162 @@ def test_daskfieldfilebuffer_dimnames():
     assert fb._get_available_dims_indices_by_namemap() == {"time": 0, "depth": 1, "lat": 2, "lon": 3}
     assert fb._is_dimension_chunked("lon") is False
     assert fb._is_dimension_in_chunksize_request("lon") == (-1, "", 0)
+
+
+@pytest.mark.parametrize("chunksize", [False, "auto"])
+def test_filebuffer_dataset_pool(chunksize, tmpdir):
+    filename = tmpdir.join("pooled_dataset.nc")
+    dims = {"lon": "x", "lat": "y", "time": "t"}
+    fb_class = NetcdfFileBuffer if chunksize is False else DaskFileBuffer
+
+    def write(value):
+        ds = xr.Dataset(
+            {"U": (("t", "y", "x"), np.full((3, 2, 2), value)), "V": (("t", "y", "x"), np.zeros((3, 2, 2)))},
+            coords={"x": [0, 1], "y": [0, 1], "t": np.arange(3)},
+        )
+        ds.to_netcdf(filename)
+
+    write(1.0)
+    lease = _DatasetLease()
+    with fb_class(filename, dims, {}, chunksize=chunksize, lease=lease) as fb1:
+        dataset = fb1.dataset
+        with fb_class(filename, dims, {}, chunksize=chunksize) as fb2:
+            assert fb2.dataset is dataset
+    with fb_class(filename, dims, {}, chunksize=chunksize, lease=lease) as fb3:
+        assert fb3.dataset is dataset  # still in the pool while the lease holds it
+    lease.release()
+    with fb_class(filename, dims, {}, chunksize=chunksize) as fb4:
+        assert fb4.dataset is not dataset  # closed once no lease holds it
+
+    fieldset = FieldSet.from_netcdf(filename, {"U": "U", "V": "V"}, dims, mesh="flat", chunksize=chunksize)
+    fieldset.computeTimeChunk(0, 1)
+    assert np.allclose(fieldset.U.data, 1.0)
+
+    del fieldset
+    gc.collect()
+    write(2.0)  # file can only be overwritten once it is closed, i.e. once its Fields are garbage collected
+    fieldset = FieldSet.from_netcdf(filename, {"U": "U", "V": "V"}, dims, mesh="flat", chunksize=chunksize)
+    fieldset.computeTimeChunk(0, 1)
+    assert np.allclose(fieldset.U.data, 2.0)
+
+    fieldset.close()
+    write(3.0)
+    fieldset.computeTimeChunk(1, 1)  # the closed file is opened again for the next snapshot
+    assert np.isclose(np.max(fieldset.U.data), 3.0)
+    fieldset.close()
+
+
+def create_time_index_files(tmpdir, ndays):
+    filenames = []
+    for day in range(ndays):
+        filenames.append(str(tmpdir.join(f"time_index_{day}.nc")))
+        time = np.datetime64("2000-01-01", "ns") + np.arange(2 * day, 2 * day + 2) * np.timedelta64(12, "h")
+        ds = xr.Dataset(
+            {"U": (("t", "y", "x"), np.zeros((2, 2, 2))), "V": (("t", "y", "x"), np.zeros((2, 2, 2)))},
+            coords={"x": [0, 1], "y": [0, 1], "t": time},
+        )
+        ds.to_netcdf(filenames[-1])
+    return filenames
+
+
+def test_time_index_cache(tmpdir, monkeypatch):
+    monkeypatch.setattr(fieldfilebuffer, "get_cache_dir", lambda: str(tmpdir))
+    dims = {"lon": "x", "lat": "y", "time": "t"}
+    filenames = create_time_index_files(tmpdir, 4)
+
+    fieldset = FieldSet.from_netcdf(filenames, {"U": "U", "V": "V"}, dims, mesh="flat")
+    assert np.allclose(fieldset.U.grid.time_full, np.arange(8) * 43200.0)
+
+    # one index file per file, with the modification time and size of the file
+    index_path = _time_index_path(filenames[-1], "t", "netcdf4")
+    with open(index_path) as f:
+        entry = json.load(f)
+    assert entry["mtime_ns"] == os.stat(filenames[-1]).st_mtime_ns
+    assert entry["size"] == os.stat(filenames[-1]).st_size
+
+    # the time values of unchanged files are read from the index instead of the file
+    entry["values"] = [v + 3600 * 10**9 for v in entry["values"]]
+    with open(index_path, "w") as f:
+        json.dump(entry, f)
+    fieldset = FieldSet.from_netcdf(filenames, {"U": "U", "V": "V"}, dims, mesh="flat")
+    assert np.allclose(fieldset.U.grid.time_full[-2:], np.arange(6, 8) * 43200.0 + 3600)
+
+    # and modified files are scanned again
+    os.utime(filenames[-1], ns=(entry["mtime_ns"], entry["mtime_ns"] + 10**9))
+    fieldset = FieldSet.from_netcdf(filenames, {"U": "U", "V": "V"}, dims, mesh="flat")
+    assert np.allclose(fieldset.U.grid.time_full[-2:], np.arange(6, 8) * 43200.0)
+
+
+def test_time_index_disabled_and_pruned(tmpdir, monkeypatch):
+    monkeypatch.setattr(fieldfilebuffer, "get_cache_dir", lambda: str(tmpdir))
+    monkeypatch.setattr(fieldfilebuffer, "_TIME_INDEX_MAX_FILES", 5)
+    dims = {"lon": "x", "lat": "y", "time": "t"}
+    filenames = create_time_index_files(tmpdir, 6)
+    index_dir = tmpdir.join("time_index")
+
+    FieldSet.from_netcdf(filenames, {"U": "U", "V": "V"}, dims, mesh="flat", time_index=False)
+    assert not index_dir.exists()
+
+    index_paths = [_time_index_path(f, "t", "netcdf4") for f in filenames]
+    FieldSet.from_netcdf(filenames[:5], {"U": "U", "V": "V"}, dims, mesh="flat")
+    assert len(index_dir.listdir()) == 5
+    for i, path in enumerate(index_paths[:5]):  # used in the order of the files
+        os.utime(path, ns=(10**18 + i * 10**9, 10**18 + i * 10**9))
+    os.remove(filenames[4])  # e.g. a file in a temporary directory that was removed
+    FieldSet.from_netcdf(filenames[5], {"U": "U", "V": "V"}, dims, mesh="flat")
+    # the least recently used index files are removed (down to half the maximum), as well as those of removed files
+    assert [os.path.isfile(p) for p in index_paths] == [False, False, False, False, False, True]
+
+
+def test_time_axes_scan_in_processes(tmpdir, monkeypatch):
+    executors = []
+
+    class RecordingProcessPoolExecutor(fieldfilebuffer.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            executors.append(self)
+
+    monkeypatch.setattr(fieldfilebuffer, "get_cache_dir", lambda: str(tmpdir))
+    monkeypatch.setattr(fieldfilebuffer, "ProcessPoolExecutor", RecordingProcessPoolExecutor)
+    monkeypatch.setattr(fieldfilebuffer, "_PROCESS_SCAN_MIN_FILES", 2)
+    filenames = create_time_index_files(tmpdir, 4)
+    # the default netcdf4 engine, with which the files can not be scanned in threads
+    fieldset = FieldSet.from_netcdf(filenames, {"U": "U", "V": "V"}, {"lon": "x", "lat": "y", "time": "t"})
+    assert len(executors) == 1
+    assert np.allclose(fieldset.U.grid.time_full, np.arange(8) * 43200.0)
+
+
+@pytest.mark.parametrize("mode", ["scipy", "jit"])
+def test_fieldset_from_zarr(mode, tmpdir):
+    x = np.linspace(0, 1e5, 60)
+    y = np.linspace(0, 5e4, 40)
+    U = 0.5 * np.ones((6, y.size, x.size), dtype=np.float32)
+    V = 0.2 * np.sin(x / 2e4)[None, None, :] * np.ones((6, y.size, 1), dtype=np.float32)
+    ds = xr.Dataset(
+        {"U": (("time", "y", "x"), U), "V": (("time", "y", "x"), V)},
+        coords={"time": np.arange(6) * 3600.0, "y": y, "x": x},
+    )
+    store = str(tmpdir.join("fieldset.zarr"))
+    ds.to_zarr(store, encoding={"U": {"chunks": (1, 16, 32)}, "V": {"chunks": (2, 16, 32)}})
+    ds.to_netcdf(str(tmpdir.join("fieldset.nc")))
+    dims = {"lon": "x", "lat": "y", "time": "time"}
+
+    fieldset = FieldSet.from_zarr(store, {"U": "U", "V": "V"}, dims, mesh="flat")
+    fieldset_nc = FieldSet.from_netcdf(str(tmpdir.join("fieldset.nc")), {"U": "U", "V": "V"}, dims, mesh="flat")
+    lons = []
+    for fset in [fieldset, fieldset_nc]:
+        pset = ParticleSet(fset, ptype[mode], lon=[1e3, 2e3], lat=[1e3, 1e4])
+        pset.execute(AdvectionRK4, runtime=4 * 3600, dt=300)
+        lons.append(pset.lon)
+    assert np.allclose(lons[0], lons[1])
+    if mode == "jit":
+        # one Parcels chunk per chunk of the store, of which only the one with the particles is read
+        assert fieldset.U.data.chunks[1:] == ((16, 16, 8), (32, 28))
+        assert np.count_nonzero(fieldset.U.grid._load_chunk) == 1
+
+    # requested chunk sizes are rounded up to whole chunks of the store
+    fieldset = FieldSet.from_zarr(
+        store, {"U": "U", "V": "V"}, dims, mesh="flat", chunksize={"lat": ("y", 20), "lon": ("x", 40)}
+    )
+    fieldset.computeTimeChunk(0, 1)
+    assert fieldset.U.data.chunks[1:] == ((32, 8), (60,))
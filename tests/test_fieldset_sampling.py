@@ -122,6 +122,61 @@ def test_fieldset_polar_with_halo(fieldset_geometric_polar, mode):
     assert pset.lon[0] == 0.0
 
 
+@pytest.mark.parametrize("mode", ["scipy", "jit"])
+@pytest.mark.parametrize("chunksize", [False, {"lat": ("y", 4), "lon": ("x", 4)}])
+def test_sampling_virtual_zonal_halo(mode, chunksize, tmpdir):
+    xdim, ydim = 20, 10
+    lon = np.linspace(0, 360, xdim, endpoint=False, dtype=np.float32)
+    lat = np.linspace(-45, 45, ydim, dtype=np.float32)
+    p_lon = np.cos(np.deg2rad(lon)).astype(np.float32)
+    data = {
+        "U": np.zeros((ydim, xdim), dtype=np.float32),
+        "V": np.zeros((ydim, xdim), dtype=np.float32),
+        "P": np.tile(p_lon, (ydim, 1)),
+    }
+    fieldset = FieldSet.from_data(data, {"lon": lon, "lat": lat}, mesh="spherical")
+    if chunksize:
+        filepath = tmpdir.join("virtual_halo")
+        fieldset.write(filepath)
+        files = {v: f"{filepath}{v}.nc" for v in ["U", "V", "P"]}
+        variables = {"U": "vozocrtx", "V": "vomecrty", "P": "P"}
+        dimensions = {"lon": "nav_lon", "lat": "nav_lat"}
+        fieldset = FieldSet.from_netcdf(files, variables, dimensions, mesh="spherical", chunksize=chunksize)
+    fieldset.add_periodic_halo(zonal=True, virtual=True)
+    assert fieldset.U.grid.xdim == xdim
+
+    # Particles across the seam between the last and first longitude, also outside [0, 360)
+    plon = np.array([350, 355, 359.9, 5, 170, -5, 365], dtype=np.float32)
+    pset = ParticleSet(fieldset, pclass=pclass(mode), lon=plon, lat=np.zeros(plon.size))
+    pset.execute(SampleP, runtime=1)
+    expected = np.interp(plon % 360, np.append(lon, 360), np.append(p_lon, p_lon[0]))
+    assert np.allclose(pset.p, expected, atol=1e-5)
+
+
+@pytest.mark.parametrize("mode", ["scipy", "jit"])
+@pytest.mark.parametrize("with_depth", [False, True])
+def test_sampling_virtual_zonal_halo_land(mode, with_depth):
+    xdim, ydim = 20, 10
+    lon = np.linspace(0, 360, xdim, endpoint=False, dtype=np.float32)
+    lat = np.linspace(-45, 45, ydim, dtype=np.float32)
+    shape = (2, ydim, xdim) if with_depth else (ydim, xdim)
+    P = np.ones(shape, dtype=np.float32)
+    P[..., 0] = 0  # land in the first column, next to the seam with the last column
+    data = {"U": np.zeros(shape, dtype=np.float32), "V": np.zeros(shape, dtype=np.float32), "P": P}
+    dimensions = {"lon": lon, "lat": lat}
+    if with_depth:
+        dimensions["depth"] = np.array([0, 10], dtype=np.float32)
+    fieldset = FieldSet.from_data(data, dimensions, mesh="spherical")
+    fieldset.P.interp_method = "linear_invdist_land_tracer"
+    fieldset.add_periodic_halo(zonal=True, virtual=True)
+
+    # Particles in the cell across the seam, and in a cell next to it with the land on its other side
+    plon = np.array([351, 359, 9], dtype=np.float32)
+    pset = ParticleSet(fieldset, pclass=pclass(mode), lon=plon, lat=np.full(plon.size, 2.5), depth=np.full(3, 5))
+    pset.execute(SampleP, runtime=1)
+    assert np.allclose(pset.p, 1)  # only the ocean points are interpolated
+
+
 @pytest.mark.parametrize("mode", ["scipy", "jit"])
 @pytest.mark.parametrize("zdir", [-1, 1])
 def test_verticalsampling(mode, zdir):
@@ -8,6 +8,7 @@ import xarray as xr
 from parcels import (
     AdvectionRK4,
     AdvectionRK4_3D,
+    CurvilinearSGrid,
     CurvilinearZGrid,
     Field,
     FieldSet,
@@ -324,6 +325,53 @@ def test_rectilinear_s_grids_advect2(mode):
         assert np.allclose(pset.relDepth[0], depth / bath_func(pset.lon[0]))
 
 
+@pytest.mark.parametrize("mode", ["scipy", "jit"])
+@pytest.mark.parametrize("gridtype", ["rectilinear", "curvilinear"])
+@pytest.mark.parametrize("positive", ["down", "up"])
+def test_s_grid_vertical_search_many_levels(mode, gridtype, positive):
+    # Sample a field holding the level index on a stretched 75-level s-grid; the sampled value is the fractional level
+    lon_g0 = np.linspace(0, 1e4, 11, dtype=np.float32)
+    lat_g0 = np.linspace(0, 1000, 2, dtype=np.float32)
+    sign = 1 if positive == "down" else -1
+    s_levels = np.linspace(0, 1, 75) ** 2
+
+    def bath_func(lon):
+        return lon / 100.0 + 100
+
+    depth_g0 = np.zeros((s_levels.size, lat_g0.size, lon_g0.size), dtype=np.float32)
+    for k in range(s_levels.size):
+        depth_g0[k, :, :] = sign * bath_func(lon_g0) * s_levels[k]
+
+    if gridtype == "rectilinear":
+        grid = RectilinearSGrid(lon_g0, lat_g0, depth=depth_g0)
+    else:
+        lon2d, lat2d = np.meshgrid(lon_g0, lat_g0)
+        grid = CurvilinearSGrid(lon2d, lat2d, depth=depth_g0)
+
+    level_data = np.zeros(depth_g0.shape, dtype=np.float32)
+    for k in range(s_levels.size):
+        level_data[k, :, :] = k
+    u_field = Field("U", np.zeros(depth_g0.shape, dtype=np.float32), grid=grid)
+    v_field = Field("V", np.zeros(depth_g0.shape, dtype=np.float32), grid=grid)
+    level_field = Field("level", level_data, grid=grid)
+    fieldset = FieldSet(u_field, v_field, fields={"level": level_field})
+
+    def sampleLevel(particle, fieldset, time):
+        particle.level = fieldset.level[time, particle.depth, particle.lat, particle.lon]
+
+    MyParticle = ptype[mode].add_variable("level", dtype=np.float32, initial=-1)
+
+    npart = 40
+    lon = np.linspace(100, 9900, npart)
+    ratio = np.linspace(0, 1, npart) ** 1.5
+    depth = sign * bath_func(lon) * ratio
+    pset = ParticleSet.from_list(fieldset, MyParticle, lon=lon, lat=np.full(npart, 500), depth=depth)
+    pset.execute(pset.Kernel(sampleLevel), runtime=1)
+
+    expected = np.interp(ratio, s_levels, np.arange(s_levels.size))
+    assert np.allclose(pset.level, expected, atol=1e-2)
+
+
 @pytest.mark.parametrize("mode", ["scipy", "jit"])
 def test_curvilinear_grids(mode):
     x = np.linspace(0, 1e3, 7, dtype=np.float32)
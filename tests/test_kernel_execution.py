@@ -1,21 +1,25 @@
+import multiprocessing.pool
 import os
 import sys
 
 import numpy as np
 import pytest
+import xarray as xr
 
 import parcels
 from parcels import (
     AdvectionRK4,
+    Field,
     FieldOutOfBoundError,
     FieldSet,
     JITParticle,
+    ParcelsRandom,
     ParticleSet,
     ScipyParticle,
     StatusCode,
 )
 from tests.common_kernels import DeleteParticle, DoNothing, MoveEast, MoveNorth
-from tests.utils import create_fieldset_unit_mesh
+from tests.utils import TEST_DATA, create_fieldset_unit_mesh
 
 ptype = {"scipy": ScipyParticle, "jit": JITParticle}
 
@@ -211,6 +215,149 @@ def test_execution_delete_out_of_bounds(fieldset_unit_mesh, mode):
     assert len(pset) == 0
 
 
+@pytest.mark.parametrize("mode", ["scipy", "jit"])
+def test_execution_nprocesses(fieldset_unit_mesh, mode, tmpdir):
+    npart = 20
+
+    def MoveRight(particle, fieldset, time):
+        particle_dlon += 0.01 * particle.lat  # noqa
+        if particle.lon > 0.5:
+            particle.delete()
+
+    psets, outputs = [], []
+    for nprocesses in [None, 3]:
+        pset = ParticleSet(
+            fieldset_unit_mesh, pclass=ptype[mode], lon=np.linspace(0, 0.4, npart), lat=np.linspace(0, 1, npart)
+        )
+        pfile = pset.ParticleFile(tmpdir.join(f"nprocesses{nprocesses}.zarr"), outputdt=2.0)
+        pset.execute(MoveRight, endtime=20.0, dt=1.0, output_file=pfile, nprocesses=nprocesses)
+        psets.append(pset)
+        outputs.append(xr.open_zarr(tmpdir.join(f"nprocesses{nprocesses}.zarr")))
+    assert 0 < len(psets[1]) < npart
+    for var in ["lon", "lat", "time"]:
+        assert np.array_equal(getattr(psets[0], var), getattr(psets[1], var))
+    assert np.array_equal(outputs[0].lon.values, outputs[1].lon.values, equal_nan=True)
+
+
+def test_execution_nprocesses_deferred_load(monkeypatch):
+    files = {"U": [str(TEST_DATA / "perlinfieldsU.nc")] * 4, "V": [str(TEST_DATA / "perlinfieldsV.nc")] * 4}
+    variables = {"U": "vozocrtx", "V": "vomecrty"}
+    dimensions = {"lon": "nav_lon", "lat": "nav_lat"}
+    timestamps = np.expand_dims(np.arange(4) * 86400.0, 1)
+
+    npools = 0
+    pool_init = multiprocessing.pool.Pool.__init__
+
+    def counting_pool_init(self, *args, **kwargs):
+        nonlocal npools
+        npools += 1
+        pool_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(multiprocessing.pool.Pool, "__init__", counting_pool_init)
+
+    pid = os.getpid()
+    read_snapshot = Field._read_snapshot
+
+    def read_snapshot_in_parent(self, tindex):
+        if os.getpid() != pid:
+            raise RuntimeError("snapshot read in a worker process")
+        return read_snapshot(self, tindex)
+
+    monkeypatch.setattr(Field, "_read_snapshot", read_snapshot_in_parent)
+
+    psets = []
+    for nprocesses in [None, 3]:
+        fieldset = FieldSet.from_netcdf(files, variables, dimensions, timestamps=timestamps)
+        lon, lat = np.meshgrid(np.linspace(-50, 50, 5), np.linspace(-40, 40, 4))
+        pset = ParticleSet(fieldset, pclass=JITParticle, lon=lon, lat=lat)
+        pset.execute(AdvectionRK4, runtime=3 * 86400, dt=3600, nprocesses=nprocesses)
+        psets.append(pset)
+    assert npools == 1  # a single pool of processes for all snapshots of the execution
+    assert np.array_equal(psets[0].lon, psets[1].lon)
+    assert np.array_equal(psets[0].lat, psets[1].lat)
+
+    fieldset = FieldSet.from_netcdf(files, variables, dimensions, timestamps=timestamps, chunksize="auto")
+    pset = ParticleSet(fieldset, pclass=JITParticle, lon=lon, lat=lat)
+    with pytest.raises(ValueError, match="chunksize"):
+        pset.execute(AdvectionRK4, runtime=3 * 86400, dt=3600, nprocesses=3)
+
+
+def test_execution_nprocesses_error(fieldset_unit_mesh):
+    def MoveRight(particle, fieldset, time):
+        tmp1, tmp2 = fieldset.UV[time, particle.depth, particle.lat, particle.lon + 0.1, particle]  # noqa
+        particle_dlon += 0.1  # noqa
+
+    pset = ParticleSet(fieldset_unit_mesh, pclass=JITParticle, lon=[0.1, 0.5, 0.9], lat=[0.5, 0.5, 0.5])
+    with pytest.raises(FieldOutOfBoundError) as error:
+        pset.execute(MoveRight, endtime=20.0, dt=1.0, nprocesses=3)
+    assert error.value.x > 0.85  # the attributes of the error are kept when it is passed from the worker process
+    assert error.value.y == 0.5
+
+
+@pytest.mark.parametrize("random", [False, True])
+def test_execution_nthreads(random):
+    npart = 100
+    lon, lat = np.meshgrid(np.linspace(-50, 50, 10), np.linspace(-40, 40, 10))
+    files = {"U": str(TEST_DATA / "perlinfieldsU.nc"), "V": str(TEST_DATA / "perlinfieldsV.nc")}
+    variables = {"U": "vozocrtx", "V": "vomecrty"}
+    dimensions = {"lon": "nav_lon", "lat": "nav_lat"}
+
+    def Nudge(particle, fieldset, time):
+        particle_dlat += ParcelsRandom.uniform(0, 1)  # noqa
+
+    kernels = [AdvectionRK4, Nudge] if random else [AdvectionRK4]
+    psets = []
+    for nthreads in [None, 4]:
+        fieldset = FieldSet.from_netcdf(
+            files, variables, dimensions, allow_time_extrapolation=True, chunksize={"lat": ("y", 32), "lon": ("x", 64)}
+        )
+        ParcelsRandom.seed(1234)
+        pset = ParticleSet(fieldset, pclass=JITParticle, lon=lon, lat=lat)
+        pset.execute(kernels, runtime=86400, dt=3600, nthreads=nthreads)
+        assert pset._kernel._draws_random == random  # kernels that draw random numbers are executed in one thread
+        psets.append(pset)
+    assert len(psets[1]) == npart
+    assert np.array_equal(psets[0].lon, psets[1].lon)
+    assert np.array_equal(psets[0].lat, psets[1].lat)
+
+
+def test_execution_nthreads_stopallexecution(fieldset_unit_mesh):
+    def addoneLon(particle, fieldset, time):
+        particle_dlon += 1  # noqa
+
+        if particle.lon + particle_dlon >= 10:
+            particle.state = StatusCode.StopAllExecution
+
+    pset = ParticleSet(fieldset_unit_mesh, pclass=JITParticle, lon=np.arange(8), lat=np.zeros(8))
+    pset.execute(addoneLon, endtime=20.0, dt=1.0, nthreads=2)
+    assert np.max(pset.time) < 20
+
+    pset.particledata.state[:] = StatusCode.Evaluate
+    assert pset._kernel.execute_jit(pset, 20.0, 1.0, nthreads=2) == StatusCode.StopAllExecution
+
+
+@pytest.mark.parametrize("mode", ["scipy", "jit"])
+def test_execution_repeat_and_delete(fieldset_unit_mesh, mode):
+    npart = 10
+    MyParticle = ptype[mode].add_variable("nrepeat", dtype=np.int32, initial=0)
+    pset = ParticleSet(fieldset_unit_mesh, pclass=MyParticle, lon=np.linspace(0, 0.9, npart), lat=np.zeros(npart))
+
+    def RepeatOrDelete(particle, fieldset, time):
+        if particle.lon < 0.25:
+            particle.delete()
+        elif particle.lon > 0.5 and particle.nrepeat < 3:
+            particle.nrepeat += 1
+            particle.state = StatusCode.Repeat
+        else:
+            particle_dlat += 0.1  # noqa
+
+    pset.execute(RepeatOrDelete, endtime=2, dt=1)
+    assert len(pset) == npart - 3
+    assert np.allclose(pset.lat, np.where(pset.lon > 0.5, 0, 0.1), rtol=1e-5)
+    assert np.array_equal(pset.nrepeat, np.where(pset.lon > 0.5, 2, 0))
+    assert np.allclose(pset.time_nextloop, 2)
+
+
 @pytest.mark.parametrize("mode", ["scipy", "jit"])
 def test_kernel_add_no_new_variables(fieldset_unit_mesh, mode):
     pset = ParticleSet(fieldset_unit_mesh, pclass=ptype[mode], lon=[0.5], lat=[0.5])
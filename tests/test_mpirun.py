@@ -1,12 +1,24 @@
 import os
+from datetime import timedelta
 from glob import glob
+from types import SimpleNamespace
 
 import numpy as np
 import pytest
 import xarray as xr
 
+from parcels import AdvectionRK4, FieldSet, JITParticle, ParticleFile, ParticleSet, Variable
 from parcels._compat import MPI
-from tests.utils import PROJECT_ROOT
+from parcels.particledata import partitionParticlesMPI_hilbert
+from parcels.tools._domain_decomposition import (
+    DomainDecomposition,
+    balanced_split,
+    exchange_arrays,
+    hilbert_keys,
+    hilbert_partition,
+    time_range,
+)
+from tests.utils import PROJECT_ROOT, TEST_DATA
 
 
 @pytest.mark.skipif(MPI is None, reason="MPI not installed")
@@ -46,3 +58,301 @@ def test_mpi_run(tmpdir, repeatdt, maxage, nump):
 
         ds1.close()
     ds2.close()
+
+
+def node_shared_run(shared):
+    files = {"U": [str(TEST_DATA / "perlinfieldsU.nc")] * 4, "V": [str(TEST_DATA / "perlinfieldsV.nc")] * 4}
+    timestamps = np.expand_dims(np.arange(0, 4, 1) * 86400.0, 1)
+    fieldset = FieldSet.from_netcdf(
+        files, {"U": "vozocrtx", "V": "vomecrty"}, {"lon": "nav_lon", "lat": "nav_lat"}, timestamps=timestamps
+    )
+    if shared:
+        fieldset.add_node_shared_memory()
+    pset = ParticleSet(fieldset, pclass=JITParticle, lon=np.linspace(0.1, 0.9, 8), lat=np.linspace(0.2, 0.8, 8))
+    pset.execute(AdvectionRK4, dt=timedelta(hours=1), runtime=timedelta(days=2))
+    return fieldset, pset
+
+
+@pytest.mark.skipif(MPI is None, reason="MPI not installed")
+def test_mpi_node_shared_memory(tmpdir):
+    script = tmpdir.join("node_shared.py")
+    script.write(
+        "import sys\n"
+        "import numpy as np\n"
+        "from parcels._compat import MPI\n"
+        "from tests.test_mpirun import node_shared_run\n"
+        "fieldset, pset = node_shared_run(shared=True)\n"
+        "assert fieldset.U._time_ring.flags.writeable == (fieldset.U._node_comm.Get_rank() == 0)\n"
+        "np.save(f'{sys.argv[1]}/proc{MPI.COMM_WORLD.Get_rank()}.npy', np.stack([pset.id, pset.lon, pset.lat]))\n"
+    )
+    os.system(f"cd {PROJECT_ROOT} && PYTHONPATH={PROJECT_ROOT} mpirun -np 2 python {script} {tmpdir}")
+    mpi = np.concatenate([np.load(f) for f in sorted(glob(str(tmpdir.join("proc*.npy"))))], axis=1)
+    mpi = mpi[:, np.argsort(mpi[0])]
+
+    _, pset = node_shared_run(shared=False)
+    assert np.allclose(mpi[1], pset.lon) and np.allclose(mpi[2], pset.lat)
+
+
+def domain_decomposition_run(tmpdir, decompose):
+    filenames = os.path.join(tmpdir, "eastward_*.nc")
+    fieldset = FieldSet.from_netcdf(filenames, {"U": "U", "V": "V"}, {"lon": "x", "lat": "y", "time": "t"}, mesh="flat")
+    if decompose:
+        fieldset.add_domain_decomposition(max_velocity=1.0)
+    lon, lat = np.meshgrid(np.linspace(2, 30, 4), np.linspace(2, 26, 4))
+    pset = ParticleSet(fieldset, pclass=JITParticle, lon=lon.ravel(), lat=lat.ravel())
+    output = ParticleFile(os.path.join(tmpdir, "decomposed" if decompose else "serial.zarr"), pset, outputdt=10)
+    pset.execute(AdvectionRK4, runtime=30, dt=1, output_file=output)
+    return fieldset, pset
+
+
+@pytest.mark.skipif(MPI is None, reason="MPI not installed")
+def test_mpi_domain_decomposition(tmpdir):
+    lon, lat = np.arange(40, dtype=np.float32), np.arange(30, dtype=np.float32)
+    for t in range(4):
+        U = np.full((1, lat.size, lon.size), 0.5, dtype=np.float32)  # particles cross the tiles eastward
+        V = np.full((1, lat.size, lon.size), 0.1 * np.sin(t), dtype=np.float32)
+        ds = xr.Dataset(
+            {"U": (("t", "y", "x"), U), "V": (("t", "y", "x"), V)}, coords={"x": lon, "y": lat, "t": [t * 10.0]}
+        )
+        ds.to_netcdf(tmpdir.join(f"eastward_{t}.nc"))
+
+    script = tmpdir.join("decomposed.py")
+    script.write(
+        "import sys\n"
+        "import numpy as np\n"
+        "from parcels._compat import MPI\n"
+        "from tests.test_mpirun import domain_decomposition_run\n"
+        "fieldset, pset = domain_decomposition_run(sys.argv[1], decompose=True)\n"
+        "assert fieldset.U.data[0].size < 30 * 40  # only the tile (and halo) is read\n"
+        "np.save(f'{sys.argv[1]}/proc{MPI.COMM_WORLD.Get_rank()}.npy', np.stack([pset.id, pset.lon, pset.lat]))\n"
+    )
+    os.system(f"cd {PROJECT_ROOT} && PYTHONPATH={PROJECT_ROOT} mpirun -np 4 python {script} {tmpdir}")
+    mpi = np.concatenate([np.load(f) for f in sorted(glob(str(tmpdir.join("proc*.npy"))))], axis=1)
+    mpi = mpi[:, np.argsort(mpi[0])]
+
+    _, pset = domain_decomposition_run(tmpdir, decompose=False)
+    assert np.allclose(mpi[1], pset.lon) and np.allclose(mpi[2], pset.lat)
+
+    # the observations of the particles, split over the stores of the ranks they were on, add up to the serial output
+    ds_serial = xr.open_zarr(tmpdir.join("serial.zarr"))
+    ds_mpi = [xr.open_zarr(f) for f in glob(str(tmpdir.join("decomposed", "proc*.zarr")))]
+    for i, traj in enumerate(ds_serial.trajectory.values - ds_serial.trajectory.values.min()):
+        lons = np.full(ds_serial.sizes["obs"], np.nan)
+        for ds in ds_mpi:
+            rows = np.where(ds.trajectory.values == traj)[0]
+            for row in rows:
+                written = np.isfinite(ds.lon.values[row])
+                lons[: written.size][written] = ds.lon.values[row][written]
+        assert np.allclose(lons, ds_serial.lon.values[i], equal_nan=True)
+
+
+@pytest.mark.parametrize("nranks, ntiles", [(1, (1, 1)), (4, (2, 2)), (6, (3, 2)), (7, (7, 1))])
+def test_domain_decomposition_tiles(nranks, ntiles):
+    decomposition = DomainDecomposition((0, 40), (0, 30), nranks)
+    assert (len(decomposition.lon_edges) - 1, len(decomposition.lat_edges) - 1) == ntiles
+    lon, lat = np.meshgrid(np.linspace(-5, 45, 51), np.linspace(-5, 35, 41))
+    owner = decomposition.owner(lon.ravel(), lat.ravel())
+    assert set(owner) == set(range(nranks))  # positions outside of the extent belong to the nearest tile
+    for rank in range(nranks):
+        (lon0, lon1), (lat0, lat1) = decomposition.tile(rank)
+        inside = (lon.ravel() > lon0) & (lon.ravel() < lon1) & (lat.ravel() > lat0) & (lat.ravel() < lat1)
+        assert np.all(owner[inside] == rank)
+
+
+class FakeComm:
+    """Stand-in for MPI.COMM_WORLD as rank `rank` of `size` ranks, on which the other ranks hold no particles."""
+
+    def __init__(self, rank=0, size=1):
+        self.rank, self.size = rank, size
+
+    def Get_rank(self):
+        return self.rank
+
+    def Get_size(self):
+        return self.size
+
+    def allreduce(self, value, op=None):
+        return value
+
+    def Allreduce(self, sendbuf, recvbuf, op=None):
+        pass  # in place, and the other ranks add nothing
+
+    def alltoall(self, sendobj):
+        return [sendobj[i] if i == self.rank else 0 for i in range(self.size)]
+
+    def Alltoallv(self, sendbuf, recvbuf):
+        (send, sendcounts), (recv, _) = sendbuf, recvbuf
+        start = sum(sendcounts[: self.rank])
+        recv.ravel()[:] = send.ravel()[start : start + sendcounts[self.rank]]
+
+
+def fake_mpi(rank=0, size=1):
+    return SimpleNamespace(COMM_WORLD=FakeComm(rank, size), SUM="sum", MIN="min", MAX="max", IN_PLACE="in_place")
+
+
+@pytest.mark.parametrize("rank", range(4))
+def test_domain_decomposition_halo(tmpdir, monkeypatch, rank):
+    lon, lat = np.arange(40, dtype=np.float32), np.arange(30, dtype=np.float32)
+    for t in range(4):
+        UV = np.full((1, lat.size, lon.size), 0.5, dtype=np.float32)
+        ds = xr.Dataset(
+            {"U": (("t", "y", "x"), UV), "V": (("t", "y", "x"), UV)}, coords={"x": lon, "y": lat, "t": [t * 10.0]}
+        )
+        ds.to_netcdf(tmpdir.join(f"eastward_{t}.nc"))
+    monkeypatch.setattr("parcels.fieldset.MPI", fake_mpi(rank, size=4))
+    fieldset = FieldSet.from_netcdf(
+        os.path.join(tmpdir, "eastward_*.nc"), {"U": "U", "V": "V"}, {"lon": "x", "lat": "y", "time": "t"}, mesh="flat"
+    )
+    fieldset.add_domain_decomposition(max_velocity=0.2)  # a halo of 2 m, over input time steps of 10 s
+
+    (lon0, lon1), (lat0, lat1) = fieldset._domain_decomposition.tile(rank)
+    j0, j1, i0, i1 = fieldset.U.grid._subset_window
+    assert lon[i0] <= max(lon0 - 2, lon[0]) and lon[i1 - 1] >= min(lon1 + 2, lon[-1])
+    assert lat[j0] <= max(lat0 - 2, lat[0]) and lat[j1 - 1] >= min(lat1 + 2, lat[-1])
+    assert lon[i1 - 1] - lon[i0] <= lon1 - lon0 + 2 * 2 + 2 and lat[j1 - 1] - lat[j0] <= lat1 - lat0 + 2 * 2 + 2
+    fieldset.computeTimeChunk(0, 1)
+    assert fieldset.U.data.shape[-2:] == (j1 - j0, i1 - i0)
+
+
+def test_exchange_arrays_single_rank(monkeypatch):
+    monkeypatch.setattr("parcels.tools._domain_decomposition.MPI", fake_mpi())
+    arrays = {"id": np.arange(5), "xi": np.arange(10, dtype=np.int32).reshape(5, 2)}
+    received = exchange_arrays(arrays, np.zeros(5, dtype=int))
+    assert np.array_equal(received["id"], arrays["id"]) and np.array_equal(received["xi"], arrays["xi"])
+    assert time_range(np.array([3.0, 1.0, 2.0])) == (1.0, 3.0)
+    assert time_range(np.array([])) == (np.inf, -np.inf)  # a rank without particles does not limit the range
+
+
+def test_hilbert_keys():
+    x, y = np.meshgrid(np.arange(16) + 0.5, np.arange(16) + 0.5)
+    keys = hilbert_keys(x.ravel(), y.ravel(), (0, 16), (0, 16), order=4)
+    assert np.array_equal(np.sort(keys), np.arange(16 * 16))
+    curve = np.stack([x.ravel(), y.ravel()], axis=1)[np.argsort(keys)]
+    assert np.all(np.abs(np.diff(curve, axis=0)).sum(axis=1) == 1)  # consecutive keys are neighbouring cells
+    # positions outside of the extent get the key of the nearest cell
+    outside = hilbert_keys(np.array([-3.0, 20.0]), np.array([0.5, 15.5]), (0, 16), (0, 16), order=4)
+    assert np.array_equal(outside, keys[[0, 16 * 16 - 1]])
+
+
+def test_hilbert_partition(monkeypatch):
+    monkeypatch.setattr("parcels.tools._domain_decomposition.MPI", fake_mpi(rank=0, size=4))
+    lon, lat = np.meshgrid(np.linspace(0, 40, 20), np.linspace(-20, 10, 12))
+    ranks = hilbert_partition(lon.ravel(), lat.ravel())
+    assert np.array_equal(np.bincount(ranks, minlength=4), np.full(4, lon.size // 4))
+    assert np.array_equal(hilbert_partition(np.array([]), np.array([])), np.array([], dtype=int))
+
+
+def test_balanced_split(monkeypatch):
+    monkeypatch.setattr("parcels.tools._domain_decomposition.MPI", fake_mpi())
+    x, y = np.meshgrid(np.arange(16) + 0.5, np.arange(16) + 0.5)
+    keys = hilbert_keys(x.ravel(), y.ravel(), (0, 16), (0, 16), order=4)
+    weights = np.where(x.ravel() < 4, 3.0, 1.0)  # e.g. more particles in the west
+    ranks = balanced_split(keys, weights, 5, order=4, nbins=256)
+    assert np.all(np.diff(ranks[np.argsort(keys)]) >= 0)  # contiguous ranges of the curve
+    assert set(ranks) == set(range(5))
+    totals = np.bincount(ranks, weights=weights)
+    assert np.all(np.abs(totals - weights.sum() / 5) <= weights.max())
+    assert np.array_equal(balanced_split(keys, np.zeros(len(keys)), 5, order=4, nbins=256), np.zeros(len(keys)))
+
+
+def rebalance_run(tmpdir, rebalance_every):
+    fieldset = FieldSet.from_netcdf(
+        os.path.join(tmpdir, "eastward_*.nc"), {"U": "U", "V": "V"}, {"lon": "x", "lat": "y", "time": "t"}, mesh="flat"
+    )
+    lon, lat = np.meshgrid(np.linspace(2, 30, 4), np.linspace(2, 26, 4))
+    pset = ParticleSet(
+        fieldset,
+        pclass=JITParticle,
+        lon=lon.ravel(),
+        lat=lat.ravel(),
+        partition_function=lambda coords, mpi_size: np.zeros(len(coords), dtype=int),  # all particles on rank 0
+    )
+    output = ParticleFile(os.path.join(tmpdir, "rebalanced" if rebalance_every else "serial.zarr"), pset, outputdt=10)
+    pset.execute(AdvectionRK4, runtime=30, dt=1, output_file=output, rebalance_every=rebalance_every)
+    return pset
+
+
+@pytest.mark.skipif(MPI is None, reason="MPI not installed")
+def test_mpi_rebalance(tmpdir):
+    lon, lat = np.arange(40, dtype=np.float32), np.arange(30, dtype=np.float32)
+    for t in range(4):
+        UV = np.full((1, lat.size, lon.size), 0.5, dtype=np.float32)
+        ds = xr.Dataset(
+            {"U": (("t", "y", "x"), UV), "V": (("t", "y", "x"), UV)}, coords={"x": lon, "y": lat, "t": [t * 10.0]}
+        )
+        ds.to_netcdf(tmpdir.join(f"eastward_{t}.nc"))
+
+    script = tmpdir.join("rebalanced.py")
+    script.write(
+        "import sys\n"
+        "import numpy as np\n"
+        "from parcels._compat import MPI\n"
+        "from tests.test_mpirun import rebalance_run\n"
+        "pset = rebalance_run(sys.argv[1], rebalance_every=1)\n"
+        "assert len(pset) == 8  # the 16 particles, initially all on rank 0, are split evenly\n"
+        "np.save(f'{sys.argv[1]}/proc{MPI.COMM_WORLD.Get_rank()}.npy', np.stack([pset.id, pset.lon, pset.lat]))\n"
+    )
+    os.system(f"cd {PROJECT_ROOT} && PYTHONPATH={PROJECT_ROOT} mpirun -np 2 python {script} {tmpdir}")
+    mpi = np.concatenate([np.load(f) for f in sorted(glob(str(tmpdir.join("proc*.npy"))))], axis=1)
+    assert len(np.unique(mpi[0])) == 16
+    mpi = mpi[:, np.argsort(mpi[0])]
+
+    pset = rebalance_run(tmpdir, rebalance_every=None)
+    assert np.allclose(mpi[1], pset.lon) and np.allclose(mpi[2], pset.lat)
+
+    trajectories = [xr.open_zarr(f).trajectory.values for f in glob(str(tmpdir.join("rebalanced", "proc*.zarr")))]
+    assert set(np.concatenate(trajectories)) == set(mpi[0])
+
+
+def test_partition_hilbert():
+    lon, lat = np.meshgrid(np.linspace(0, 40, 64), np.linspace(-20, 10, 48))
+    coords = np.stack([lon.ravel(), lat.ravel()], axis=1)
+    procs = partitionParticlesMPI_hilbert(coords, mpi_size=6)
+    assert np.array_equal(np.bincount(procs), np.full(6, coords.shape[0] // 6))
+    for proc in range(6):  # the partitions are compact, i.e. have about the extent of a sixth of the domain
+        extent = np.ptp(coords[procs == proc], axis=0)
+        assert extent[0] * extent[1] < 0.5 * 40 * 30
+
+
+def hilbert_partitioned_pset(tmpdir):
+    fieldset = FieldSet.from_netcdf(
+        os.path.join(tmpdir, "eastward_*.nc"), {"U": "U", "V": "V"}, {"lon": "x", "lat": "y", "time": "t"}, mesh="flat"
+    )
+    lon, lat = np.meshgrid(np.linspace(2, 30, 10), np.linspace(2, 26, 10))
+    return ParticleSet(
+        fieldset,
+        pclass=JITParticle.add_variable(Variable("tag", dtype=np.float32)),
+        lon=lon.ravel(),
+        lat=lat.ravel(),
+        tag=np.arange(lon.size, dtype=np.float32),
+        partition_function=partitionParticlesMPI_hilbert,
+    )
+
+
+@pytest.mark.skipif(MPI is None, reason="MPI not installed")
+def test_mpi_partition_hilbert(tmpdir):
+    lon, lat = np.arange(40, dtype=np.float32), np.arange(30, dtype=np.float32)
+    for t in range(2):
+        UV = np.zeros((1, lat.size, lon.size), dtype=np.float32)
+        ds = xr.Dataset(
+            {"U": (("t", "y", "x"), UV), "V": (("t", "y", "x"), UV)}, coords={"x": lon, "y": lat, "t": [t * 10.0]}
+        )
+        ds.to_netcdf(tmpdir.join(f"eastward_{t}.nc"))
+
+    script = tmpdir.join("hilbert.py")
+    script.write(
+        "import sys\n"
+        "import numpy as np\n"
+        "from parcels._compat import MPI\n"
+        "from tests.test_mpirun import hilbert_partitioned_pset\n"
+        "pset = hilbert_partitioned_pset(sys.argv[1])\n"
+        "np.save(f'{sys.argv[1]}/proc{MPI.COMM_WORLD.Get_rank()}.npy', np.stack([pset.id, pset.lon, pset.lat, pset.tag]))\n"
+    )
+    os.system(f"cd {PROJECT_ROOT} && PYTHONPATH={PROJECT_ROOT} mpirun -np 4 python {script} {tmpdir}")
+    procs = [np.load(f) for f in sorted(glob(str(tmpdir.join("proc*.npy"))))]
+    assert [p.shape[1] for p in procs] == [25] * 4
+    mpi = np.concatenate(procs, axis=1)
+    mpi = mpi[:, np.argsort(mpi[0])]
+    lon, lat = np.meshgrid(np.linspace(2, 30, 10), np.linspace(2, 26, 10))
+    assert np.array_equal(mpi[0], np.arange(100))
+    assert np.allclose(mpi[1], lon.ravel()) and np.allclose(mpi[2], lat.ravel()) and np.array_equal(mpi[3], mpi[0])
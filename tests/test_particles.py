@@ -50,6 +50,23 @@ def test_variable_init(fieldset, mode):
     assert np.allclose([p.p_int for p in pset], 13, rtol=1e-12)
 
 
+def test_variable_cast_in_scipy_kernel(fieldset):
+    """Test that Variables read in a Scipy kernel after they are set have their dtype."""
+    extra_vars = [Variable("p_float", dtype=np.float32, initial=0.0), Variable("p_int", dtype=np.int32, initial=0)]
+    pset = ParticleSet(fieldset, pclass=ScipyParticle.add_variables(extra_vars), lon=[0, 1], lat=[0, 1])
+
+    def setAndMultiply(particle, fieldset, time):
+        particle.p_float = 0.1
+        particle.p_int = 2.7
+        particle.p_float *= 3
+        particle.p_int *= 2
+
+    pset.execute(setAndMultiply, runtime=1.0, dt=1.0)
+    assert np.all(pset.p_float == np.float32(0.1) * 3)
+    assert np.all(pset.p_int == 4)
+    assert "p_float=0.3" in repr(pset.particledata._proxy_class()(0))
+
+
 @pytest.mark.parametrize("mode", ["jit"])
 @pytest.mark.parametrize("type", ["np.int8", "mp.float", "np.int16"])
 def test_variable_unsupported_dtypes(fieldset, mode, type):
@@ -1,12 +1,21 @@
+import math
+import shutil
+from datetime import timedelta
+
 import numpy as np
 import pytest
+import xarray as xr
 
 from parcels import (
+    AdvectionRK4,
     CurvilinearZGrid,
     Field,
     FieldSet,
     JITParticle,
+    ParcelsRandom,
+    ParticleFile,
     ParticleSet,
+    ParticleSetEnsemble,
     ScipyParticle,
     StatusCode,
     Variable,
@@ -112,6 +121,98 @@ def test_pset_create_fromparticlefile(fieldset, mode, restart, tmpdir):
     assert pset[0].p3.dtype == np.float64
 
 
+@pytest.mark.parametrize("mode", ["scipy", "jit"])
+def test_pset_checkpoint(fieldset, mode, tmpdir):
+    TestParticle = ptype[mode].add_variable("p", np.float32, initial=0, to_write=False)
+
+    def Kernel(particle, fieldset, time):
+        particle.p += ParcelsRandom.uniform(0, 1)
+        particle_dlon += particle.p * 0.01  # noqa
+
+    pset = ParticleSet(fieldset, pclass=TestParticle, lon=np.linspace(0, 0.5, 5), lat=np.zeros(5), repeatdt=2)
+    pfile = pset.ParticleFile(tmpdir.join("checkpoint.zarr"), outputdt=1)
+    pset.execute(Kernel, runtime=3, dt=1, output_file=pfile)
+    pset.checkpoint(tmpdir.join("checkpoint"), output_file=pfile, seed=1234)
+    shutil.copytree(tmpdir.join("checkpoint.zarr"), tmpdir.join("restart.zarr"))
+    pset.execute(Kernel, runtime=3, dt=1, output_file=pfile)
+
+    TestParticle.setLastID(0)  # as when restarting in a new process
+    pset_restart = ParticleSet.from_checkpoint(fieldset, TestParticle, tmpdir.join("checkpoint"))
+    pfile_restart = ParticleFile.from_checkpoint(tmpdir.join("checkpoint"), pset_restart)
+    pfile_restart.fname = tmpdir.join("restart.zarr")
+    pset_restart.execute(Kernel, runtime=3, dt=1, output_file=pfile_restart)
+
+    assert len(pset_restart) == len(pset) == 20
+    for var in ["id", "lon", "time", "p"]:
+        assert np.array_equal(getattr(pset, var), getattr(pset_restart, var))
+    output = xr.open_zarr(tmpdir.join("checkpoint.zarr"))
+    output_restart = xr.open_zarr(tmpdir.join("restart.zarr"))
+    assert np.array_equal(output.lon.values, output_restart.lon.values, equal_nan=True)
+    assert np.array_equal(output.trajectory.values, output_restart.trajectory.values)
+
+
+def test_pset_checkpoint_without_seed(fieldset, tmpdir):
+    pset = ParticleSet(fieldset, pclass=ScipyParticle, lon=np.linspace(0, 0.5, 5), lat=np.zeros(5))
+    ParcelsRandom.seed(1234)
+    expected = ParcelsRandom.random()
+    ParcelsRandom.seed(1234)
+    pset.checkpoint(tmpdir.join("checkpoint"))
+    assert ParcelsRandom.random() == expected  # taking a checkpoint does not change the simulation
+
+    ScipyParticle.setLastID(1000)  # as after creating another ParticleSet with more particles
+    pset_restart = ParticleSet.from_checkpoint(fieldset, ScipyParticle, tmpdir.join("checkpoint"))
+    assert np.array_equal(pset_restart.id, pset.id)
+    assert ScipyParticle.lastID == 1000
+    ParcelsRandom.seed(1234)
+    pset_restart = ParticleSet.from_checkpoint(fieldset, ScipyParticle, tmpdir.join("checkpoint"))
+    assert ParcelsRandom.random() == expected  # the generator is not reseeded without a seed in the checkpoint
+
+
+@pytest.mark.parametrize("mode", ["scipy", "jit"])
+@pytest.mark.parametrize("dt", [-1, 1])
+def test_pset_delayed_release(fieldset, mode, dt):
+    npart = 10
+    TestParticle = ptype[mode].add_variable("age", np.float32, initial=0)
+    release = 10 - dt * (10 - 2 * np.arange(npart))
+    pset = ParticleSet(fieldset, pclass=TestParticle, lon=np.linspace(0, 1, npart), lat=np.zeros(npart), time=release)
+
+    def Age(particle, fieldset, time):
+        particle.age += math.fabs(particle.dt)
+
+    nreleased = []
+    pset.execute(Age, runtime=20, dt=dt, postIterationCallbacks=[lambda: nreleased.append(len(pset))], callbackdt=1)
+
+    assert nreleased[0] < npart and nreleased[-1] == npart and np.all(np.diff(nreleased) >= 0)
+    assert len(pset) == npart
+    assert np.array_equal(pset.id, np.sort(pset.id))
+    assert np.allclose(pset.lon, np.linspace(0, 1, npart))
+    assert np.allclose(pset.age, np.abs(release[0] + 20 * dt - release))
+
+
+@pytest.mark.parametrize("dt", [-1, 1])
+def test_pset_execute_events(fieldset, dt):
+    pset = ParticleSet(fieldset, pclass=ScipyParticle, lon=[0.5], lat=[0.5], time=[3 - 3 * dt])
+    calls = []
+    computeTimeChunk = fieldset.computeTimeChunk
+
+    def logged_computeTimeChunk(time, dt):
+        calls.append("load")
+        return computeTimeChunk(time, dt)
+
+    fieldset.computeTimeChunk = logged_computeTimeChunk
+    pset.execute(
+        DoNothing,
+        runtime=6,
+        dt=dt,
+        postIterationCallbacks=[lambda: calls.append("callback")],
+        callbackdt=2,
+        events=[(3, lambda: calls.append("event3")), (timedelta(seconds=2), lambda: calls.append("event2"))],
+    )
+    # the Fields are loaded once per iteration, which stops at t=2, 3, 4 and 6 (from the start time)
+    expected = ["load", "callback", "event2", "load", "event3", "load", "callback", "event2"]
+    assert calls == expected + ["load", "callback", "event3", "event2"]
+
+
 @pytest.mark.parametrize("mode", ["scipy"])
 @pytest.mark.parametrize("lonlatdepth_dtype", [np.float64, np.float32])
 def test_pset_create_field(fieldset, mode, lonlatdepth_dtype):
@@ -443,3 +544,46 @@ def test_from_field_exact_val(staggered_grid):
     assert (np.array([p.lon for p in pset]) <= 1).all()
     test = np.logical_or(np.array([p.lon for p in pset]) <= 0, np.array([p.lat for p in pset]) >= 51)
     assert test.all()
+
+
+@pytest.mark.parametrize("mode", ["scipy", "jit"])
+def test_pset_ensemble(mode, tmpdir):
+    lon = np.linspace(0, 1e4, 20, dtype=np.float32)
+    lat = np.linspace(0, 1e4, 20, dtype=np.float32)
+    time = np.arange(6) * 3600.0
+    U = np.ones((len(time), len(lat), len(lon)), dtype=np.float32) * (0.1 + 0.05 * np.arange(len(time)))[:, None, None]
+    data = {"U": U, "V": np.zeros_like(U)}
+    FieldSet.from_data(data, {"lon": lon, "lat": lat, "time": time}, mesh="flat").write(tmpdir.join("ensemble"))
+
+    def run(ensemble):
+        fieldset = FieldSet.from_parcels(tmpdir.join("ensemble"), chunksize=False)
+        reads = []
+        read_snapshot = fieldset.U._read_snapshot
+
+        def counting_read_snapshot(tindex):
+            reads.append(tindex)
+            return read_snapshot(tindex)
+
+        fieldset.U._read_snapshot = counting_read_snapshot
+        psets = [ParticleSet(fieldset, pclass=ptype[mode], lon=[1e3, 2e3], lat=[2e3 * m, 5e3]) for m in range(3)]
+        pfiles = [
+            pset.ParticleFile(tmpdir.join(f"ensemble{ensemble}_{m}.zarr"), outputdt=1800)
+            for m, pset in enumerate(psets)
+        ]
+        if ensemble:
+            ParticleSetEnsemble(psets).execute(AdvectionRK4, runtime=4 * 3600, dt=300, output_files=pfiles)
+        else:
+            for pset, pfile in zip(psets, pfiles, strict=True):
+                pset.execute(AdvectionRK4, runtime=4 * 3600, dt=300, output_file=pfile)
+        return psets, len(reads)
+
+    psets_sequential, reads_sequential = run(ensemble=False)
+    psets_ensemble, reads_ensemble = run(ensemble=True)
+    assert reads_ensemble < reads_sequential
+    for m in range(3):
+        assert np.allclose(psets_sequential[m].lon, psets_ensemble[m].lon)
+        assert np.allclose(psets_sequential[m].lat, psets_ensemble[m].lat)
+        sequential = xr.open_zarr(tmpdir.join(f"ensembleFalse_{m}.zarr"))
+        ensemble = xr.open_zarr(tmpdir.join(f"ensembleTrue_{m}.zarr"))
+        assert np.allclose(sequential.lon.values, ensemble.lon.values)
+        assert ensemble.attrs["ensemble_member"] == m